@@ -0,0 +1,152 @@
+r"""
+Adapters (:mod:`benchlingapi.adapters`)
+=======================================
+
+.. currentmodule:: benchlingapi.adapters
+
+Transport adapters used by :class:`benchlingapi.session.Http` to manage
+the underlying connection pools.
+
+.. versionadded:: 2.2.0
+    Added :class:`PooledHTTPAdapter` and :class:`PoolStats`
+"""
+import socket
+import threading
+from functools import partial
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib3.connectionpool import HTTPSConnectionPool
+
+
+class PoolStats:
+    """Thread-safe counter of connection pool hits and misses.
+
+    A *hit* is a request that re-used an open, pooled connection. A *miss*
+    is a request that had to open a new connection (and pay for a new
+    TCP/TLS handshake).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def reset(self):
+        """Reset the counters to zero."""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    @property
+    def total(self) -> int:
+        """Total number of connections requested from the pool."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of requests that re-used a pooled connection."""
+        total = self.total
+        if not total:
+            return 0.0
+        return self.hits / total
+
+    def as_dict(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "total": self.total}
+
+    def __repr__(self):
+        return "<{} hits={} misses={}>".format(
+            self.__class__.__name__, self.hits, self.misses
+        )
+
+
+class _CountingPoolMixin:
+    """Counts pool hits and misses for a urllib3 connection pool."""
+
+    def __init__(self, *args, pool_stats=None, **kwargs):
+        self.pool_stats = pool_stats
+        super().__init__(*args, **kwargs)
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        if self.pool_stats is not None:
+            # new or dropped connections have no open socket
+            if getattr(conn, "sock", None) is None:
+                self.pool_stats.miss()
+            else:
+                self.pool_stats.hit()
+        return conn
+
+
+class CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """A :class:`requests.adapters.HTTPAdapter` with keep-alive tuning and pool
+    statistics.
+
+    :param pool_connections: number of per-host connection pools to cache
+    :param pool_maxsize: maximum number of connections kept open per host
+    :param pool_block: if True, never open more than `pool_maxsize`
+        connections to a single host; callers wait for a free connection
+        instead.
+    :param keep_alive: if True, enable TCP keep-alive probes on pooled sockets
+        so idle connections survive between requests.
+    :param keep_alive_idle: seconds a connection may idle before keep-alive
+        probes are sent (only on platforms that support it)
+    :param pool_stats: optional :class:`PoolStats` to record hits and misses
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        keep_alive_idle: int = 60,
+        pool_stats: PoolStats = None,
+        **kwargs
+    ):
+        self.keep_alive = keep_alive
+        self.keep_alive_idle = keep_alive_idle
+        if pool_stats is None:
+            pool_stats = PoolStats()
+        self.pool_stats = pool_stats
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            **kwargs
+        )
+
+    def _socket_options(self):
+        options = list(HTTPConnection.default_socket_options)
+        if self.keep_alive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            if hasattr(socket, "TCP_KEEPIDLE"):
+                options.append(
+                    (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, self.keep_alive_idle)
+                )
+        return options
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", self._socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": partial(CountingHTTPConnectionPool, pool_stats=self.pool_stats),
+            "https": partial(CountingHTTPSConnectionPool, pool_stats=self.pool_stats),
+        }
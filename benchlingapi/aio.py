@@ -0,0 +1,938 @@
+r"""
+Asyncio (:mod:`benchlingapi.aio`)
+=================================
+
+.. currentmodule:: benchlingapi.aio
+
+An asyncio version of the :class:`Session <benchlingapi.session.Session>`.
+The :class:`AsyncSession` exposes the same model interfaces, but every
+method that talks to the server is awaitable and pagination uses async
+generators. Requires the optional `aiohttp` dependency
+(`pip install benchlingapi[async]`).
+
+.. code-block:: python
+
+    import asyncio
+    from benchlingapi.aio import AsyncSession
+
+    async def main():
+        async with AsyncSession(api_key) as session:
+            dna = await session.DNASequence.find("seq_Kzxlbux9")
+            async for dna in session.DNASequence.all(folder_id="lib_2a3dgF"):
+                print(dna.name)
+
+            # run many requests concurrently on a single event loop
+            ids = ["seq_1", "seq_2", "seq_3"]
+            sequences = await asyncio.gather(
+                *[session.DNASequence.find(i) for i in ids]
+            )
+
+    asyncio.run(main())
+
+The awaitable methods are `get`, `find`, `list`, `last`, `first`, `one`,
+`search`, `find_by_name`, `save`, `update`, `create_model`, `update_model`,
+`bulk_create`, `archive`, `unarchive`, `archive_many`, `unarchive_many`,
+`delete`, `reload` and :meth:`Task.wait <AsyncTaskMixin.wait>`. `all` and
+`list_pages` are async generators. Methods that have no awaitable version
+(see :data:`SYNC_ONLY`), such as `get_many`, `export` or `merge_many`, raise
+a :class:`BenchlingAPIException
+<benchlingapi.exceptions.BenchlingAPIException>` on an async interface; use
+a synchronous :class:`Session <benchlingapi.session.Session>` for them.
+
+.. versionadded:: 2.2.0
+    Added :class:`AsyncSession` and :class:`AsyncHttp`
+"""
+import asyncio
+import json
+import time
+from typing import Any
+from typing import AsyncGenerator
+from typing import Callable
+from typing import List
+from typing import Type
+from typing import Union
+
+from benchlingapi.cache import TTLCache
+from benchlingapi.concurrency import poll_delays
+from benchlingapi.exceptions import BenchlingAPIException
+from benchlingapi.exceptions import ModelNotFoundError
+from benchlingapi.models.base import ModelBase
+from benchlingapi.models.base import ModelBaseABC
+from benchlingapi.models.base import ModelRegistry
+from benchlingapi.models.mixins import _fail_chunk
+from benchlingapi.models.mixins import _load_bulk_results
+from benchlingapi.models.mixins import _task_response
+from benchlingapi.models.mixins import ArchiveMixin
+from benchlingapi.models.mixins import BulkResult
+from benchlingapi.models.mixins import CreateMixin
+from benchlingapi.models.mixins import DeleteMixin
+from benchlingapi.models.mixins import EntityMixin
+from benchlingapi.models.mixins import GetMixin
+from benchlingapi.models.mixins import ListMixin
+from benchlingapi.models.mixins import UpdateMixin
+from benchlingapi.models.models import __all__ as allmodels
+from benchlingapi.models.models import Task
+from benchlingapi.ratelimit import TokenBucket
+from benchlingapi.retry import RetryPolicy
+from benchlingapi.session import Http
+from benchlingapi.session import RequestDecorator
+from benchlingapi.utils import un_underscore_keys
+from benchlingapi.utils import url_build
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+
+class AsyncRequestInfo:
+    """The request that produced an :class:`AsyncResponse`."""
+
+    def __init__(self, method: str, url: str, path_url: str):
+        self.method = method.upper()
+        self.url = url
+        self.path_url = path_url
+
+    def __repr__(self):
+        return "<AsyncRequest [{}]>".format(self.method)
+
+
+class AsyncResponse:
+    """A fully read response.
+
+    Mirrors the parts of :class:`requests.Response` used by
+    :mod:`benchlingapi` so that retry policies and exception dispatching
+    work for both sessions.
+    """
+
+    def __init__(self, status_code: int, content: bytes, headers, request):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        self.request = request
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+def _encode_params(params: dict) -> list:
+    """Encode query parameters the same way :mod:`requests` does."""
+    encoded = []
+    if not params:
+        return encoded
+    for k, v in params.items():
+        if v is None:
+            continue
+        if not isinstance(v, (list, tuple)):
+            v = [v]
+        for x in v:
+            if isinstance(x, bool):
+                x = str(x)
+            encoded.append((k, x))
+    return encoded
+
+
+class AsyncHttp:
+    """Asynchronously creates and responds to the Benchling server.
+
+    :param api_key: Benchling provided api_key
+    :param home: home url
+    :param limit: maximum number of simultaneous connections
+    :param limit_per_host: maximum number of simultaneous connections per host
+        (0 for no limit)
+    :param retry_policy: policy for retrying throttled and unavailable
+        requests. Defaults to :class:`RetryPolicy
+        <benchlingapi.retry.RetryPolicy>`.
+    :param rate_limiter: optional :class:`TokenBucket
+        <benchlingapi.ratelimit.TokenBucket>`. Waiting for a token does not
+        block the event loop.
+    """
+
+    TIMEOUT = Http.TIMEOUT  #: default request timeout for the session
+    DEFAULT_HOME = Http.DEFAULT_HOME  #: default home url to use if not provided.
+    NEXT = Http.NEXT  #: nextToken key for pagination
+    LIMIT = 100  #: default maximum number of simultaneous connections
+
+    def __init__(
+        self,
+        api_key: str,
+        home: str = None,
+        limit: int = None,
+        limit_per_host: int = 0,
+        retry_policy: RetryPolicy = None,
+        rate_limiter: TokenBucket = None,
+    ):
+        if aiohttp is None:
+            raise BenchlingAPIException(
+                "aiohttp is required for asyncio support. Install it with "
+                "'pip install benchlingapi[async]'."
+            )
+        if home is None:
+            home = self.DEFAULT_HOME
+        if limit is None:
+            limit = self.LIMIT
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        self._home = home
+        self._auth = aiohttp.BasicAuth(api_key, "")
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._client = None
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+
+    def _get_client(self):
+        if self._client is None or self._client.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self._limit, limit_per_host=self._limit_per_host
+            )
+            self._client = aiohttp.ClientSession(auth=self._auth, connector=connector)
+        return self._client
+
+    async def close(self):
+        """Close all open connections."""
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+
+    async def _send(self, method: str, url: str, timeout: int, **kwargs):
+        async with self._get_client().request(
+            method, url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs
+        ) as r:
+            content = await r.read()
+            request = AsyncRequestInfo(method, str(r.url), r.url.path_qs)
+            return AsyncResponse(r.status, content, r.headers, request)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        status_codes: List[int],
+        timeout: int = None,
+        action: str = None,
+        **kwargs
+    ) -> Any:
+        if "json" in kwargs:
+            kwargs["json"] = un_underscore_keys(kwargs["json"])
+        if "params" in kwargs:
+            kwargs["params"] = _encode_params(un_underscore_keys(kwargs["params"]))
+
+        if timeout is None:
+            timeout = self.TIMEOUT
+        if action is not None:
+            path += ":" + action
+        url = url_build(self._home, path)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                delay = self.rate_limiter.reserve()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            r = await self._send(method, url, timeout, **kwargs)
+            if r.status_code in status_codes:
+                return r.json()
+            policy = self.retry_policy
+            if policy is None or not policy.should_retry(r, attempt):
+                break
+            policy.stats.record_retry(r.status_code)
+            await asyncio.sleep(policy.get_delay(r, attempt))
+            attempt += 1
+        RequestDecorator.raise_for_response(r)
+
+    async def post(self, path: str, **kwargs) -> Any:
+        return await self.request("post", path, [200, 201, 202], **kwargs)
+
+    async def get(self, path: str, **kwargs) -> Any:
+        return await self.request("get", path, [200], **kwargs)
+
+    async def delete(self, path: str, **kwargs) -> Any:
+        return await self.request("delete", path, [200], **kwargs)
+
+    async def patch(self, path: str, **kwargs) -> Any:
+        return await self.request("patch", path, [200, 201], **kwargs)
+
+    async def get_pages(
+        self, path: str, timeout: int = None, action: str = None, **kwargs
+    ) -> AsyncGenerator[Any, None]:
+        params = dict(kwargs.pop("params", None) or {})
+        while True:
+            response = await self.get(
+                path, timeout=timeout, action=action, params=params, **kwargs
+            )
+            yield response
+            next_token = response.get(self.NEXT, None)
+            if not next_token:
+                return
+            params[self.NEXT] = next_token
+
+
+####################################
+# Async model interfaces
+####################################
+
+
+class AsyncModelMixin(ModelBaseABC):
+    """Awaitable versions of the low level request methods."""
+
+    @classmethod
+    async def _get(cls, path_params=None, params=None, action=None):
+        return await cls.session.http.get(
+            cls._path(additional_paths=path_params), params=params, action=action
+        )
+
+    @classmethod
+    async def _get_pages(cls, path_params=None, params=None, action=None):
+        async for page in cls.session.http.get_pages(
+            cls._path(additional_paths=path_params), params=params, action=action
+        ):
+            yield page
+
+    @classmethod
+    async def _post(cls, data, path_params=None, params=None, action=None):
+        return await cls.session.http.post(
+            cls._path(additional_paths=path_params),
+            json=data,
+            params=params,
+            action=action,
+        )
+
+    @classmethod
+    async def _patch(cls, data, path_params=None, params=None, action=None):
+        return await cls.session.http.patch(
+            cls._path(additional_paths=path_params),
+            json=data,
+            params=params,
+            action=action,
+        )
+
+    @classmethod
+    async def _delete(cls, path_params=None, params=None, action=None):
+        return await cls.session.http.delete(
+            cls._path(additional_paths=path_params), params=params, action=action
+        )
+
+    def __getattr__(self, item):
+        # heavy fields of summary models cannot be fetched on attribute
+        # access without blocking the event loop
+        if "_lazy" in self.__dict__ and item in self.HEAVY_FIELDS:
+            raise BenchlingAPIException(
+                "'{}' of {} was left out in summary mode. Use "
+                "`await model.reload()` to load it.".format(item, self.id)
+            )
+        return super().__getattr__(item)
+
+    async def reload(self):
+        self._forget([self.id])
+        model = await self.find(self.id)
+        vars(self).pop("_lazy", None)
+        self._update_from_other(model)
+        return self
+
+
+class AsyncGetMixin(AsyncModelMixin):
+    """Awaitable `get` and `find` by id."""
+
+    @classmethod
+    async def get(cls, id: str, **params) -> ModelBase:
+        """Get model by id (see 'find')"""
+        if not params:
+            model = cls._recall(id)
+            if model is not None:
+                return model
+        try:
+            response = await cls._get(id, params=params)
+        except BenchlingAPIException as e:
+            if e.response.status_code == 404:
+                return None
+            raise e
+        return cls.load(response)
+
+    @classmethod
+    async def find(cls, id, **params) -> ModelBase:
+        """Find model by id (see 'get')"""
+        return await cls.get(id, **params)
+
+
+class AsyncListMixin(AsyncModelMixin):
+    """Awaitable list methods. `all` and `list_pages` are async generators."""
+
+    MAX_PAGE_SIZE = ListMixin.MAX_PAGE_SIZE
+
+    @classmethod
+    async def list(
+        cls,
+        limit=None,
+        compact: bool = False,
+        keep_raw: bool = None,
+        summary: bool = False,
+        **params
+    ) -> List[ModelBase]:
+        """List models. See :meth:`ListMixin.list
+        <benchlingapi.models.mixins.ListMixin.list>`.
+
+        Heavy fields of models listed with `summary=True` are not loaded on
+        access; use `await model.reload()` to load them.
+        """
+        if limit:
+            return [
+                m
+                async for m in cls.all(
+                    limit=limit,
+                    compact=compact,
+                    keep_raw=keep_raw,
+                    summary=summary,
+                    **params
+                )
+            ]
+        response = await cls._get(params=cls._summary_params(params, summary))
+        return cls.load_many(
+            response[cls._camelize()],
+            compact=compact,
+            keep_raw=keep_raw,
+            summary=summary,
+        )
+
+    @classmethod
+    async def list_pages(
+        cls,
+        page_limit: int = None,
+        compact: bool = False,
+        keep_raw: bool = None,
+        summary: bool = False,
+        **params
+    ) -> AsyncGenerator[List[ModelBase], None]:
+        """Return an async generator of pages of models."""
+        page_num = 1
+        async for response in cls._get_pages(
+            params=cls._summary_params(params, summary)
+        ):
+            yield cls.load_many(
+                response[cls._camelize()],
+                compact=compact,
+                keep_raw=keep_raw,
+                summary=summary,
+            )
+            page_num += 1
+            if page_limit is not None and page_num > page_limit:
+                return
+
+    @classmethod
+    async def all(
+        cls,
+        page_limit: int = None,
+        limit: int = None,
+        compact: bool = False,
+        keep_raw: bool = None,
+        summary: bool = False,
+        **params
+    ) -> AsyncGenerator[ModelBase, None]:
+        """Return an async generator of all models."""
+        num = 0
+        pages = cls.list_pages(
+            page_limit=page_limit,
+            compact=compact,
+            keep_raw=keep_raw,
+            summary=summary,
+            **params
+        )
+        async for page in pages:
+            for m in page:
+                yield m
+                num += 1
+                if limit is not None and num >= limit:
+                    return
+
+    @classmethod
+    async def last(cls, num: int = 1, **params) -> List[ModelBase]:
+        """Returns the most recent models."""
+        max_page_size = min(
+            cls.MAX_PAGE_SIZE, params.get("pageSize", cls.MAX_PAGE_SIZE)
+        )
+        if num <= max_page_size:
+            max_page_size = num
+        return [m async for m in cls.all(pageSize=max_page_size, limit=num)]
+
+    @classmethod
+    async def first(cls, num: int = 1, **params) -> List[ModelBase]:
+        """Returns the most recent models."""
+        return await cls.last(num, **params)
+
+    @classmethod
+    async def one(cls, **params) -> ModelBase:
+        """Returns one model."""
+        models = await cls.last(1, **params)
+        if models:
+            return models[0]
+
+    @classmethod
+    async def search(
+        cls, fxn: Callable, limit: int = 1, page_limit: int = 5, **params
+    ) -> List[ModelBase]:
+        """Search all models such that 'fxn' is True."""
+        found = []
+        async for model in cls.all(page_limit=page_limit, **params):
+            if fxn(model):
+                found.append(model)
+            if len(found) >= limit:
+                return found
+        return found
+
+    @classmethod
+    async def find_by_name(cls, name: str, page_limit=None, **params) -> ModelBase:
+        """Find a model by name, filtering on the server or using the cached
+        name index like :meth:`ListMixin.find_by_name
+        <benchlingapi.models.mixins.ListMixin.find_by_name>`."""
+        if "name" in cls.LIST_FILTERS:
+            params["name"] = name
+        elif page_limit is None and not params and cls.session.metadata_cache.enabled:
+            entry = (await cls._name_index()).get(name)
+            if entry is None:
+                return None
+            model = await cls._get_from_page(*entry)
+            if model is not None and model.name == name:
+                return model
+            # renamed, removed or moved to another page since the index was built
+            cls._invalidate_name_index()
+            entry = (await cls._name_index()).get(name)
+            return None if entry is None else await cls._get_from_page(*entry)
+        elif page_limit is None:
+            page_limit = 5
+        models = await cls.search(
+            lambda x: x.name == name, limit=1, page_limit=page_limit, **params
+        )
+        if models:
+            return models[0]
+
+    @classmethod
+    async def get(cls, id: str, **params) -> ModelBase:
+        """Get a single model by its id, filtering on the server if the
+        endpoint supports it and scanning all pages otherwise."""
+        if not params:
+            model = cls._recall(id)
+            if model is not None:
+                return model
+        if "ids" in cls.LIST_FILTERS:
+            params["ids"] = id
+        params.setdefault("page_limit", None)
+        models = await cls.search(lambda x: x.id == id, limit=1, **params)
+        if models:
+            return models[0]
+
+    @classmethod
+    async def _name_index(cls) -> dict:
+        """Return the cached index of model names to `(id, next_token)`."""
+        cache = cls.session.metadata_cache
+        index = cache.get(cls._name_index_key())
+        if index is None:
+            index = {}
+            next_token = None
+            async for page in cls._get_pages(params=cls._index_page_params()):
+                next_token = cls._add_to_name_index(index, page, next_token)
+            cache.set(cls._name_index_key(), index)
+        return index
+
+    @classmethod
+    async def _get_from_page(cls, id: str, next_token: str) -> ModelBase:
+        model = cls._recall(id)
+        if model is not None:
+            return model
+        page = await cls._get(params=cls._index_page_params(next_token))
+        return cls._load_from_page(page, id)
+
+    @classmethod
+    async def find(cls, id, **params) -> ModelBase:
+        """Get a single model by its id."""
+        return await cls.get(id, **params)
+
+
+class AsyncCreateMixin(AsyncModelMixin):
+    """Awaitable methods that create new models."""
+
+    @classmethod
+    async def create_model(cls, data: dict, **params) -> ModelBase:
+        """Create model from data."""
+        response = await cls._post(data, **params)
+        return cls.load(response)
+
+    @classmethod
+    async def bulk_create(
+        cls,
+        model_data: Union[dict, List[Union[dict, ModelBase]]],
+        chunk_size: int = None,
+        every_seconds: float = None,
+        timeout: float = 600,
+        **params
+    ) -> BulkResult:
+        """Create many models using the bulk-create endpoint.
+
+        Like :meth:`CreateMixin.bulk_create
+        <benchlingapi.models.mixins.CreateMixin.bulk_create>`, models are
+        split into chunks of `chunk_size` that are submitted concurrently,
+        and the server's tasks are awaited.
+
+        :param model_data: unsaved model instances or create data dicts (or
+            a dict with a list of them under the plural model key)
+        :param chunk_size: number of models per request (default
+            :attr:`BULK_CREATE_SIZE`)
+        :param every_seconds: fixed time interval to check the tasks (default:
+            start fast and back off)
+        :param timeout: maximum time in seconds to wait for each task
+        :return: list of created models in the order of `model_data`, with
+            None for models that failed. Errors are listed by index in
+            `result.errors`.
+        """
+        key = cls._camelize()
+        if isinstance(model_data, dict):
+            model_data = model_data[key]
+        inputs = list(model_data)
+        data = [x.save_json() if isinstance(x, ModelBase) else x for x in inputs]
+        chunk_size = chunk_size or cls.BULK_CREATE_SIZE
+        starts = list(range(0, len(data), chunk_size))
+        responses = {}
+        errors = {}
+
+        async def submit(start):
+            chunk = data[start : start + chunk_size]
+            response = await cls._post({key: chunk}, action="bulk-create", **params)
+            if not (isinstance(response, dict) and "taskId" in response):
+                responses[start] = response
+                return
+            task = await cls.session.Task.find(response["taskId"])
+            await task.wait(every_seconds=every_seconds, timeout=timeout)
+            if task.status == "SUCCEEDED":
+                responses[start] = _task_response(task)
+            else:
+                error = task.message or "Task {}".format(task.status)
+                _fail_chunk(errors, start, len(chunk), error, task.errors)
+
+        outcomes = await asyncio.gather(
+            *[submit(start) for start in starts], return_exceptions=True
+        )
+        for start, outcome in zip(starts, outcomes):
+            if isinstance(outcome, Exception):
+                n = min(chunk_size, len(data) - start)
+                _fail_chunk(errors, start, n, outcome)
+        return _load_bulk_results(cls, inputs, responses, errors)
+
+    async def save(self) -> ModelBase:
+        """Save this model to Benchling."""
+        r = await self.create_model(self.save_json())
+        self._update_from_other(r)
+        return self
+
+
+class AsyncUpdateMixin(AsyncModelMixin):
+    """Awaitable methods that update models."""
+
+    @classmethod
+    async def update_model(cls, model_id: str, data: dict, **params) -> ModelBase:
+        """Update the model with data."""
+        response = await cls._patch(data, path_params=[model_id], **params)
+        return cls.load(response)
+
+    async def update(self) -> ModelBase:
+        """Update the model instance."""
+        if not self.id:
+            raise BenchlingAPIException("Cannot update. Model has not yet been saved.")
+        r = await self.update_model(self.id, self.update_json())
+        self._update_from_other(r)
+        return self
+
+
+class AsyncArchiveMixin(AsyncModelMixin):
+    """Awaitable archiving and unarchiving methods."""
+
+    @classmethod
+    async def archive_many(
+        cls, model_ids: List[str], reason=ArchiveMixin.ARCHIVE_REASONS.DEFAULT
+    ) -> Any:
+        """Archive many models by their ids."""
+        if reason not in cls.ARCHIVE_REASONS.REASONS:
+            raise Exception(
+                "Reason must be one of {}".format(cls.ARCHIVE_REASONS.REASONS)
+            )
+        key = cls._camelize("id")
+        cls._forget(model_ids)
+        return await cls._post(
+            action="archive", data={key: model_ids, "reason": reason}
+        )
+
+    @classmethod
+    async def unarchive_many(cls, model_ids: List[str]) -> Any:
+        """Unarchive many models by their ids."""
+        key = cls._camelize("id")
+        cls._forget(model_ids)
+        return await cls._post(action="unarchive", data={key: model_ids})
+
+    async def archive(self, reason=ArchiveMixin.ARCHIVE_REASONS.DEFAULT) -> ModelBase:
+        """Archive model instance."""
+        await self.archive_many([self.id], reason)
+        return await self.reload()
+
+    async def unarchive(self) -> ModelBase:
+        """Unarchive the model instance."""
+        await self.unarchive_many([self.id])
+        return await self.reload()
+
+
+class AsyncEntityMixin(AsyncModelMixin):
+    """Awaitable entity methods."""
+
+    @classmethod
+    async def find_by_name(cls, name: str, **params) -> ModelBase:
+        """Find entity by name."""
+        models = await cls.list(name=name, **params)
+        if models:
+            return models[0]
+
+
+class AsyncDeleteMixin(AsyncModelMixin):
+    """Awaitable delete."""
+
+    async def delete(self):
+        self._forget([self.id])
+        return await self._delete(path_params=[self.id])
+
+
+class AsyncTaskMixin(AsyncModelMixin):
+    """Awaitable :meth:`Task.wait <benchlingapi.models.Task.wait>`."""
+
+    @classmethod
+    async def find(cls, id, **params):
+        # task responses do not include the id
+        inst = await super().find(id, **params)
+        inst.id = id
+        return inst
+
+    async def reload(self):
+        ec = self.expected_class
+        await super().reload()
+        self.expected_class = ec
+        if self.response and ec:
+            self.response_class = ec.load(self.response)
+        return self
+
+    async def wait(self, every_seconds: float = None, timeout: float = 30, **kwargs):
+        """Wait for the Task to finish without blocking the event loop.
+
+        Polls adaptively unless `every_seconds` is given (see
+        :func:`poll_delays <benchlingapi.concurrency.poll_delays>`). Use
+        `asyncio.gather` to wait for many tasks.
+        """
+        t1 = time.time()
+        delays = poll_delays(every_seconds, **kwargs)
+        while self.status == "RUNNING":
+            elapsed = time.time() - t1
+            if elapsed > timeout:
+                raise TimeoutError(
+                    "Task {} took too long ({}s)".format(self.id, timeout)
+                )
+            await asyncio.sleep(max(0, min(next(delays), timeout - elapsed)))
+            await self.reload()
+        return self
+
+
+#: model methods and properties that only exist on synchronous interfaces
+SYNC_ONLY = (
+    "get_many",
+    "export",
+    "bulk_update",
+    "merge",
+    "merge_many",
+    "batches",
+    "move",
+    "archive_models",
+    "unarchive_models",
+    "register",
+    "unregister",
+    "register_many",
+    "unregister_many",
+    "register_with_custom_id",
+    "register_and_save_name_as_alias",
+    "valid_schemas",
+    "print_valid_schemas",
+    "set_schema",
+    "all_in_registry",
+    "list_in_registry",
+    "find_in_registry",
+    "find_by_name_in_registry",
+    "get_in_registry",
+    "registry_dict",
+    "registries",
+    "find_registry",
+    "find_from_schema_id",
+    "get_schema",
+    "get_entities",
+    "register_entities",
+    "unregister_entities",
+    "entity_schemas",
+    "all_entities",
+    "submit_alignment",
+    "submit_alignments",
+    "create_consensus",
+    "wait_all",
+)
+
+
+class _SyncOnly:
+    """Replaces a synchronous model method or property that has no awaitable
+    version on an async interface."""
+
+    def __init__(self, name: str, is_property: bool = False):
+        self.name = name
+        self.is_property = is_property
+
+    def _error(self, owner) -> BenchlingAPIException:
+        return BenchlingAPIException(
+            "{}.{} is not available on an AsyncSession. Use a "
+            "synchronous Session instead.".format(owner.__name__, self.name)
+        )
+
+    def __get__(self, instance, owner):
+        if self.is_property:
+            if instance is None:
+                return self
+            raise self._error(owner)
+
+        def unsupported(*args, **kwargs):
+            raise self._error(owner)
+
+        return unsupported
+
+
+def _sync_only_namespace(model_cls) -> dict:
+    """Return :class:`_SyncOnly` replacements for the :data:`SYNC_ONLY`
+    attributes of a model class."""
+    namespace = {}
+    for klass in reversed(model_cls.__mro__):
+        for name in SYNC_ONLY:
+            if name in vars(klass):
+                is_property = isinstance(vars(klass)[name], property)
+                namespace[name] = _SyncOnly(name, is_property)
+    return namespace
+
+
+#: async mixins to add to a model interface, by the synchronous base
+ASYNC_MIXINS = [
+    (Task, AsyncTaskMixin),
+    (EntityMixin, AsyncEntityMixin),
+    (GetMixin, AsyncGetMixin),
+    (ListMixin, AsyncListMixin),
+    (CreateMixin, AsyncCreateMixin),
+    (UpdateMixin, AsyncUpdateMixin),
+    (ArchiveMixin, AsyncArchiveMixin),
+    (DeleteMixin, AsyncDeleteMixin),
+]
+
+
+class AsyncSession:
+    """The asyncio session object.
+
+    Use as an async context manager, or call :meth:`close` when done.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        org: str = None,
+        home: str = None,
+        limit: int = None,
+        limit_per_host: int = 0,
+        retry_policy: RetryPolicy = None,
+        rate_limiter: TokenBucket = None,
+        fast_load: bool = False,
+        metadata_ttl: float = 300,
+        identity_map: TTLCache = None,
+    ):
+        """Initialize a new asyncio Benchling API Session.
+
+        :param api_key: Benchling provided api_key
+        :param org: optional org name. If provided, sets home URL
+            to `https://{home}.benchling.com/api/v2`
+        :param home: optional home name. See `org` argument.
+        :param limit: maximum number of requests in flight (default 100)
+        :param limit_per_host: maximum number of requests in flight per host
+        :param retry_policy: policy for retrying throttled (429) and unavailable
+            (503, 504) requests.
+        :param rate_limiter: optional client-side rate limiter
+        :param fast_load: if True, load models with precompiled loaders
+            instead of marshmallow
+        :param metadata_ttl: seconds to cache metadata lookups (default 5
+            minutes). None caches forever, 0 disables caching.
+        :param identity_map: optional cache of loaded models by id, e.g.
+            `TTLCache(ttl=60, maxsize=10000)`
+        """
+        if org:
+            home = "https://{org}.benchling.com/api/v2".format(org=org)
+        self.__http = AsyncHttp(
+            api_key,
+            home=home,
+            limit=limit,
+            limit_per_host=limit_per_host,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+        )
+        self.fast_load = fast_load
+        self.metadata_cache = TTLCache(ttl=metadata_ttl)
+        self.identity_map = identity_map
+        self.__interfaces = {}
+        for model_name in allmodels:
+            model_cls = ModelRegistry.get_model(model_name)
+            bases = tuple(
+                amixin for base, amixin in ASYNC_MIXINS if issubclass(model_cls, base)
+            )
+            namespace = _sync_only_namespace(model_cls)
+            namespace["session"] = self
+            mymodel = type(model_name, bases + (AsyncModelMixin, model_cls), namespace)
+            setattr(self, model_name, mymodel)
+            self.__interfaces[model_name] = mymodel
+
+    @property
+    def http(self) -> AsyncHttp:
+        """Return the http requester object."""
+        return self.__http
+
+    @property
+    def url(self) -> str:
+        """Return home benchling url."""
+        return self.__http._home
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Return the retry policy. See `retry_policy.stats` for retry counts."""
+        return self.__http.retry_policy
+
+    @property
+    def models(self) -> List[str]:
+        """List all models."""
+        return list(ModelRegistry.models.keys())
+
+    @property
+    def interfaces(self):
+        """List all model interfaces."""
+        return self.__interfaces
+
+    def interface(self, model_name) -> Type[ModelBase]:
+        """Return a model interface by name."""
+        if model_name not in self.interfaces:
+            raise ModelNotFoundError('No model by name of "{}"'.format(model_name))
+        return self.interfaces[model_name]
+
+    def invalidate_metadata(self):
+        """Clear cached metadata lookups."""
+        self.metadata_cache.invalidate()
+
+    async def close(self):
+        """Close the session and its connections."""
+        await self.__http.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,129 @@
+r"""
+Caching (:mod:`benchlingapi.cache`)
+===================================
+
+.. currentmodule:: benchlingapi.cache
+
+In-memory caches used by the :class:`Session <benchlingapi.session.Session>`.
+
+.. versionadded:: 2.2.0
+    Added :class:`TTLCache`
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Callable
+from typing import Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """A thread-safe cache whose entries expire after `ttl` seconds.
+
+    If `maxsize` is given, the least recently used entries are evicted once
+    the cache is full.
+
+    :param ttl: seconds before an entry expires. If None, entries never
+        expire. If 0, nothing is cached.
+    :param maxsize: maximum number of entries (default: unbounded)
+    """
+
+    def __init__(self, ttl: float = None, maxsize: int = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self._key_locks = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl is None or self.ttl > 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for `key`, or `default` if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is not _MISSING:
+                value, expires = entry
+                if expires is None or expires > self._now():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any):
+        """Store `value` under `key`."""
+        if not self.enabled:
+            return
+        expires = None if self.ttl is None else self._now() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the value for `key`, calling `factory()` to create and store
+        it if it is missing or expired.
+
+        Concurrent callers for the same key wait for a single call to
+        `factory`.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                entry = self._data.get(key, _MISSING)
+                if entry is not _MISSING and (
+                    entry[1] is None or entry[1] > self._now()
+                ):
+                    return entry[0]
+            value = factory()
+            self.set(key, value)
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return value
+
+    def invalidate(self, key: Hashable = _MISSING):
+        """Remove `key` from the cache, or clear the cache if no key is
+        given."""
+        with self._lock:
+            if key is _MISSING:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[Hashable], bool]):
+        """Remove all keys for which `predicate(key)` is True."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            return entry is not _MISSING and (
+                entry[1] is None or entry[1] > self._now()
+            )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self):
+        return "<{} ttl={} maxsize={} size={}>".format(
+            self.__class__.__name__, self.ttl, self.maxsize, len(self)
+        )
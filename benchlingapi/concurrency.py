@@ -0,0 +1,355 @@
+r"""
+Concurrency (:mod:`benchlingapi.concurrency`)
+=============================================
+
+.. currentmodule:: benchlingapi.concurrency
+
+Thread-based helpers for overlapping network requests with local work.
+
+.. versionadded:: 2.2.0
+    Added :class:`Prefetcher`, :class:`Interleaver`, :func:`merge`,
+    :func:`chunks`, :func:`run_concurrently`, :func:`poll_delays` and
+    :class:`TaskPool`
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Sequence
+
+_DONE = object()
+
+
+class Interleaver:
+    """Iterates over several iterables at once, each in its own background
+    thread.
+
+    Items are yielded in the order they arrive. Up to `depth` items are
+    buffered, so memory use stays fixed. If any iterable raises, the
+    exception is re-raised in the consumer and the other threads are
+    stopped.
+
+    :param iterables: the iterables to consume in the background
+    :param depth: maximum number of items to buffer
+    """
+
+    POLL_INTERVAL = 0.1  #: seconds between checks for a closed iterator
+
+    def __init__(self, iterables: Iterable[Iterable], depth: int = 1):
+        if depth < 1:
+            raise ValueError("Prefetch depth must be at least 1.")
+        self.depth = depth
+        self._queue = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._finished = False
+        self._threads = [
+            threading.Thread(target=self._run, args=(iterable,), daemon=True)
+            for iterable in iterables
+        ]
+        self._running = len(self._threads)
+        for thread in self._threads:
+            thread.start()
+
+    def _put(self, item) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=self.POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _run(self, iterable):
+        try:
+            for item in iterable:
+                if not self._put((item, None)):
+                    return
+        except BaseException as e:
+            self._put((_DONE, e))
+        else:
+            self._put((_DONE, None))
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while not self._finished:
+            if not self._running:
+                self._finished = True
+                break
+            item, exc = self._queue.get()
+            if item is not _DONE:
+                return item
+            self._running -= 1
+            if exc is not None:
+                self.close()
+                raise exc
+        raise StopIteration
+
+    def close(self):
+        """Stop fetching ahead and release the background threads."""
+        self._finished = True
+        self._stop.set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        self._stop.set()
+
+
+class Prefetcher(Interleaver):
+    """Iterates over an iterable in a background thread.
+
+    Up to `depth` items are fetched ahead of the consumer and held in a
+    bounded buffer, so memory use stays fixed no matter how long the
+    iterable is. Exceptions raised by the iterable are re-raised in the
+    consumer.
+
+    .. code-block:: python
+
+        pages = Prefetcher(session.http.get_pages("dna-sequences"), depth=2)
+        for page in pages:
+            ...  # page N+1 is being fetched while page N is processed
+
+    :param iterable: the iterable to consume in the background
+    :param depth: maximum number of items to fetch ahead
+    """
+
+    def __init__(self, iterable: Iterable, depth: int = 1):
+        super().__init__([iterable], depth=depth)
+
+
+def merge(
+    iterables: Iterable[Iterable], ordered: bool = True, depth: int = 1
+) -> Iterator:
+    """Consume many iterables concurrently and merge them into one iterator.
+
+    :param iterables: iterables to consume, each in its own thread
+    :param ordered: if True, yield all items of the first iterable, then all
+        items of the second, etc., while the others are fetched in the
+        background. If False, yield items in the order they arrive.
+    :param depth: number of items to buffer (per iterable, if `ordered`)
+    :return: iterator over the items of all iterables
+    """
+    if not ordered:
+        with Interleaver(iterables, depth=depth) as items:
+            yield from items
+        return
+    prefetchers = [Prefetcher(iterable, depth=depth) for iterable in iterables]
+    try:
+        for prefetcher in prefetchers:
+            yield from prefetcher
+    finally:
+        for prefetcher in prefetchers:
+            prefetcher.close()
+
+
+def chunks(items: Sequence, size: int) -> List[Sequence]:
+    """Split a sequence into consecutive chunks of at most `size` items."""
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1.")
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def run_concurrently(
+    fn: Callable,
+    args: Iterable,
+    max_workers: int = 4,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Call `fn(arg)` for each argument in a thread pool.
+
+    :param fn: the function to call
+    :param args: the arguments, one per call
+    :param max_workers: maximum number of concurrent calls. If 1, calls are
+        made serially in the current thread.
+    :param return_exceptions: if True, exceptions are returned in place of
+        results instead of being raised
+    :return: results in the order of `args`
+    """
+
+    def call(arg):
+        try:
+            return fn(arg)
+        except Exception as e:
+            if return_exceptions:
+                return e
+            raise
+
+    args = list(args)
+    if max_workers <= 1 or len(args) <= 1:
+        return [call(arg) for arg in args]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(args))) as executor:
+        return list(executor.map(call, args))
+
+
+def poll_delays(
+    every_seconds: float = None,
+    min_seconds: float = 0.25,
+    max_seconds: float = 5.0,
+    factor: float = 1.5,
+) -> Iterator[float]:
+    """Yield the delays between polls of a long running task.
+
+    Delays start at `min_seconds` and grow by `factor` up to `max_seconds`,
+    so short tasks are noticed quickly and long tasks are not polled too
+    often.
+
+    :param every_seconds: if given, always yield this fixed delay instead
+    :param min_seconds: first delay
+    :param max_seconds: maximum delay
+    :param factor: growth factor between consecutive delays
+    """
+    if every_seconds is not None:
+        while True:
+            yield every_seconds
+    delay = min_seconds
+    while True:
+        yield delay
+        delay = min(delay * factor, max_seconds)
+
+
+class TaskPool:
+    """Polls many running tasks together in a background thread.
+
+    Submitted tasks are reloaded on an adaptive schedule (see
+    :func:`poll_delays`); tasks that are due at the same time are reloaded
+    concurrently. Each submission returns a :class:`Future
+    <concurrent.futures.Future>` that resolves to the task once it is no
+    longer running, or fails with a `TimeoutError`.
+
+    .. code-block:: python
+
+        with TaskPool() as pool:
+            futures = [pool.submit(task, callback=handle) for task in tasks]
+            finished = [f.result() for f in futures]
+
+    :param timeout: maximum seconds to wait for each task
+    :param max_workers: maximum number of concurrent reloads
+    :param kwargs: arguments for :func:`poll_delays`
+    """
+
+    def __init__(self, timeout: float = 600, max_workers: int = 4, **kwargs):
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.poll_kwargs = kwargs
+        self._pending = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, task, callback: Callable[[Any], Any] = None) -> Future:
+        """Poll `task` until it is no longer running.
+
+        :param task: an object with a `status` and a `reload()` method, e.g.
+            a :class:`Task <benchlingapi.models.Task>`
+        :param callback: optional function called with the finished task
+        :return: a future for the finished task
+        """
+        future = Future()
+        if callback is not None:
+
+            def done(f):
+                if not f.cancelled() and f.exception() is None:
+                    callback(f.result())
+
+            future.add_done_callback(done)
+        if task.status != "RUNNING":
+            future.set_result(task)
+            return future
+        delays = poll_delays(**self.poll_kwargs)
+        now = time.monotonic()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("TaskPool is closed.")
+            self._pending.append([now + next(delays), delays, now, task, future])
+            self._cond.notify()
+        return future
+
+    def wait_all(self, futures: Iterable[Future] = None) -> List[Any]:
+        """Wait for the futures (default: all pending tasks) and return their
+        tasks."""
+        if futures is None:
+            with self._cond:
+                futures = [entry[4] for entry in self._pending]
+        return [f.result() for f in futures]
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and not self._pending:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                wake = min(entry[0] for entry in self._pending)
+                delay = wake - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                now = time.monotonic()
+                due = [entry for entry in self._pending if entry[0] <= now]
+            self._poll(due)
+
+    def _poll(self, due):
+        results = run_concurrently(
+            lambda entry: entry[3].reload(),
+            due,
+            max_workers=self.max_workers,
+            return_exceptions=True,
+        )
+        now = time.monotonic()
+        finished = []
+        for entry, result in zip(due, results):
+            _, delays, started, task, future = entry
+            if future.done():
+                # cancelled by close()
+                pass
+            elif isinstance(result, Exception):
+                future.set_exception(result)
+            elif task.status != "RUNNING":
+                future.set_result(task)
+            elif now - started > self.timeout:
+                future.set_exception(
+                    TimeoutError(
+                        "Task {} took too long ({}s)".format(
+                            getattr(task, "id", None), self.timeout
+                        )
+                    )
+                )
+            else:
+                entry[0] = now + next(delays)
+                continue
+            finished.append(entry)
+        with self._cond:
+            for entry in finished:
+                if entry in self._pending:
+                    self._pending.remove(entry)
+
+    def close(self):
+        """Stop polling. Futures of unfinished tasks are cancelled."""
+        with self._cond:
+            self._closed = True
+            pending, self._pending = self._pending, []
+            self._cond.notify()
+        for entry in pending:
+            entry[4].cancel()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.wait_all()
+        self.close()
@@ -0,0 +1,211 @@
+r"""
+HTTP response cache (:mod:`benchlingapi.httpcache`)
+===================================================
+
+.. currentmodule:: benchlingapi.httpcache
+
+Revalidating caches for GET responses. When a cached response exists,
+:class:`Http <benchlingapi.session.Http>` sends the request with
+conditional headers (`If-None-Match` for responses with an `ETag`,
+`If-Modified-Since` for responses with a `Last-Modified` date). If the
+server answers `304 Not Modified`, the cached body is used and only the
+headers are transferred.
+
+Only responses with a server-sent `ETag` or `Last-Modified` header are
+cached. Validators are not derived from the `modifiedAt` field of an entity:
+HTTP dates only have a resolution of one second, so an edit made in the same
+second as the cached copy would be answered with a 304.
+
+.. code-block:: python
+
+    from benchlingapi import Session
+    from benchlingapi.httpcache import SQLiteResponseCache
+
+    session = Session(api_key, response_cache=SQLiteResponseCache("cache.db"))
+
+.. versionadded:: 2.2.0
+    Added :class:`MemoryResponseCache` and :class:`SQLiteResponseCache`
+"""
+import abc
+import json
+import sqlite3
+import threading
+import time
+
+import requests
+
+from benchlingapi.cache import TTLCache
+
+
+class CachedResponse:
+    """A stored GET response."""
+
+    #: response headers that are stored with the body
+    HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+    def __init__(self, url: str, body: bytes, headers: dict, stored_at: float = None):
+        self.url = url
+        self.body = body
+        self.headers = headers
+        self.stored_at = time.time() if stored_at is None else stored_at
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> "CachedResponse":
+        headers = {k: response.headers[k] for k in cls.HEADERS if k in response.headers}
+        return cls(response.url, response.content, headers)
+
+    def validators(self) -> dict:
+        """Return the conditional request headers for this response."""
+        headers = {}
+        if "ETag" in self.headers:
+            headers["If-None-Match"] = self.headers["ETag"]
+        if "Last-Modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["Last-Modified"]
+        return headers
+
+    def is_revalidatable(self) -> bool:
+        return bool(self.validators())
+
+    def to_response(self, response: requests.Response) -> requests.Response:
+        """Build a 200 response from this entry and the server's 304
+        `response`."""
+        r = requests.Response()
+        r.status_code = 200
+        r._content = self.body
+        r.headers.update(self.headers)
+        r.headers["X-Cache"] = "REVALIDATED"
+        r.url = response.url
+        r.request = response.request
+        r.elapsed = response.elapsed
+        r.encoding = response.encoding
+        return r
+
+
+class ResponseCache(abc.ABC):
+    """Base class for response caches.
+
+    Subclasses implement :meth:`get`, :meth:`set`, :meth:`delete` and
+    :meth:`clear`.
+    """
+
+    def __init__(self):
+        self._stats_lock = threading.Lock()
+        self.hits = 0  #: responses served from the cache after a 304
+        self.misses = 0  #: cached responses that had changed on the server
+        self.stores = 0  #: responses stored
+
+    @abc.abstractmethod
+    def get(self, key: str) -> CachedResponse:
+        """Return the stored response for `key`, or None."""
+
+    @abc.abstractmethod
+    def set(self, key: str, entry: CachedResponse):
+        """Store `entry` under `key`."""
+
+    @abc.abstractmethod
+    def delete(self, key: str):
+        """Remove the response stored under `key`, if any."""
+
+    @abc.abstractmethod
+    def clear(self):
+        """Remove all stored responses."""
+
+    def record_hit(self):
+        with self._stats_lock:
+            self.hits += 1
+
+    def record_miss(self):
+        with self._stats_lock:
+            self.misses += 1
+
+    def record_store(self):
+        with self._stats_lock:
+            self.stores += 1
+
+    @staticmethod
+    def key(method: str, url: str, params: dict = None) -> str:
+        """Return the cache key for a request."""
+        return requests.Request(method.upper(), url, params=params).prepare().url
+
+    def as_dict(self) -> dict:
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses, "stores": self.stores}
+
+
+class MemoryResponseCache(ResponseCache):
+    """Keeps up to `maxsize` responses in memory (least recently used are
+    evicted first).
+
+    :param maxsize: maximum number of responses to keep
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        super().__init__()
+        self._cache = TTLCache(maxsize=maxsize)
+
+    def get(self, key: str) -> CachedResponse:
+        return self._cache.get(key)
+
+    def set(self, key: str, entry: CachedResponse):
+        self._cache.set(key, entry)
+
+    def delete(self, key: str):
+        self._cache.invalidate(key)
+
+    def clear(self):
+        self._cache.invalidate()
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Keeps responses in a sqlite database, so they survive between runs.
+
+    :param path: path to the database file
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT, headers TEXT, body BLOB, "
+                "stored_at REAL)"
+            )
+
+    def get(self, key: str) -> CachedResponse:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, headers, body, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        url, headers, body, stored_at = row
+        return CachedResponse(url, bytes(body), json.loads(headers), stored_at)
+
+    def set(self, key: str, entry: CachedResponse):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (
+                    key,
+                    entry.url,
+                    json.dumps(entry.headers),
+                    sqlite3.Binary(entry.body),
+                    entry.stored_at,
+                ),
+            )
+
+    def delete(self, key: str):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
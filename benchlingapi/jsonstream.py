@@ -0,0 +1,163 @@
+r"""
+Streaming JSON bodies (:mod:`benchlingapi.jsonstream`)
+======================================================
+
+.. currentmodule:: benchlingapi.jsonstream
+
+Request bodies that embed files as base64 strings (e.g. sequencing traces
+for :meth:`DNAAlignment.submit_alignment
+<benchlingapi.models.DNAAlignment.submit_alignment>`) can be much larger
+than the files themselves. A :class:`JSONStream` serializes such a body
+lazily: each :class:`Base64File` placeholder is read from disk (memory
+mapped) and encoded chunk by chunk while the request is sent, so only a
+few chunks are held in memory at a time.
+
+.. code-block:: python
+
+    body = JSONStream({"files": [{"name": "a.ab1", "data": Base64File("a.ab1")}]})
+    requests.post(url, data=body, headers={"Content-Type": "application/json"})
+
+The length of the body is computed from the file sizes without reading
+them, so the request is sent with a `Content-Length` header.
+
+.. versionadded:: 2.2.0
+    Added :class:`JSONStream` and :class:`Base64File`
+"""
+import base64
+import json
+import mmap
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Any
+from typing import Iterator
+from typing import Union
+
+
+class Base64File:
+    """Placeholder for the base64 encoded contents of a file.
+
+    :param path: path to the file
+    """
+
+    CHUNK_SIZE = 3 * 2 ** 16  #: bytes read per chunk (a multiple of 3)
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def encoded_length(self) -> int:
+        """Return the length of the base64 encoding of the file."""
+        return 4 * ((os.path.getsize(self.path) + 2) // 3)
+
+    def iter_encoded(self, chunk_size: int = None) -> Iterator[bytes]:
+        """Yield the base64 encoding of the file in chunks."""
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        if chunk_size % 3:
+            raise ValueError("Chunk size must be a multiple of 3.")
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                for start in range(0, len(m), chunk_size):
+                    yield base64.b64encode(m[start : start + chunk_size])
+
+    def encode(self) -> bytes:
+        """Return the whole base64 encoding of the file."""
+        return b"".join(self.iter_encoded())
+
+    def __repr__(self):
+        return "<{} {!r}>".format(self.__class__.__name__, self.path)
+
+
+def _pieces(data: Any) -> Iterator[Union[bytes, Base64File]]:
+    """Yield the JSON encoding of `data` as bytes, with files left as
+    :class:`Base64File` placeholders."""
+    if isinstance(data, Base64File):
+        yield data
+    elif isinstance(data, dict):
+        yield b"{"
+        for i, (key, value) in enumerate(data.items()):
+            if i:
+                yield b", "
+            yield json.dumps(str(key)).encode("utf-8") + b": "
+            yield from _pieces(value)
+        yield b"}"
+    elif isinstance(data, (list, tuple)):
+        yield b"["
+        for i, value in enumerate(data):
+            if i:
+                yield b", "
+            yield from _pieces(value)
+        yield b"]"
+    else:
+        yield json.dumps(data).encode("utf-8")
+
+
+class JSONStream:
+    """A JSON request body that encodes embedded files while it is sent.
+
+    Iterating yields the body in chunks; the stream can be iterated again
+    (e.g. when a request is retried). Use as the `data` of a request.
+
+    :param data: JSON serializable data in which :class:`Base64File`
+        placeholders stand for base64 strings
+    :param max_workers: number of files to read and encode concurrently.
+        If 1 (default), each file is streamed chunk by chunk; otherwise up
+        to `max_workers` whole encoded files are buffered.
+    """
+
+    def __init__(self, data: Any, max_workers: int = 1):
+        self.data = data
+        self.max_workers = max_workers
+
+    def files(self):
+        return [p for p in _pieces(self.data) if isinstance(p, Base64File)]
+
+    def __len__(self) -> int:
+        n = 0
+        for piece in _pieces(self.data):
+            if isinstance(piece, Base64File):
+                n += piece.encoded_length() + 2
+            else:
+                n += len(piece)
+        return n
+
+    def __iter__(self) -> Iterator[bytes]:
+        encoded = self._encode_ahead() if self.max_workers > 1 else None
+        # small pieces of JSON are joined so they are not sent one by one
+        buffer = []
+        try:
+            for piece in _pieces(self.data):
+                if not isinstance(piece, Base64File):
+                    buffer.append(piece)
+                    continue
+                buffer.append(b'"')
+                yield b"".join(buffer)
+                if encoded is None:
+                    yield from piece.iter_encoded()
+                else:
+                    yield next(encoded)
+                buffer = [b'"']
+            yield b"".join(buffer)
+        finally:
+            if encoded is not None:
+                encoded.close()
+
+    def _encode_ahead(self) -> Iterator[bytes]:
+        """Yield the encoded files in order, encoding up to `max_workers`
+        files concurrently."""
+        files = iter(self.files())
+        window = deque()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for f in islice(files, self.max_workers):
+                    window.append(executor.submit(f.encode))
+                while window:
+                    data = window.popleft().result()
+                    for f in islice(files, 1):
+                        window.append(executor.submit(f.encode))
+                    yield data
+            finally:
+                for future in window:
+                    future.cancel()
@@ -0,0 +1,280 @@
+r"""
+Local mirror (:mod:`benchlingapi.mirror`)
+=========================================
+
+.. currentmodule:: benchlingapi.mirror
+
+A sqlite copy of Benchling entities that is kept up to date incrementally.
+
+.. code-block:: python
+
+    from benchlingapi import Session
+    from benchlingapi.mirror import LocalMirror
+
+    session = Session(api_key, mirror=LocalMirror("benchling.db"))
+    session.sync()  # first run downloads everything, later runs only changes
+
+    session.DNASequence.find_by_name("pUC19", local=True)  # from the mirror
+    session.mirror.query(
+        "SELECT folder_id, count(*) FROM entities GROUP BY folder_id"
+    )
+
+Each sync lists entities sorted by `modifiedAt` and filtered to those
+modified at or after the last record seen (the high-water mark), so a sync
+only transfers what changed. Archived entities are mirrored too and are
+excluded from reads.
+
+Reads from the mirror are opt-in: pass `local=True` to `find`/`get`,
+`find_by_name` or `registry_dict` of a synced model. `find_by_name` falls
+back to the server if the mirror has no match. Models created, updated,
+archived or reloaded through the session are written through to the mirror,
+but changes made elsewhere only show up after the next :meth:`Session.sync
+<benchlingapi.session.Session.sync>`, so local reads may be out of date.
+
+.. versionadded:: 2.2.0
+    Added :class:`LocalMirror`
+"""
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict
+from typing import Iterable
+from typing import List
+
+from benchlingapi.exceptions import BenchlingAPIException
+
+
+class LocalMirror:
+    """A sqlite mirror of Benchling entities.
+
+    :param path: path to the database file (use ":memory:" for a temporary
+        mirror)
+    :param models: names of the models to mirror (default :attr:`MODELS`)
+    """
+
+    #: models mirrored by default
+    MODELS = ("DNASequence", "AASequence", "CustomEntity", "Oligo", "Batch")
+    #: extra list parameters used when syncing (include archived entities)
+    SYNC_PARAMS = {"archive_reason": "Any"}
+    PAGE_SIZE = 100  #: page size used when syncing
+
+    def __init__(self, path: str, models: Iterable[str] = None):
+        self.path = path
+        self.models = tuple(models or self.MODELS)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS entities (
+                    model TEXT NOT NULL,
+                    id TEXT NOT NULL,
+                    name TEXT,
+                    registry_id TEXT,
+                    entity_registry_id TEXT,
+                    folder_id TEXT,
+                    modified_at TEXT,
+                    archived INTEGER NOT NULL DEFAULT 0,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (model, id)
+                );
+                CREATE INDEX IF NOT EXISTS entities_name ON entities (model, name);
+                CREATE INDEX IF NOT EXISTS entities_registry
+                    ON entities (model, registry_id, entity_registry_id);
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    model TEXT PRIMARY KEY,
+                    high_water TEXT,
+                    synced_at REAL
+                );
+                """
+            )
+        self._synced = set(
+            row[0] for row in self._conn.execute("SELECT model FROM sync_state")
+        )
+
+    # ------------------------------------------------------------------
+    # syncing
+
+    def high_water(self, model_name: str) -> str:
+        """Return the latest `modifiedAt` mirrored for the model."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water FROM sync_state WHERE model = ?", (model_name,)
+            ).fetchone()
+        if row:
+            return row[0]
+
+    def is_synced(self, model_name: str) -> bool:
+        """Return whether the model has been synced at least once."""
+        return model_name in self._synced
+
+    def sync(self, session, models: Iterable[str] = None) -> Dict[str, int]:
+        """Download entities changed since the last sync.
+
+        :param session: the session to sync with
+        :param models: names of models to sync (default: all mirrored models)
+        :return: number of records written per model
+        """
+        counts = {}
+        for model_name in models or self.models:
+            if model_name not in self.models:
+                raise BenchlingAPIException(
+                    "Model '{}' is not mirrored. Select from {}".format(
+                        model_name, self.models
+                    )
+                )
+            counts[model_name] = self._sync_model(session.interface(model_name))
+        return counts
+
+    def _sync_model(self, interface) -> int:
+        model_name = interface.__name__
+        high_water = self.high_water(model_name)
+        params = dict(self.SYNC_PARAMS)
+        params.update({"sort": "modifiedAt:asc", "page_size": self.PAGE_SIZE})
+        if high_water:
+            # records at the high-water mark are re-written; upserts make
+            # this harmless and avoid missing same-timestamp changes
+            params["modified_at"] = ">= " + high_water
+        count = 0
+        key = interface._camelize()
+        for page in interface._get_pages(params=params, prefetch=1):
+            records = page.get(key, [])
+            high_water = self._write(model_name, records, high_water)
+            count += len(records)
+        self._synced.add(model_name)
+        return count
+
+    @staticmethod
+    def _rows(model_name: str, records: List[dict]) -> List[tuple]:
+        return [
+            (
+                model_name,
+                r["id"],
+                r.get("name"),
+                r.get("registryId"),
+                r.get("entityRegistryId"),
+                r.get("folderId"),
+                r.get("modifiedAt"),
+                1 if r.get("archiveRecord") else 0,
+                json.dumps(r),
+            )
+            for r in records
+        ]
+
+    def _write(self, model_name: str, records: List[dict], high_water: str) -> str:
+        for r in records:
+            modified_at = r.get("modifiedAt")
+            if modified_at and (high_water is None or modified_at > high_water):
+                high_water = modified_at
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._rows(model_name, records),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                (model_name, high_water, time.time()),
+            )
+        return high_water
+
+    def upsert(self, model_name: str, records: List[dict]):
+        """Write records the session received from a create, update or reload.
+
+        The high-water mark is not moved, so the next sync still picks up
+        changes made elsewhere in the meantime.
+        """
+        records = [r for r in records if isinstance(r, dict) and r.get("id")]
+        if not records:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entities VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                self._rows(model_name, records),
+            )
+
+    def set_archived(self, model_name: str, ids: List[str], archive_record: dict):
+        """Mark mirrored records as archived (or unarchived if
+        `archive_record` is None)."""
+        with self._lock, self._conn:
+            for id in ids:
+                row = self._conn.execute(
+                    "SELECT data FROM entities WHERE model = ? AND id = ?",
+                    (model_name, id),
+                ).fetchone()
+                if row is None:
+                    continue
+                data = json.loads(row[0])
+                data["archiveRecord"] = archive_record
+                self._conn.execute(
+                    "UPDATE entities SET archived = ?, data = ? "
+                    "WHERE model = ? AND id = ?",
+                    (1 if archive_record else 0, json.dumps(data), model_name, id),
+                )
+
+    # ------------------------------------------------------------------
+    # reading
+
+    def _load(self, interface, rows):
+        data = [json.loads(row[0]) for row in rows]
+        return interface.load_many(data) if data else []
+
+    def _select(self, where: str, args: tuple, archived: bool = False, tail=""):
+        sql = "SELECT data FROM entities WHERE " + where
+        if not archived:
+            sql += " AND archived = 0"
+        sql += tail
+        with self._lock:
+            return self._conn.execute(sql, args).fetchall()
+
+    def get(self, interface, id: str):
+        """Return the mirrored model with this id, or None."""
+        rows = self._select(
+            "model = ? AND id = ?", (interface.__name__, id), archived=True
+        )
+        models = self._load(interface, rows)
+        if models:
+            return models[0]
+
+    def find_by_name(self, interface, name: str):
+        """Return the first (not archived) mirrored model with this name."""
+        rows = self._select(
+            "model = ? AND name = ?",
+            (interface.__name__, name),
+            tail=" ORDER BY modified_at DESC LIMIT 1",
+        )
+        models = self._load(interface, rows)
+        if models:
+            return models[0]
+
+    def registry_dict(self, interface, registry_id: str) -> dict:
+        """Return a dict of entity registry ids to registered models."""
+        rows = self._select(
+            "model = ? AND registry_id = ? AND entity_registry_id IS NOT NULL",
+            (interface.__name__, registry_id),
+        )
+        return {m.entity_registry_id: m for m in self._load(interface, rows)}
+
+    def all(self, interface, archived: bool = False) -> list:
+        """Return all mirrored models of this type."""
+        rows = self._select("model = ?", (interface.__name__,), archived=archived)
+        return self._load(interface, rows)
+
+    def query(self, sql: str, *args) -> list:
+        """Run a read-only SQL query against the mirror.
+
+        The `entities` table has the columns `model`, `id`, `name`,
+        `registry_id`, `entity_registry_id`, `folder_id`, `modified_at`,
+        `archived` and `data` (the JSON record).
+        """
+        with self._lock:
+            return self._conn.execute(sql, args).fetchall()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self):
+        return "<{} path={!r} models={}>".format(
+            self.__class__.__name__, self.path, self.models
+        )
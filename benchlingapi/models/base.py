@@ -1,5 +1,6 @@
 """The base model class and registry for all model instances."""
 import inspect
+import threading
 from distutils.version import LooseVersion
 from functools import reduce
 
@@ -7,7 +8,11 @@ import inflection
 from marshmallow import __version__
 from marshmallow import class_registry
 
+from benchlingapi.concurrency import chunks
+from benchlingapi.concurrency import run_concurrently
 from benchlingapi.exceptions import ModelNotFoundError
+from benchlingapi.models import fastload
+from benchlingapi.utils import un_underscore
 from benchlingapi.utils import un_underscore_keys
 from benchlingapi.utils import underscore_keys
 from benchlingapi.utils import url_build
@@ -79,18 +84,66 @@ class ModelRegistry(type):
         return cls.__name__
 
 
+class _LazyFields:
+    """Loads the heavy fields of a page of summary models with one batched
+    fetch, the first time any of them is accessed."""
+
+    def __init__(self, model_cls, insts):
+        self.model_cls = model_cls
+        self.insts = insts
+        self.lock = threading.Lock()
+
+    def load(self):
+        with self.lock:
+            pending = [inst for inst in self.insts if "_lazy" in vars(inst)]
+            if not pending:
+                return
+            ids = [inst.id for inst in pending]
+            pages = run_concurrently(
+                self.model_cls._bulk_get, chunks(ids, self.model_cls.BULK_GET_SIZE)
+            )
+            full = {model.id: vars(model) for page in pages for model in page}
+            for inst in pending:
+                values = full.get(inst.id, {})
+                for name in self.model_cls.HEAVY_FIELDS:
+                    if name in values:
+                        setattr(inst, name, values[name])
+                del inst._lazy
+                inst._remember()
+
+
 class ModelBaseABC:
     """The model base for all BenchlingAPI model instances."""
 
     # http = None  # initialized with Session calls a model interface
     session = None
     alias = None
+    #: large fields left out when loading in summary mode (see
+    #: :meth:`ListMixin.list <benchlingapi.models.mixins.ListMixin.list>`)
+    HEAVY_FIELDS = ()
+    #: API names of the fields requested in summary mode. If empty, all fields
+    #: are requested and the heavy fields are dropped on load.
+    SUMMARY_FIELDS = ()
+    #: whether instances are kept in the session identity map. False for
+    #: models that are polled for changes (e.g. tasks).
+    IDENTITY_MAP = True
 
     def __init__(self, **data):
         data = underscore_keys(data)
         for k, v in data.items():
             setattr(self, k, v)
 
+    def __getattr__(self, item):
+        # only called for missing attributes: load the heavy fields of
+        # summary models on first access
+        lazy = self.__dict__.get("_lazy")
+        if lazy is not None and item in self.HEAVY_FIELDS:
+            lazy.load()
+            return getattr(self, item)
+        raise AttributeError(
+            "'{}' object has no attribute '{}'".format(self.__class__.__name__, item)
+        )
+
     @staticmethod
     def _url_build(*parts):
         return url_build(*parts)
@@ -134,11 +187,22 @@ class ModelBaseABC:
             return [un_underscore_keys(d) for d in result]
         return un_underscore_keys(result)
 
+    @classmethod
+    def _use_fast_load(cls, args, kwargs) -> bool:
+        return (
+            not args and not kwargs and getattr(cls.session, "fast_load", False)
+        )
+
     @classmethod
     def load(cls, data, *args, **kwargs):
         schema_inst = cls._serialization_schema(*args, **kwargs)
-        inst = cls._deserializer(schema_inst, data)
+        if cls._use_fast_load(args, kwargs):
+            inst = fastload.load(schema_inst, underscore_keys(data), cls.session)
+        else:
+            inst = cls._deserializer(schema_inst, data)
         inst.raw = data
+        if isinstance(inst, ModelBase):
+            inst._remember()
         return inst
 
     def dump(self, *args, **kwargs):
@@ -147,15 +211,75 @@ class ModelBaseABC:
         return data
 
     @classmethod
-    def load_many(cls, data, *args, **kwargs):
+    def load_many(
+        cls, data, *args, compact=False, keep_raw=None, summary=False, **kwargs
+    ):
+        """Load many model instances from Benchling data.
+
+        .. versionchanged:: 2.2.0
+            Added the `compact`, `keep_raw` and `summary` arguments.
+
+        :param data: list of records returned by the Benchling API
+        :param compact: if True, return :class:`CompactRecord` instances
+            instead of models
+        :param keep_raw: if True, keep the source record on `inst.raw`.
+            Defaults to True for models and False for compact records.
+        :param summary: if True, leave out the :attr:`HEAVY_FIELDS`. Models
+            load them for the whole list with one batched fetch when one of
+            them is first accessed (compact records return None instead).
+        :return: list of models (or compact records)
+        """
+        if keep_raw is None:
+            keep_raw = not compact
         schema_inst = cls._serialization_schema(*args, many=True, **kwargs)
-        # TODO: change for marshmallow > v3
-        insts = cls._deserializer(schema_inst, data)
-        for inst_data, inst in zip(data, insts):
-            if issubclass(type(inst), ModelBase):
-                inst.raw = inst_data
+        if compact:
+            schema_inst.context["compact"] = True
+        heavy = cls.HEAVY_FIELDS if summary else ()
+        if heavy:
+            schema_inst.partial = heavy
+            keys = set(heavy) | {un_underscore(name) for name in heavy}
+            data = [{k: v for k, v in d.items() if k not in keys} for d in data]
+        if cls._use_fast_load(args, kwargs):
+            insts = fastload.load_many(
+                schema_inst, [underscore_keys(d) for d in data], cls.session
+            )
+        else:
+            # TODO: change for marshmallow > v3
+            insts = cls._deserializer(schema_inst, data)
+        if keep_raw:
+            for inst_data, inst in zip(data, insts):
+                if isinstance(inst, (ModelBase, CompactRecord)):
+                    inst.raw = inst_data
+        if cls._identity_map() is not None:
+            for inst in insts:
+                if isinstance(inst, ModelBase):
+                    inst._remember()
+        if heavy and not compact:
+            lazy = _LazyFields(cls, [i for i in insts if isinstance(i, ModelBase)])
+            for inst in lazy.insts:
+                # remove defaults set by __init__ so access loads the fields
+                for name in heavy:
+                    vars(inst).pop(name, None)
+                inst._lazy = lazy
         return insts
 
+    @classmethod
+    def _compact_record_class(cls):
+        """Return the :class:`CompactRecord` class for this model."""
+        record_cls = cls.__dict__.get("_compact_record")
+        if record_cls is None:
+            schema = class_registry.get_class(cls.__name__ + "Schema")
+            fields = tuple(
+                field.attribute or name for name, field in schema().load_fields.items()
+            )
+            record_cls = type(
+                cls.__name__ + "Record",
+                (CompactRecord,),
+                {"__slots__": fields, "_model": cls, "_fields": frozenset(fields)},
+            )
+            cls._compact_record = record_cls
+        return record_cls
+
     @classmethod
     def _tableize(cls):
         """Tableize the model name.
@@ -191,10 +315,67 @@ class ModelBaseABC:
             path += additional_paths
         return cls._url_build(*path)
 
+    @classmethod
+    def _identity_map(cls):
+        if cls.IDENTITY_MAP:
+            return getattr(cls.session, "identity_map", None)
+
+    @classmethod
+    def _recall(cls, id):
+        """Return the instance with this id from the session identity map."""
+        identity_map = cls._identity_map()
+        if identity_map is not None and id is not None:
+            return identity_map.get((cls.__name__, id))
+
+    def _remember(self):
+        """Add this instance to the session identity map."""
+        identity_map = self._identity_map()
+        if identity_map is not None and getattr(self, "id", None) is not None:
+            identity_map.set((self.__class__.__name__, self.id), self)
+
+    @classmethod
+    def _forget(cls, ids):
+        """Remove instances from the session identity map."""
+        identity_map = cls._identity_map()
+        if identity_map is not None:
+            for id in ids:
+                identity_map.invalidate((cls.__name__, id))
+
+    @classmethod
+    def _name_index_key(cls):
+        return ("names", cls.__name__)
+
+    @classmethod
+    def _invalidate_name_index(cls):
+        """Drop the cached name index (see :meth:`ListMixin.find_by_name
+        <benchlingapi.models.mixins.ListMixin.find_by_name>`)."""
+        cache = getattr(cls.session, "metadata_cache", None)
+        if cache is not None:
+            cache.invalidate(cls._name_index_key())
+
+    @classmethod
+    def _written(cls, models):
+        """Update the session caches with models this session created,
+        updated or reloaded: the cached name index is dropped and their
+        source records (`raw`) are written through to the local mirror."""
+        cls._invalidate_name_index()
+        mirror = getattr(cls.session, "mirror", None)
+        if mirror is not None and cls.__name__ in mirror.models:
+            mirror.upsert(cls.__name__, [getattr(m, "raw", None) for m in models])
+
+    @classmethod
+    def _mirror(cls):
+        """Return the session's local mirror if it has synced this model."""
+        mirror = getattr(cls.session, "mirror", None)
+        if mirror is not None and mirror.is_synced(cls.__name__):
+            return mirror
+
     def _update_from_other(self, other):
         vars(self).update(vars(other))
+        self._remember()
 
     def reload(self):
+        self._forget([self.id])
         seq = self.find(self.id)
         self._update_from_other(seq)
         return self
@@ -208,9 +389,12 @@ class ModelBaseABC:
         # return cls.load(response)
 
     @classmethod
-    def _get_pages(cls, path_params=None, params=None, action=None):
+    def _get_pages(cls, path_params=None, params=None, action=None, prefetch=None):
         pages = cls.session.http.get_pages(
-            cls._path(additional_paths=path_params), params=params, action=action
+            cls._path(additional_paths=path_params),
+            params=params,
+            action=action,
+            prefetch=prefetch,
         )
         return pages
 
@@ -250,6 +434,89 @@ class ModelBaseABC:
         )
 
 
+class CompactRecord:
+    """A memory efficient, read-only record of a model.
+
+    Returned by `list`, `all` and `list_pages` when called with
+    `compact=True`. Records keep their fields in `__slots__` rather than an
+    instance `__dict__`, and do not keep the source record unless
+    `keep_raw=True` is passed. Fields not returned by the server read as
+    None. Use :meth:`to_model` to get the full model instance.
+
+    .. versionadded:: 2.2.0
+    """
+
+    __slots__ = ("_extra", "raw")
+    _model = None
+    _fields = frozenset()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompactRecord":
+        record = cls.__new__(cls)
+        extra = None
+        for k, v in data.items():
+            if k in cls._fields:
+                object.__setattr__(record, k, v)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[k] = v
+        object.__setattr__(record, "_extra", extra)
+        object.__setattr__(record, "raw", None)
+        return record
+
+    def __getattr__(self, item):
+        # only called for unset slots and unknown attributes
+        if item in self._fields:
+            return None
+        extra = object.__getattribute__(self, "_extra")
+        if extra is not None and item in extra:
+            return extra[item]
+        raise AttributeError(
+            "'{}' has no attribute '{}'".format(self.__class__.__name__, item)
+        )
+
+    def __setattr__(self, key, value):
+        if key != "raw":
+            raise AttributeError(
+                "'{}' is read-only. Use `to_model()` to get a model instance.".format(
+                    self.__class__.__name__
+                )
+            )
+        object.__setattr__(self, key, value)
+
+    def as_dict(self) -> dict:
+        """Return the record's fields as a dict."""
+        data = {}
+        for k in self.__slots__:
+            try:
+                data[k] = object.__getattribute__(self, k)
+            except AttributeError:
+                pass
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def to_model(self) -> "ModelBase":
+        """Return the full model instance for this record."""
+        data = {}
+        for k, v in self.as_dict().items():
+            if isinstance(v, list):
+                v = [x.to_model() if isinstance(x, CompactRecord) else x for x in v]
+            elif isinstance(v, CompactRecord):
+                v = v.to_model()
+            data[k] = v
+        inst = self._model(**data)
+        if self.raw is not None:
+            inst.raw = self.raw
+        return inst
+
+    def __repr__(self):
+        return "<{cls} id={id}>".format(
+            cls=self.__class__.__name__, id=getattr(self, "id", None)
+        )
+
+
 class ModelBase(ModelBaseABC, metaclass=ModelRegistry):
     """Registered model base for BenchlingAPI."""
 
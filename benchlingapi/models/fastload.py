@@ -0,0 +1,304 @@
+r"""
+Fast loading (:mod:`benchlingapi.models.fastload`)
+==================================================
+
+.. currentmodule:: benchlingapi.models.fastload
+
+Loading a page of models through marshmallow (`Schema.load` and the
+`post_load` hook) is often slower than fetching the page. This module
+compiles a specialized decode function for each schema in
+:mod:`benchlingapi.models.schema`. A compiled loader checks and copies
+values directly for the simple field types (strings, integers, booleans,
+dicts, lists and nested schemas) and only calls into marshmallow for
+fields with validators.
+
+Compiled loaders produce the same result as the marshmallow path. Any
+record the compiled loader cannot handle exactly (wrong types, missing
+required fields, invalid values) is loaded again with marshmallow, so
+errors are raised the same way.
+
+Enable with `Session(api_key, fast_load=True)`.
+
+.. versionadded:: 2.2.0
+"""
+import threading
+from typing import Callable
+
+from marshmallow import class_registry
+from marshmallow import EXCLUDE
+from marshmallow import fields as mfields
+from marshmallow import INCLUDE
+from marshmallow import missing
+from marshmallow import ValidationError
+from marshmallow.exceptions import RegistryError
+
+from benchlingapi.models.schema import ModelSchemaMixin
+
+
+class _Fallback(Exception):
+    """Raised when a record must be loaded with marshmallow instead."""
+
+
+def _string(value):
+    if type(value) is str:
+        return value
+    raise _Fallback
+
+
+def _integer(value):
+    if type(value) is int:
+        return value
+    raise _Fallback
+
+
+def _boolean(value):
+    if type(value) is bool:
+        return value
+    raise _Fallback
+
+
+def _dict(value):
+    if type(value) is dict:
+        return dict(value)
+    raise _Fallback
+
+
+def _shared_dict(value):
+    if type(value) is dict:
+        return value
+    raise _Fallback
+
+
+def _raw(value):
+    return value
+
+
+def _list_of(decode):
+    def _list(value):
+        if type(value) is not list:
+            raise _Fallback
+        return [decode(x) for x in value]
+
+    return _list
+
+
+def _allow_none(decode):
+    def _decode(value):
+        if value is None:
+            return None
+        return decode(value)
+
+    return _decode
+
+
+def _generic(field, name):
+    """Decode with the marshmallow field itself (e.g. for validated
+    fields)."""
+
+    def _decode(value):
+        try:
+            return field.deserialize(value, name, None)
+        except ValidationError:
+            raise _Fallback
+
+    return _decode
+
+
+_SIMPLE_DECODERS = {
+    mfields.String: _string,
+    mfields.Integer: _integer,
+    mfields.Boolean: _boolean,
+    mfields.Raw: _raw,
+}
+
+
+class _Uncompilable(Exception):
+    """Raised when a schema cannot be compiled exactly."""
+
+
+def _nested_schema_class(field):
+    nested = field.nested
+    if isinstance(nested, str):
+        try:
+            nested = class_registry.get_class(nested)
+        except RegistryError:
+            raise _Uncompilable
+    if not isinstance(nested, type):
+        raise _Uncompilable
+    return nested
+
+
+def _field_decoder(field, name, session, compact) -> Callable:
+    """Return a `decode(value)` function for a bound marshmallow field."""
+    ftype = type(field)
+    if ftype is mfields.Nested:
+        if field.only or field.exclude or field.unknown:
+            raise _Uncompilable
+        try:
+            decode = _compile(_nested_schema_class(field), session, compact)
+        except _Uncompilable:
+            return _generic(field, name)
+        if field.many:
+            decode = _list_of(decode)
+    elif field.validators:
+        return _generic(field, name)
+    elif ftype in _SIMPLE_DECODERS:
+        decode = _SIMPLE_DECODERS[ftype]
+    elif ftype is mfields.Dict and field.key_field is None and field.value_field is None:
+        # compact records are read-only and do not keep the source record,
+        # so they can share its dicts instead of copying them
+        decode = _shared_dict if compact else _dict
+    elif ftype is mfields.List:
+        inner = field.inner
+        if type(inner) is mfields.Dict:
+            if inner.key_field is not None or inner.value_field is not None:
+                return _generic(field, name)
+            inner_decode = _shared_dict if compact else _dict
+        elif type(inner) in _SIMPLE_DECODERS and not inner.validators:
+            inner_decode = _SIMPLE_DECODERS[type(inner)]
+        else:
+            return _generic(field, name)
+        if inner.allow_none:
+            inner_decode = _allow_none(inner_decode)
+        decode = _list_of(inner_decode)
+    else:
+        return _generic(field, name)
+    if field.allow_none:
+        decode = _allow_none(decode)
+    return decode
+
+
+_ALLOWED_HOOKS = {"post_load": {"load_model"}}
+
+
+def _check_hooks(schema_cls):
+    for key, hooks in schema_cls._hooks.items():
+        # marshmallow < 3.13 keys hooks by `(tag, pass_many)` and stores
+        # method names; later versions key by tag and store tuples
+        tag = key[0] if isinstance(key, tuple) else key
+        if tag in ("pre_dump", "post_dump"):
+            continue
+        allowed = _ALLOWED_HOOKS.get(tag, set())
+        for hook in hooks:
+            name = hook if isinstance(hook, str) else hook[0]
+            if name not in allowed:
+                raise _Uncompilable
+
+
+def _load_default(field):
+    """Return the default used for a missing field (`Field.missing` before
+    marshmallow 3.13)."""
+    try:
+        return field.load_default
+    except AttributeError:
+        return field.missing
+
+
+def _compile(schema_cls, session, compact=False, partial=()) -> Callable:
+    """Compile a `load(data)` function for the schema class and session.
+
+    Required fields named in `partial` may be missing.
+    """
+    _check_hooks(schema_cls)
+    schema_inst = schema_cls()
+    schema_inst.context["session"] = session
+    schema_inst.context["compact"] = compact
+
+    plan = []
+    for name, field in schema_inst.load_fields.items():
+        key = field.data_key if field.data_key is not None else name
+        attr = field.attribute or name
+        decode = _field_decoder(field, name, session, compact)
+        required = field.required and name not in partial
+        plan.append((key, attr, required, _load_default(field), decode))
+    known_keys = frozenset(p[0] for p in plan)
+    unknown = schema_inst.unknown
+
+    interface = record_cls = None
+    if issubclass(schema_cls, ModelSchemaMixin):
+        interface = session.interface(schema_cls.get_model_name())
+        if compact:
+            record_cls = interface._compact_record_class()
+
+    def load(data):
+        if type(data) is not dict:
+            raise _Fallback
+        result = {}
+        for key, attr, required, default, decode in plan:
+            if key in data:
+                result[attr] = decode(data[key])
+            elif required:
+                raise _Fallback
+            elif default is not missing:
+                result[attr] = default() if callable(default) else default
+        if unknown != EXCLUDE:
+            for key in data:
+                if key not in known_keys:
+                    if unknown != INCLUDE:
+                        raise _Fallback
+                    result[key] = data[key]
+        if record_cls is not None:
+            return record_cls.from_dict(result)
+        if interface is None:
+            return result
+        return interface(**result)
+
+    return load
+
+
+_lock = threading.Lock()
+
+
+def get_loader(schema_cls, session, compact=False, partial=()) -> Callable:
+    """Return the compiled `load(data)` function for a schema class, or None
+    if the schema cannot be compiled exactly.
+
+    :param compact: if True, the loader returns compact records instead of
+        models (see :class:`benchlingapi.models.base.CompactRecord`)
+    :param partial: names of required fields that may be missing
+    """
+    partial = tuple(partial)
+    key = (schema_cls, compact, partial)
+    with _lock:
+        # kept on the session, as loaders refer back to it
+        session_loaders = vars(session).setdefault("_fast_loaders", {})
+        if key not in session_loaders:
+            try:
+                session_loaders[key] = _compile(schema_cls, session, compact, partial)
+            except _Uncompilable:
+                session_loaders[key] = None
+        return session_loaders[key]
+
+
+def _schema_loader(schema_inst, session):
+    compact = bool(schema_inst.context.get("compact"))
+    partial = schema_inst.partial or ()
+    if partial is True:
+        return None
+    return get_loader(type(schema_inst), session, compact, partial)
+
+
+def load(schema_inst, data, session):
+    """Load one record with the compiled loader, falling back to marshmallow."""
+    loader = _schema_loader(schema_inst, session)
+    if loader is not None:
+        try:
+            return loader(data)
+        except _Fallback:
+            pass
+    return schema_inst.load(data)
+
+
+def load_many(schema_inst, data, session) -> list:
+    """Load many records with the compiled loader, falling back to
+    marshmallow for records that cannot be loaded exactly."""
+    loader = _schema_loader(schema_inst, session)
+    if loader is None or not isinstance(data, list):
+        return schema_inst.load(data, many=True)
+    results = []
+    for d in data:
+        try:
+            results.append(loader(d))
+        except _Fallback:
+            results.append(schema_inst.load(d, many=False))
+    return results
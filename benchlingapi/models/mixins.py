@@ -1,25 +1,103 @@
 """Exposes models to various API endpoints."""
+import gzip as gzip_module
+import json
+import os
 import webbrowser
 from typing import Any
 from typing import Callable
 from typing import Generator
+from typing import Iterable
 from typing import List
 from typing import Tuple
 from typing import Union
 
+from benchlingapi.concurrency import chunks
+from benchlingapi.concurrency import run_concurrently
 from benchlingapi.exceptions import BenchlingAPIException
 from benchlingapi.exceptions import BenchlingServerException
 from benchlingapi.models.base import ModelBase
 from benchlingapi.models.base import ModelBaseABC
 from benchlingapi.models.base import ModelRegistry
+from benchlingapi.utils import underscore
+
+
+class BulkResult(list):
+    """The results of a bulk operation, in the same order as its input.
+
+    .. versionadded:: 2.2.0
+
+    :ivar missing: inputs that were not found
+    :ivar errors: dict of input index to the error for inputs that failed
+    """
+
+    def __init__(self, items: Iterable = (), missing: List = None, errors: dict = None):
+        super().__init__(items)
+        self.missing = list(missing or [])
+        self.errors = dict(errors or {})
+
+
+class MergeResult(BulkResult):
+    """The results of :meth:`EntityMixin.merge_many`, in the same order as
+    its input.
+
+    .. versionadded:: 2.2.0
+
+    :ivar created: indices of inputs that were created
+    :ivar updated: indices of inputs that updated an existing model
+    :ivar conflicts: dict of input index to the reason the input was
+        skipped (it matched several existing models, or repeats an earlier
+        input)
+    """
+
+    def __init__(self, items: Iterable = ()):
+        super().__init__(items)
+        self.created = []
+        self.updated = []
+        self.conflicts = {}
+
+    def counts(self) -> dict:
+        """Return the number of created, updated, conflicting and failed
+        inputs."""
+        return {
+            "created": len(self.created),
+            "updated": len(self.updated),
+            "conflicts": len(self.conflicts),
+            "failed": len(self.errors),
+        }
 
 
 class GetMixin(ModelBaseABC):
     """Exposes the `get` and `find` by id methods."""
 
+    #: whether the endpoint has a bulk-get action (see :meth:`get_many`)
+    BULK_GET = False
+    BULK_GET_SIZE = 100  #: maximum number of ids per bulk-get request
+
     @classmethod
-    def get(cls, id: str, **params) -> ModelBase:
-        """Get model by id (see 'find')"""
+    def get(cls, id: str, local: bool = False, **params) -> ModelBase:
+        """Get model by id (see 'find')
+
+        .. versionchanged:: 2.2.0
+            Returns the cached instance if the session has an identity map.
+            Added the `local` argument.
+
+        :param id: the model id
+        :param local: if True, read the model from the session's local mirror
+            if it has been synced. The mirrored model may be out of date if
+            it was changed elsewhere since the last :meth:`Session.sync
+            <benchlingapi.session.Session.sync>`.
+        :param params: extra parameters
+        :return: the model, or None if it was not found
+        """
+        if not params:
+            model = cls._recall(id)
+            if model is not None:
+                return model
+            mirror = cls._mirror() if local else None
+            if mirror is not None:
+                model = mirror.get(cls, id)
+                if model is not None:
+                    return model
         try:
             response = cls._get(id, params=params)
         except BenchlingAPIException as e:
@@ -29,9 +107,96 @@ class GetMixin(ModelBaseABC):
         return cls.load(response)
 
     @classmethod
-    def find(cls, id, **params) -> ModelBase:
+    def find(cls, id, local: bool = False, **params) -> ModelBase:
         """Find model by id (see 'get')"""
-        return cls.get(id, **params)
+        return cls.get(id, local=local, **params)
+
+    def reload(self):
+        """Reload the model from the server.
+
+        .. versionchanged:: 2.2.0
+            Always fetches from the server (never from the local mirror),
+            and writes the result through to the mirror.
+        """
+        self._forget([self.id])
+        model = self.load(self._get(self.id))
+        self._update_from_other(model)
+        self._written([self])
+        return self
+
+    @classmethod
+    def get_many(
+        cls, ids: List[str], chunk_size: int = None, max_workers: int = 4
+    ) -> BulkResult:
+        """Get many models by their ids.
+
+        If the model has a bulk-get endpoint (see :attr:`BULK_GET`), ids are
+        split into chunks of `chunk_size`, which are requested concurrently.
+        Otherwise, each model is requested with :meth:`get`.
+
+        .. versionadded:: 2.2.0
+
+        :param ids: model ids
+        :param chunk_size: number of ids per request (default
+            :attr:`BULK_GET_SIZE`)
+        :param max_workers: maximum number of concurrent requests
+        :return: list of models in the order of `ids`, with None for ids that
+            were not found. Missing ids are listed in `result.missing`.
+        :raises BenchlingAPIException: if a bulk-get request fails, including
+            a 404 that does not name the ids that were not found
+        """
+        if chunk_size is None:
+            chunk_size = cls.BULK_GET_SIZE
+        unique_ids = list(dict.fromkeys(ids))
+        found = {}
+        remaining = []
+        for id in unique_ids:
+            model = cls._recall(id)
+            if model is None:
+                remaining.append(id)
+            else:
+                found[id] = model
+        if cls.BULK_GET:
+            pages = run_concurrently(
+                cls._bulk_get, chunks(remaining, chunk_size), max_workers=max_workers
+            )
+        else:
+            models = run_concurrently(cls.get, remaining, max_workers=max_workers)
+            pages = [[model for model in models if model is not None]]
+        for models in pages:
+            for model in models:
+                found[model.id] = model
+        return BulkResult(
+            [found.get(id) for id in ids],
+            missing=[id for id in unique_ids if id not in found],
+        )
+
+    @classmethod
+    def _bulk_get(cls, ids: List[str]) -> List[ModelBase]:
+        try:
+            response = cls._get(
+                action="bulk-get", params={cls._camelize("id"): ",".join(ids)}
+            )
+        except BenchlingAPIException as e:
+            # the server rejects the whole request if any id does not exist
+            # and names those ids; request the others again
+            invalid = set(cls._invalid_ids(e)) & set(ids)
+            if not invalid:
+                raise e
+            ids = [id for id in ids if id not in invalid]
+            return cls._bulk_get(ids) if ids else []
+        return cls.load_many(response[cls._camelize()])
+
+    @staticmethod
+    def _invalid_ids(error: BenchlingAPIException) -> List[str]:
+        """Return the ids a 404 response reported as not found."""
+        response = getattr(error, "response", None)
+        if response is None or response.status_code != 404:
+            return []
+        try:
+            return response.json()["error"]["invalidIds"] or []
+        except (ValueError, KeyError, TypeError):
+            return []
 
 
 class ListMixin(ModelBaseABC):
@@ -39,56 +204,272 @@ class ListMixin(ModelBaseABC):
     `list`, `one`, etc.)"""
 
     MAX_PAGE_SIZE = 100
+    #: list query parameters the endpoint supports for server-side filtering
+    #: (e.g. "name", "ids"). Lookups by name otherwise use a cached index.
+    LIST_FILTERS = ()
 
     @classmethod
-    def list(cls, limit=None, **params) -> List[ModelBase]:
+    def list(
+        cls,
+        limit=None,
+        compact: bool = False,
+        keep_raw: bool = None,
+        summary: bool = False,
+        **params
+    ) -> List[ModelBase]:
         """List models.
 
+        .. versionchanged:: 2.2.0
+            Added the `compact`, `keep_raw` and `summary` arguments.
+
+        :param compact: if True, return memory efficient
+            :class:`CompactRecord <benchlingapi.models.base.CompactRecord>`
+            instances instead of models
+        :param keep_raw: if True, keep each source record on `inst.raw`
+            (default: True for models, False for compact records)
+        :param summary: if True, leave out the model's `HEAVY_FIELDS` (e.g.
+            `bases` and `annotations`), asking the server not to send them.
+            They are loaded for the whole page with one batched fetch when
+            first accessed.
         :param params: extra parameters
         :return: list of models
         """
         if limit:
-            return cls.all(limit=limit, **params)
-        response = cls._get(params=params)
-        return cls.load_many(response[cls._camelize()])
+            return cls.all(
+                limit=limit,
+                compact=compact,
+                keep_raw=keep_raw,
+                summary=summary,
+                **params
+            )
+        response = cls._get(params=cls._summary_params(params, summary))
+        return cls.load_many(
+            response[cls._camelize()],
+            compact=compact,
+            keep_raw=keep_raw,
+            summary=summary,
+        )
+
+    @classmethod
+    def _summary_params(cls, params: dict, summary: bool) -> dict:
+        """Add a `returning` parameter that asks for the
+        :attr:`SUMMARY_FIELDS` only."""
+        if not summary or not cls.SUMMARY_FIELDS or "returning" in params:
+            return params
+        key = cls._camelize()
+        returning = ["{}.{}".format(key, f) for f in cls.SUMMARY_FIELDS]
+        params = dict(params)
+        params["returning"] = ",".join(returning + ["nextToken"])
+        return params
 
     @classmethod
     def list_pages(
-        cls, page_limit: int = None, **params
+        cls,
+        page_limit: int = None,
+        prefetch: int = None,
+        compact: bool = False,
+        keep_raw: bool = None,
+        summary: bool = False,
+        **params
     ) -> Generator[List[ModelBase], None, None]:
         """Return a generator pages of models.
 
+        .. versionchanged:: 2.2.0
+            Added the `prefetch`, `compact`, `keep_raw` and `summary`
+            arguments.
+
         :param page_limit: return page limit
+        :param prefetch: number of pages to fetch in the background while the
+            current page is loaded (default: no prefetching)
+        :param compact: if True, return memory efficient
+            :class:`CompactRecord <benchlingapi.models.base.CompactRecord>`
+            instances instead of models
+        :param keep_raw: if True, keep each source record on `inst.raw`
+            (default: True for models, False for compact records)
+        :param summary: if True, leave out the model's `HEAVY_FIELDS` (e.g.
+            `bases` and `annotations`), asking the server not to send them.
+            They are loaded for the whole page with one batched fetch when
+            first accessed.
         :param params: extra parameters
         :return: generator of list of models
         """
-        generator = cls._get_pages(params=params)
-        response = next(generator, None)
-        page_num = 1
-        while response is not None and (page_limit is None or page_num <= page_limit):
-            yield cls.load_many(response[cls._camelize()])
+        generator = cls._get_pages(
+            params=cls._summary_params(params, summary), prefetch=prefetch
+        )
+        try:
             response = next(generator, None)
-            page_num += 1
+            page_num = 1
+            while response is not None:
+                yield cls.load_many(
+                    response[cls._camelize()],
+                    compact=compact,
+                    keep_raw=keep_raw,
+                    summary=summary,
+                )
+                if page_limit is not None and page_num >= page_limit:
+                    break
+                response = next(generator, None)
+                page_num += 1
+        finally:
+            if hasattr(generator, "close"):
+                generator.close()
 
     @classmethod
     def all(
-        cls, page_limit: int = None, limit: int = None, **params
+        cls,
+        page_limit: int = None,
+        limit: int = None,
+        prefetch: int = None,
+        compact: bool = False,
+        keep_raw: bool = None,
+        summary: bool = False,
+        **params
     ) -> Generator[ModelBase, None, None]:
         """Return a generator comprising of all models.
 
+        .. versionchanged:: 2.2.0
+            Added the `prefetch`, `compact`, `keep_raw` and `summary`
+            arguments.
+
         :param page_limit: return page limit
         :param limit: number of model to return
+        :param prefetch: number of pages to fetch in the background while the
+            current page is loaded (default: no prefetching)
+        :param compact: if True, return memory efficient
+            :class:`CompactRecord <benchlingapi.models.base.CompactRecord>`
+            instances instead of models
+        :param keep_raw: if True, keep each source record on `inst.raw`
+            (default: True for models, False for compact records)
+        :param summary: if True, leave out the model's `HEAVY_FIELDS` (e.g.
+            `bases` and `annotations`), asking the server not to send them.
+            They are loaded for the whole page with one batched fetch when
+            first accessed.
         :param params: extra parameters
         :return: generator of models
         """
         num = 0
-        for page in cls.list_pages(page_limit=page_limit, **params):
+        pages = cls.list_pages(
+            page_limit=page_limit,
+            prefetch=prefetch,
+            compact=compact,
+            keep_raw=keep_raw,
+            summary=summary,
+            **params
+        )
+        for page in pages:
             for m in page:
                 yield m
                 num += 1
                 if limit is not None and num >= limit:
                     return
 
+    #: export formats, by name
+    EXPORT_FORMATS = ("jsonl", "ndjson")
+
+    @classmethod
+    def export(
+        cls,
+        path: str,
+        format: str = "jsonl",
+        gzip: bool = None,
+        resume: bool = False,
+        prefetch: int = 1,
+        **params
+    ) -> int:
+        """Export all models to a file, one JSON record per line.
+
+        Pages are written to disk as they arrive, without building models, so
+        memory use does not grow with the collection. Records are written as
+        returned by the API (with camelCase keys).
+
+        After each page, the position in the file and the page's `nextToken`
+        are saved to `<path>.state`. With `resume=True`, an interrupted
+        export continues from there. The state file is removed once the
+        export completes.
+
+        .. code-block:: python
+
+            session.DNASequence.export("sequences.jsonl.gz")
+            session.DNASequence.export("sequences.jsonl.gz", resume=True)
+
+        .. versionadded:: 2.2.0
+
+        :param path: path of the output file
+        :param format: "jsonl" (or "ndjson")
+        :param gzip: if True, gzip the output. Defaults to True if the path
+            ends with ".gz".
+        :param resume: if True, continue an interrupted export of the same
+            path and parameters. If the output file is missing or shorter
+            than recorded, the export starts over.
+        :param prefetch: number of pages to fetch ahead while writing
+        :param params: extra list parameters
+        :return: number of records in the file
+        """
+        if format not in cls.EXPORT_FORMATS:
+            raise BenchlingAPIException(
+                "Format must be one of {}".format(cls.EXPORT_FORMATS)
+            )
+        if gzip is None:
+            gzip = path.endswith(".gz")
+        state_path = path + ".state"
+        # compare parameters as they are stored in the state file
+        saved_params = json.loads(json.dumps(params, sort_keys=True, default=str))
+        state = {"params": saved_params, "offset": 0, "count": 0, "nextToken": None}
+        if resume and os.path.exists(state_path):
+            with open(state_path, "r") as f:
+                saved = json.load(f)
+            if saved["params"] != saved_params:
+                raise BenchlingAPIException(
+                    "Cannot resume export of {}: parameters changed from {}".format(
+                        path, saved["params"]
+                    )
+                )
+            if not os.path.exists(path) or os.path.getsize(path) < saved["offset"]:
+                # the output was removed or truncated: start over
+                saved = state
+            state = saved
+            if state["offset"] and not state["nextToken"]:
+                # the last page was written before the state was removed
+                os.remove(state_path)
+                return state["count"]
+
+        page_params = dict(params)
+        if "pageSize" not in page_params and "page_size" not in page_params:
+            page_params["pageSize"] = cls.MAX_PAGE_SIZE
+        if state["nextToken"]:
+            page_params["nextToken"] = state["nextToken"]
+
+        key = cls._camelize()
+        pages = cls._get_pages(params=page_params, prefetch=prefetch)
+        mode = "r+b" if state["offset"] else "wb"
+        try:
+            with open(path, mode) as f:
+                # drop anything written after the last saved page
+                f.seek(state["offset"])
+                f.truncate()
+                for page in pages:
+                    records = page.get(key, [])
+                    data = "".join(json.dumps(r) + "\n" for r in records)
+                    data = data.encode("utf-8")
+                    if gzip:
+                        # each page is a complete gzip member, so the file
+                        # can be truncated after any page
+                        data = gzip_module.compress(data)
+                    f.write(data)
+                    f.flush()
+                    state["offset"] = f.tell()
+                    state["count"] += len(records)
+                    state["nextToken"] = page.get("nextToken")
+                    with open(state_path + ".tmp", "w") as sf:
+                        json.dump(state, sf)
+                    os.replace(state_path + ".tmp", state_path)
+        finally:
+            if hasattr(pages, "close"):
+                pages.close()
+        if os.path.exists(state_path):
+            os.remove(state_path)
+        return state["count"]
+
     @classmethod
     def last(cls, num: int = 1, **params) -> List[ModelBase]:
         """Returns the most recent models.
@@ -149,14 +530,39 @@ class ListMixin(ModelBaseABC):
         return found
 
     @classmethod
-    def find_by_name(cls, name: str, page_limit=5, **params) -> ModelBase:
+    def find_by_name(cls, name: str, page_limit: int = None, **params) -> ModelBase:
         """Find a model by name.
 
+        .. versionchanged:: 2.2.0
+            Filters by name on the server if the endpoint supports it (see
+            :attr:`LIST_FILTERS`). Otherwise, looks the name up in an index of
+            names to ids and page positions that is cached with the session
+            metadata (see :meth:`Session.invalidate_metadata
+            <benchlingapi.session.Session.invalidate_metadata>`) and fetches
+            only the page the model was on.
+
         :param name: the model name
-        :param page_limit: the return page limit
+        :param page_limit: the return page limit. If given, scans at most
+            this many pages instead of using the index (default 5 when the
+            index is not used).
         :param params: extra parameters
         :return: the model
         """
+        if "name" in cls.LIST_FILTERS:
+            params["name"] = name
+        elif page_limit is None and not params and cls.session.metadata_cache.enabled:
+            entry = cls._name_index().get(name)
+            if entry is None:
+                return None
+            model = cls._get_from_page(*entry)
+            if model is not None and model.name == name:
+                return model
+            # renamed, removed or moved to another page since the index was built
+            cls._invalidate_name_index()
+            entry = cls._name_index().get(name)
+            return None if entry is None else cls._get_from_page(*entry)
+        elif page_limit is None:
+            page_limit = 5
         models = cls.search(
             lambda x: x.name == name, limit=1, page_limit=page_limit, **params
         )
@@ -167,14 +573,72 @@ class ListMixin(ModelBaseABC):
     def get(cls, id: str, **params) -> ModelBase:
         """Get a single model by its id.
 
+        .. versionchanged:: 2.2.0
+            Filters by id on the server if the endpoint supports it (see
+            :attr:`LIST_FILTERS`). Otherwise, scans pages until the model is
+            found.
+
         :param id: the model id
         :param params: extra parameters
         :return: the model
         """
+        if not params:
+            model = cls._recall(id)
+            if model is not None:
+                return model
+        if "ids" in cls.LIST_FILTERS:
+            params["ids"] = id
+        params.setdefault("page_limit", None)
         models = cls.search(lambda x: x.id == id, limit=1, **params)
         if models:
             return models[0]
 
+    @classmethod
+    def _name_index(cls) -> dict:
+        """Return the cached index of model names to `(id, next_token)`,
+        where `next_token` is the token of the page the model is on."""
+
+        def build():
+            index = {}
+            next_token = None
+            for page in cls._get_pages(params=cls._index_page_params()):
+                next_token = cls._add_to_name_index(index, page, next_token)
+            return index
+
+        return cls.session.metadata_cache.get_or_set(cls._name_index_key(), build)
+
+    @classmethod
+    def _index_page_params(cls, next_token: str = None) -> dict:
+        params = {"pageSize": cls.MAX_PAGE_SIZE}
+        if next_token:
+            params["nextToken"] = next_token
+        return params
+
+    @classmethod
+    def _add_to_name_index(cls, index: dict, page: dict, next_token: str) -> str:
+        """Add the models of `page`, which starts at `next_token`, to the
+        name index and return the token of the next page."""
+        for record in page.get(cls._camelize(), []):
+            index.setdefault(record.get("name"), (record["id"], next_token))
+        return page.get("nextToken")
+
+    @classmethod
+    def _load_from_page(cls, page: dict, id: str) -> ModelBase:
+        """Return the model with this id from `page`, or None."""
+        for record in page.get(cls._camelize(), []):
+            if record.get("id") == id:
+                return cls.load(record)
+
+    @classmethod
+    def _get_from_page(cls, id: str, next_token: str) -> ModelBase:
+        """Return the model with this id from the page starting at
+        `next_token`, or None if it is not on that page."""
+        model = cls._recall(id)
+        if model is not None:
+            return model
+        page = cls._get(params=cls._index_page_params(next_token))
+        return cls._load_from_page(page, id)
+
     @classmethod
     def find(cls, id, **params):
         """Get a single model by its id. See :method:`get`
@@ -186,10 +650,145 @@ class ListMixin(ModelBaseABC):
         return cls.get(id, **params)
 
 
+def submit_chunks(
+    session,
+    submit: Callable[[int, int], Any],
+    size: int,
+    chunk_size: int,
+    max_workers: int = 4,
+    every_seconds: float = None,
+    timeout: float = 600,
+) -> Tuple[dict, dict]:
+    """Submit `size` inputs to a bulk endpoint in chunks.
+
+    `submit(start, stop)` posts the inputs `start:stop` and is called
+    concurrently for each chunk. If the server answers with a task, all
+    tasks are polled together (see :meth:`Task.wait_all
+    <benchlingapi.models.Task.wait_all>`). A failed chunk marks all of its
+    inputs as failed, using the per-item errors reported by the task where
+    available.
+
+    .. versionadded:: 2.2.0
+
+    :return: dict of chunk start to the chunk's response (or the response of
+        its task), and dict of input index to error
+    """
+    starts = list(range(0, size, chunk_size))
+    responses = run_concurrently(
+        lambda start: submit(start, min(start + chunk_size, size)),
+        starts,
+        max_workers=max_workers,
+        return_exceptions=True,
+    )
+
+    results = {}
+    errors = {}
+
+    def fail(start, error, item_errors=None):
+        _fail_chunk(errors, start, min(chunk_size, size - start), error, item_errors)
+
+    tasks = {}
+    for start, response in zip(starts, responses):
+        if isinstance(response, Exception):
+            fail(start, response)
+        elif isinstance(response, dict) and "taskId" in response:
+            tasks[start] = session.Task.find(response["taskId"])
+        else:
+            results[start] = response
+
+    if tasks:
+        session.Task.wait_all(
+            list(tasks.values()), every_seconds=every_seconds, timeout=timeout
+        )
+    for start, task in tasks.items():
+        if task.status == "SUCCEEDED":
+            results[start] = _task_response(task)
+        else:
+            fail(start, task.message or "Task {}".format(task.status), task.errors)
+    return results, errors
+
+
+def _fail_chunk(errors: dict, start: int, n: int, error, item_errors=None):
+    """Mark the `n` inputs of the chunk at `start` as failed, using the
+    per-item errors reported by its task where available."""
+    for i in range(n):
+        errors[start + i] = error
+    for item_error in item_errors or []:
+        index = item_error.get("index")
+        if isinstance(index, int) and 0 <= index < n:
+            errors[start + index] = item_error.get("message", item_error)
+
+
+def _task_response(task) -> Any:
+    """Return the response of a succeeded task."""
+    # prefer the response as sent by the server over the loaded one, whose
+    # keys are underscored
+    raw = getattr(task, "raw", None) or {}
+    return raw.get("response") or task.response or {}
+
+
+def _bulk_write(
+    interface,
+    action: str,
+    inputs: Union[dict, List[Union[dict, ModelBase]]],
+    to_json: Callable[[ModelBase], dict],
+    chunk_size: int,
+    max_workers: int,
+    every_seconds: float,
+    timeout: float,
+    params: dict,
+) -> BulkResult:
+    """Submit `inputs` to a model bulk endpoint in chunks and load the
+    results."""
+    key = interface._camelize()
+    if isinstance(inputs, dict):
+        inputs = inputs[key]
+    inputs = list(inputs)
+    data = [to_json(x) if isinstance(x, ModelBase) else x for x in inputs]
+
+    def submit(start, stop):
+        return interface._post({key: data[start:stop]}, action=action, **params)
+
+    responses, errors = submit_chunks(
+        interface.session,
+        submit,
+        len(data),
+        chunk_size,
+        max_workers=max_workers,
+        every_seconds=every_seconds,
+        timeout=timeout,
+    )
+    return _load_bulk_results(interface, inputs, responses, errors)
+
+
+def _load_bulk_results(
+    interface, inputs: list, responses: dict, errors: dict
+) -> BulkResult:
+    """Load the chunk `responses` of a bulk write of `inputs`, updating
+    unsaved model instances in place."""
+    key = interface._camelize()
+    results = [None] * len(inputs)
+    for start, response in responses.items():
+        if isinstance(response, dict):
+            # task responses are loaded with underscored keys
+            response = response.get(key, response.get(underscore(key), []))
+        for i, model in enumerate(interface.load_many(response)):
+            source = inputs[start + i]
+            if isinstance(source, ModelBase):
+                source._update_from_other(model)
+                model = source
+            else:
+                model._remember()
+            results[start + i] = model
+    interface._written([m for m in results if m is not None])
+    return BulkResult(results, errors=errors)
+
+
 class UpdateMixin(ModelBaseABC):
     """Exposes methods to update models on the Benchling server."""
 
     UPDATE_SCHEMA = "NOT IMPLEMENTED"
+    BULK_UPDATE_SIZE = 100  #: maximum number of models per bulk-update request
 
     @classmethod
     def update_model(cls, model_id: str, data: dict, **params) -> ModelBase:
@@ -200,6 +799,7 @@ class UpdateMixin(ModelBaseABC):
     def _update_from_data(self, data: dict) -> ModelBase:
         r = self.update_model(self.id, data)
         self._update_from_other(r)
+        self._written([self])
         return self
 
     def update_json(self) -> dict:
@@ -213,11 +813,64 @@ class UpdateMixin(ModelBaseABC):
         data = self.update_json()
         return self._update_from_data(data)
 
+    @classmethod
+    def bulk_update(
+        cls,
+        models: List[Union[dict, ModelBase]],
+        chunk_size: int = None,
+        max_workers: int = 4,
+        every_seconds: float = None,
+        timeout: float = 600,
+        **params
+    ) -> BulkResult:
+        """Update many models using the bulk-update endpoint.
+
+        Models are split into chunks of `chunk_size` that are submitted
+        concurrently, and the resulting tasks are polled together. Model
+        instances are updated in place.
+
+        .. versionadded:: 2.2.0
+
+        :param models: model instances, or update data dicts that include the
+            model `id`
+        :param chunk_size: number of models per request (default
+            :attr:`BULK_UPDATE_SIZE`)
+        :param max_workers: maximum number of concurrent requests
+        :param every_seconds: fixed time interval to check the tasks (default:
+            start fast and back off)
+        :param timeout: maximum time in seconds to wait for the tasks
+        :return: list of updated models in the order of `models`, with None
+            for models that failed. Errors are listed by index in
+            `result.errors`.
+        """
+
+        def to_json(model):
+            if not model.id:
+                raise BenchlingAPIException(
+                    "Cannot update. Model has not yet been saved."
+                )
+            data = model.update_json()
+            data["id"] = model.id
+            return data
+
+        return _bulk_write(
+            cls,
+            "bulk-update",
+            models,
+            to_json,
+            chunk_size or cls.BULK_UPDATE_SIZE,
+            max_workers,
+            every_seconds,
+            timeout,
+            params,
+        )
+
 
 class CreateMixin(ModelBaseABC):
     """Exposes methods that create new models on the Benchling server."""
 
     CREATE_SCHEMA = "Not implemented"
+    BULK_CREATE_SIZE = 100  #: maximum number of models per bulk-create request
 
     @classmethod
     def create_model(cls, data: dict, **params) -> ModelBase:
@@ -226,14 +879,54 @@ class CreateMixin(ModelBaseABC):
         return cls.load(response)
 
     @classmethod
-    def bulk_create(cls, model_data: dict, **params) -> List[ModelBase]:
-        """Create many models from a list of data."""
-        response = cls._post(model_data, action="bulk-create", **params)
-        return cls.load_many(response)
+    def bulk_create(
+        cls,
+        model_data: Union[dict, List[Union[dict, ModelBase]]],
+        chunk_size: int = None,
+        max_workers: int = 4,
+        every_seconds: float = None,
+        timeout: float = 600,
+        **params
+    ) -> BulkResult:
+        """Create many models using the bulk-create endpoint.
+
+        Models are split into chunks of `chunk_size` that are submitted
+        concurrently, and the resulting tasks are polled together. Unsaved
+        model instances are updated in place.
+
+        .. versionchanged:: 2.2.0
+            Inputs are chunked and submitted concurrently, and the
+            server's tasks are waited for.
+
+        :param model_data: unsaved model instances or create data dicts (or
+            a dict with a list of them under the plural model key, e.g.
+            `{"dnaSequences": [...]}`)
+        :param chunk_size: number of models per request (default
+            :attr:`BULK_CREATE_SIZE`)
+        :param max_workers: maximum number of concurrent requests
+        :param every_seconds: fixed time interval to check the tasks (default:
+            start fast and back off)
+        :param timeout: maximum time in seconds to wait for the tasks
+        :return: list of created models in the order of `model_data`, with
+            None for models that failed. Errors are listed by index in
+            `result.errors`.
+        """
+        return _bulk_write(
+            cls,
+            "bulk-create",
+            model_data,
+            lambda model: model.save_json(),
+            chunk_size or cls.BULK_CREATE_SIZE,
+            max_workers,
+            every_seconds,
+            timeout,
+            params,
+        )
 
     def _create_from_data(self, data) -> ModelBase:
         r = self.create_model(data)
         self._update_from_other(r)
+        self._written([self])
         return self
 
     def save_json(self) -> dict:
@@ -275,31 +968,180 @@ class ArchiveMixin(ModelBaseABC):
             OTHER,
         ]
 
+    ARCHIVE_SIZE = 100  #: maximum number of ids per archive/unarchive request
+
     @classmethod
-    def archive_many(cls, model_ids: List[str], reason=ARCHIVE_REASONS.DEFAULT) -> Any:
+    def _check_reason(cls, reason):
+        if reason not in cls.ARCHIVE_REASONS.REASONS:
+            raise Exception(
+                "Reason must be one of {}".format(cls.ARCHIVE_REASONS.REASONS)
+            )
+
+    @classmethod
+    def archive_many(
+        cls, model_ids: List[str], reason=ARCHIVE_REASONS.DEFAULT, max_workers: int = 4
+    ) -> Any:
         """Archive many models by their ids.
 
+        .. versionchanged:: 2.2.0
+            Ids are split into chunks of :attr:`ARCHIVE_SIZE` that are
+            submitted concurrently.
+
         :param model_ids: list of ids
         :param reason: reason for archival (default "Other"). Select from
                         `model.ARCHIVE_REASONS`
-        :return: list of models archived
+        :param max_workers: maximum number of concurrent requests
+        :return: the ids of the models archived, under the same key as in the
+            server's response (e.g. `{"dnaSequenceIds": [...]}`)
+        :raises BenchlingAPIException: if a chunk failed. The ids that were
+            archived by other chunks are listed in `e.result`, and the errors by
+            index of `model_ids` in `e.result.errors`.
         """
-        if reason not in cls.ARCHIVE_REASONS.REASONS:
-            raise Exception(
-                "Reason must be one of {}".format(cls.ARCHIVE_REASONS.REASONS)
-            )
-        key = cls._camelize("id")
-        return cls._post(action="archive", data={key: model_ids, "reason": reason})
+        cls._check_reason(reason)
+        done, errors = cls._archive_chunks(
+            "archive", model_ids, {"reason": reason}, max_workers
+        )
+        return cls._archived_response(done, errors)
 
     @classmethod
-    def unarchive_many(cls, model_ids: List[str]) -> Any:
+    def unarchive_many(cls, model_ids: List[str], max_workers: int = 4) -> Any:
         """Unarchive many models by their ids.
 
+        .. versionchanged:: 2.2.0
+            Ids are split into chunks of :attr:`ARCHIVE_SIZE` that are
+            submitted concurrently.
+
         :param model_ids: list of ids
-                :return: list of models unarchived
+        :param max_workers: maximum number of concurrent requests
+        :return: the ids of the models unarchived, under the same key as in the
+            server's response (e.g. `{"dnaSequenceIds": [...]}`)
+        :raises BenchlingAPIException: if a chunk failed. The ids that were
+            unarchived by other chunks are listed in `e.result`, and the errors by
+            index of `model_ids` in `e.result.errors`.
+        """
+        done, errors = cls._archive_chunks("unarchive", model_ids, {}, max_workers)
+        return cls._archived_response(done, errors)
+
+    @classmethod
+    def archive_models(
+        cls,
+        models: List[ModelBase],
+        reason=ARCHIVE_REASONS.DEFAULT,
+        refresh: bool = False,
+        max_workers: int = 4,
+    ) -> BulkResult:
+        """Archive many model instances without reloading each one.
+
+        The `archive_record` of each archived model is set locally, or, if
+        `refresh` is True, all archived models are reloaded with a single
+        :meth:`get_many <GetMixin.get_many>`.
+
+        .. versionadded:: 2.2.0
+
+        :param models: model instances
+        :param reason: reason for archival (default "Other"). Select from
+                        `model.ARCHIVE_REASONS`
+        :param refresh: if True, reload the archived models from the server
+        :param max_workers: maximum number of concurrent requests
+        :return: list of models, with None for models that were not archived.
+            Errors are listed by index in `result.errors`.
+        """
+        cls._check_reason(reason)
+        models = list(models)
+        done, errors = cls._archive_chunks(
+            "archive", [m.id for m in models], {"reason": reason}, max_workers
+        )
+        return cls._apply_archive(
+            models, done, errors, {"reason": reason}, refresh, max_workers
+        )
+
+    @classmethod
+    def unarchive_models(
+        cls, models: List[ModelBase], refresh: bool = False, max_workers: int = 4
+    ) -> BulkResult:
+        """Unarchive many model instances without reloading each one (see
+        :meth:`archive_models`).
+
+        .. versionadded:: 2.2.0
         """
+        models = list(models)
+        done, errors = cls._archive_chunks(
+            "unarchive", [m.id for m in models], {}, max_workers
+        )
+        return cls._apply_archive(models, done, errors, None, refresh, max_workers)
+
+    @classmethod
+    def _archive_chunks(
+        cls, action: str, model_ids: List[str], data: dict, max_workers: int
+    ) -> Tuple[List[str], dict]:
+        """Post the ids in chunks and return the ids the server reported as
+        done, and a dict of id index to error for failed chunks."""
         key = cls._camelize("id")
-        return cls._post(action="unarchive", data={key: model_ids})
+        model_ids = list(model_ids)
+        cls._forget(model_ids)
+
+        def submit(start, stop):
+            chunk_data = dict(data)
+            chunk_data[key] = model_ids[start:stop]
+            return cls._post(action=action, data=chunk_data)
+
+        responses, errors = submit_chunks(
+            cls.session,
+            submit,
+            len(model_ids),
+            cls.ARCHIVE_SIZE,
+            max_workers=max_workers,
+        )
+        done = []
+        for start, response in sorted(responses.items()):
+            ids = None
+            if isinstance(response, dict):
+                # task responses are loaded with underscored keys
+                ids = response.get(key, response.get(underscore(key)))
+            if ids is None:
+                ids = model_ids[start : start + cls.ARCHIVE_SIZE]
+            done += ids
+        cls._invalidate_name_index()
+        mirror = getattr(cls.session, "mirror", None)
+        if mirror is not None and cls.__name__ in mirror.models:
+            archive_record = {"reason": data["reason"]} if "reason" in data else None
+            mirror.set_archived(cls.__name__, done, archive_record)
+        return done, errors
+
+    @classmethod
+    def _archived_response(cls, done: List[str], errors: dict) -> dict:
+        """Return the ids in the shape of the server's response, or raise the
+        first error with the partial result attached as `e.result`."""
+        if errors:
+            error = errors[min(errors)]
+            if not isinstance(error, Exception):
+                error = BenchlingAPIException(error)
+            error.result = BulkResult(done, errors=errors)
+            raise error
+        return {cls._camelize("id"): done}
+
+    @classmethod
+    def _apply_archive(cls, models, done, errors, archive_record, refresh, max_workers):
+        done = set(done)
+        updated = [m for m in models if m.id in done]
+        if refresh:
+            fetched = cls.get_many([m.id for m in updated], max_workers=max_workers)
+            for model, new in zip(updated, fetched):
+                if new is not None:
+                    model._update_from_other(new)
+        else:
+            for model in updated:
+                model.archive_record = (
+                    None if archive_record is None else dict(archive_record)
+                )
+        results = []
+        for i, model in enumerate(models):
+            if model.id in done:
+                results.append(model)
+            else:
+                results.append(None)
+                errors.setdefault(i, "Not changed by the server")
+        return BulkResult(results, errors=errors)
 
     def archive(self, reason=ARCHIVE_REASONS.DEFAULT) -> ModelBase:
         """Archive model instance.
@@ -339,14 +1181,46 @@ class ArchiveMixin(ModelBaseABC):
             return self.archive_record["reason"]
 
 
+def _hashable(value):
+    if isinstance(value, list):
+        return tuple(_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _hashable(v)) for k, v in value.items()))
+    return value
+
+
 class EntityMixin(ArchiveMixin, GetMixin, ListMixin, CreateMixin, UpdateMixin):
     """Entity methods (includes get, list, create, update)"""
 
+    BULK_GET = True
     DEFAULT_MERGE_FIELDS = set()
+    #: merge fields that can be looked up in batches, and their list filter
+    MERGE_FILTERS = {
+        "name": "names.anyOf",
+        "entity_registry_id": "entityRegistryIds.anyOf",
+    }
+    MERGE_LOOKUP_SIZE = 100  #: maximum number of values per merge lookup
 
     @classmethod
-    def find_by_name(cls, name: str, **params) -> ModelBase:
-        """Find entity by name."""
+    def find_by_name(cls, name: str, local: bool = False, **params) -> ModelBase:
+        """Find entity by name.
+
+        .. versionchanged:: 2.2.0
+            Added the `local` argument.
+
+        :param name: the entity name
+        :param local: if True, read from the session's local mirror if it has
+            been synced, falling back to the server if the mirror has no
+            match. The mirror may be out of date if entities were changed
+            elsewhere since the last sync.
+        :param params: extra parameters
+        :return: the entity
+        """
+        mirror = cls._mirror() if local else None
+        if mirror is not None and not params:
+            model = mirror.find_by_name(cls, name)
+            if model is not None:
+                return model
         models = cls.list(name=name, **params)
         if models:
             return models[0]
@@ -426,6 +1300,155 @@ class EntityMixin(ArchiveMixin, GetMixin, ListMixin, CreateMixin, UpdateMixin):
                 " {} found with merge fields {}".format(self.__class__.__name__, on)
             )
 
+    @classmethod
+    def merge_many(
+        cls,
+        models: List[ModelBase],
+        on: Iterable[str] = None,
+        chunk_size: int = None,
+        max_workers: int = 4,
+        every_seconds: float = None,
+        timeout: float = 600,
+        scan: bool = False,
+    ) -> MergeResult:
+        """Merge many models with existing models on the server (see
+        :meth:`merge`).
+
+        Existing models are looked up in batches. If one of the merge fields
+        has a batch filter (see :attr:`MERGE_FILTERS`, e.g. `name`), models
+        are listed by its values. Otherwise, models are read from the local
+        mirror (which may be out of date; call :meth:`Session.sync
+        <benchlingapi.session.Session.sync>` first), or all models are listed
+        if `scan` is True. Models are then
+        created and updated with
+        :meth:`bulk_create <CreateMixin.bulk_create>` and
+        :meth:`bulk_update <UpdateMixin.bulk_update>`, and are updated in
+        place.
+
+        Models matching more than one existing model, or repeating the merge
+        fields of an earlier model, are skipped and listed in
+        `result.conflicts`.
+
+        .. versionadded:: 2.2.0
+
+        :param models: model instances
+        :param on: fields to match existing models on (default
+            `DEFAULT_MERGE_FIELDS`)
+        :param chunk_size: number of models per bulk request
+        :param max_workers: maximum number of concurrent requests
+        :param every_seconds: fixed time interval to check bulk tasks (default:
+            start fast and back off)
+        :param timeout: maximum time in seconds to wait for bulk tasks
+        :param scan: if True, list all models when none of the merge fields
+            has a batch filter and the session has no local mirror
+        :return: list of merged models in the order of `models`, with None for
+            models that were skipped or failed. See
+            :meth:`MergeResult.counts`.
+        :raises BenchlingAPIException: if existing models cannot be looked up
+            without listing all models and `scan` is False
+        """
+        on = tuple(sorted(cls.DEFAULT_MERGE_FIELDS if on is None else on))
+        if not on:
+            raise BenchlingAPIException(
+                "Cannot merge. Must specify fields" " to merge with"
+            )
+        models = list(models)
+        keys = []
+        for model in models:
+            for field in on:
+                if not hasattr(model, field):
+                    raise BenchlingAPIException(
+                        "Cannot merge. Model is missing {} attribute".format(field)
+                    )
+            keys.append(tuple(_hashable(getattr(model, field)) for field in on))
+        existing = cls._merge_lookup(on, keys, max_workers, scan=scan)
+
+        result = MergeResult([None] * len(models))
+        to_create = []
+        to_update = []
+        seen = {}
+        for i, key in enumerate(keys):
+            if key in seen:
+                result.conflicts[i] = "Repeats input {}".format(seen[key])
+                continue
+            seen[key] = i
+            ids = existing.get(key, [])
+            if len(ids) > 1:
+                result.conflicts[i] = "Matches {} existing models ({})".format(
+                    len(ids), ", ".join(ids)
+                )
+            elif ids:
+                models[i].id = ids[0]
+                to_update.append(i)
+            else:
+                to_create.append(i)
+
+        for indices, write, done in (
+            (to_create, cls.bulk_create, result.created),
+            (to_update, cls.bulk_update, result.updated),
+        ):
+            if not indices:
+                continue
+            written = write(
+                [models[i] for i in indices],
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                every_seconds=every_seconds,
+                timeout=timeout,
+            )
+            for j, i in enumerate(indices):
+                if j in written.errors:
+                    result.errors[i] = written.errors[j]
+                else:
+                    result[i] = written[j]
+                    done.append(i)
+        return result
+
+    @classmethod
+    def _merge_lookup(
+        cls, on: Tuple[str], keys: List[tuple], max_workers: int, scan: bool = False
+    ):
+        """Return a dict of merge keys to the ids of existing models."""
+        field = next((f for f in on if f in cls.MERGE_FILTERS), None)
+        if field is None:
+            mirror = cls._mirror()
+            if mirror is not None:
+                found = mirror.all(cls)
+            elif scan:
+                found = cls.all(compact=True)
+            else:
+                raise BenchlingAPIException(
+                    "Cannot merge on {} without listing all {} models. Merge on "
+                    "one of {}, or pass scan=True.".format(
+                        on, cls.__name__, sorted(cls.MERGE_FILTERS)
+                    )
+                )
+        else:
+            pos = on.index(field)
+            values = list(dict.fromkeys(k[pos] for k in keys if k[pos] is not None))
+            # values are joined with commas, so other values (e.g. containing
+            # commas) are looked up one at a time
+            batched = [v for v in values if isinstance(v, str) and "," not in v]
+            queries = [
+                {cls.MERGE_FILTERS[field]: ",".join(chunk)}
+                for chunk in chunks(batched, cls.MERGE_LOOKUP_SIZE)
+            ]
+            batched = set(batched)
+            queries += [{field: v} for v in values if v not in batched]
+            pages = run_concurrently(
+                lambda query: list(cls.all(compact=True, **query)),
+                queries,
+                max_workers=max_workers,
+            )
+            found = [m for page in pages for m in page]
+        existing = {}
+        for model in found:
+            key = tuple(_hashable(getattr(model, f, None)) for f in on)
+            ids = existing.setdefault(key, [])
+            if model.id not in ids:
+                ids.append(model.id)
+        return existing
+
 
 class InventoryMixin(ModelBaseABC):
     """Designates model as having a folderId."""
@@ -470,7 +1493,7 @@ class RegistryMixin(ModelBaseABC):
     def valid_schemas(cls):
         """Return valid schemas for this model class."""
         valid = []
-        for r in cls.session.Registry.list():
+        for r in cls.session.Registry.registries():
             valid += [
                 (r, schema) for schema in r.entity_schemas if cls._valid_schema(schema)
             ]
@@ -495,7 +1518,7 @@ class RegistryMixin(ModelBaseABC):
         if not schema:
             raise BenchlingAPIException(
                 'No schema "{}" found. Select from {}'.format(
-                    schema_name, [s["name"] for r, s in self.valid_schemas()]
+                    schema_name, [s["name"] for r, s in valid_schemas]
                 )
             )
         self.new_registry_id = schema["registry_id"]
@@ -541,6 +1564,120 @@ class RegistryMixin(ModelBaseABC):
         self.reload()
         return self
 
+    @classmethod
+    def register_many(
+        cls,
+        models: List[ModelBase],
+        naming_strategy: str = NAMING_STRATEGY.DEFAULT,
+        chunk_size: int = None,
+        max_workers: int = 4,
+        every_seconds: float = None,
+        timeout: float = 600,
+        refresh: bool = True,
+    ) -> BulkResult:
+        """Register many model instances (see :meth:`register`).
+
+        Models are grouped by the registry of their schema (see
+        :meth:`set_schema`) and registered with :meth:`Registry.register_many
+        <benchlingapi.models.Registry.register_many>`.
+
+        .. versionadded:: 2.2.0
+
+        :param models: model instances with a schema set
+        :param naming_strategy: naming strategy for the registry
+        :param chunk_size: number of entities per request
+        :param max_workers: maximum number of concurrent requests
+        :param every_seconds: fixed time interval to check the tasks (default:
+            start fast and back off)
+        :param timeout: maximum time in seconds to wait for the tasks
+        :param refresh: if True, reload the registered models with a single
+            :meth:`get_many <GetMixin.get_many>` instead of one request each
+        :return: list of models, with None for models that failed. Errors are
+            listed by index in `result.errors`.
+        """
+        models = list(models)
+        for model in models:
+            if not hasattr(model, "new_registry_id"):
+                raise BenchlingAPIException(
+                    "No schema set for {}. Please use '{}' to set a schema.".format(
+                        model.id, cls.set_schema.__name__
+                    )
+                )
+        groups = {}
+        for i, model in enumerate(models):
+            groups.setdefault(model.new_registry_id, []).append(i)
+
+        def register(registry_id, ids):
+            return cls.session.Registry.register_many(
+                registry_id,
+                ids,
+                naming_strategy=naming_strategy,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                every_seconds=every_seconds,
+                timeout=timeout,
+            )
+
+        return cls._registered_many(models, groups, register, refresh, max_workers)
+
+    @classmethod
+    def unregister_many(
+        cls,
+        models: List[ModelBase],
+        folder_id: str = None,
+        chunk_size: int = None,
+        max_workers: int = 4,
+        every_seconds: float = None,
+        timeout: float = 600,
+        refresh: bool = True,
+    ) -> BulkResult:
+        """Unregister many model instances (see :meth:`unregister` and
+        :meth:`register_many`).
+
+        .. versionadded:: 2.2.0
+
+        :param folder_id: folder to move the unregistered models to (default:
+            each model's current folder)
+        """
+        models = list(models)
+        groups = {}
+        for i, model in enumerate(models):
+            key = (model.registry_id, folder_id or model.folder_id)
+            groups.setdefault(key, []).append(i)
+
+        def unregister(key, ids):
+            registry_id, folder = key
+            return cls.session.Registry.unregister_many(
+                registry_id,
+                ids,
+                folder,
+                chunk_size=chunk_size,
+                max_workers=max_workers,
+                every_seconds=every_seconds,
+                timeout=timeout,
+            )
+
+        return cls._registered_many(models, groups, unregister, refresh, max_workers)
+
+    @classmethod
+    def _registered_many(cls, models, groups, submit, refresh, max_workers):
+        errors = {}
+        for key, indices in groups.items():
+            result = submit(key, [models[i].id for i in indices])
+            for j, error in result.errors.items():
+                errors[indices[j]] = error
+        done = [m for i, m in enumerate(models) if i not in errors]
+        cls._forget([m.id for m in done])
+        if refresh and done:
+            fetched = cls.get_many([m.id for m in done], max_workers=max_workers)
+            for model, new in zip(done, fetched):
+                if new is not None:
+                    model._update_from_other(new)
+            cls._written(done)
+        return BulkResult(
+            [None if i in errors else m for i, m in enumerate(models)], errors=errors
+        )
+
     # TODO: test this method
     def register_with_custom_id(self, id):
         """Register the instance with a custom id.
@@ -615,14 +1752,28 @@ class RegistryMixin(ModelBaseABC):
         return cls.all(registry_id=registry_id, limit=limit, **params)
 
     @classmethod
-    def registry_dict(cls, registry_id=None, registry_name=None, **params):
+    def registry_dict(
+        cls, registry_id=None, registry_name=None, local: bool = False, **params
+    ):
         """Return a dictionary of registry ids to entities.
 
         :param registry_id: registery id. If none, 'registry_name' must be provided.
                 :param registry_name: registry name. If None, 'registry_id' must be provided
+                :param local: if True, read from the session's local mirror if
+                    it has been synced (which may be out of date)
                 :param params: additional search parameters
                 :return: dict of models in registry
+
+        .. versionchanged:: 2.2.0
+            Added the `local` argument.
         """
+        mirror = cls._mirror() if local else None
+        if mirror is not None and not params:
+            if registry_id is None:
+                registry_id = cls.session.Registry.find_registry(
+                    name=registry_name
+                ).id
+            return mirror.registry_dict(cls, registry_id)
         entities = cls.list_in_registry(
             registry_id=registry_id, registry_name=registry_name, **params
         )
@@ -696,4 +1847,5 @@ class InventoryEntityMixin(InventoryMixin, RegistryMixin, EntityMixin):
 
 class DeleteMixin(ModelBaseABC):
     def delete(self):
+        self._forget([self.id])
         return self._delete(path_params=[self.id])
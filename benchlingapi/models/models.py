@@ -1,16 +1,30 @@
 import base64
 import os
+import queue
 import re
 import time
 import urllib
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Type
 from typing import Union
 
+from benchlingapi.concurrency import merge
+from benchlingapi.concurrency import poll_delays
+from benchlingapi.concurrency import run_concurrently
+from benchlingapi.concurrency import TaskPool
 from benchlingapi.exceptions import BenchlingAPIException
+from benchlingapi.jsonstream import Base64File
+from benchlingapi.jsonstream import JSONStream
 from benchlingapi.models.base import ModelBase
 from benchlingapi.models.base import ModelRegistry
 from benchlingapi.models.mixins import ArchiveMixin
+from benchlingapi.models.mixins import BulkResult
 from benchlingapi.models.mixins import CreateMixin
 from benchlingapi.models.mixins import DeleteMixin
 from benchlingapi.models.mixins import EntityMixin
@@ -19,6 +33,8 @@ from benchlingapi.models.mixins import InventoryEntityMixin
 from benchlingapi.models.mixins import InventoryMixin
 from benchlingapi.models.mixins import ListMixin
 from benchlingapi.models.mixins import RegistryMixin
+from benchlingapi.models.mixins import submit_chunks
+from benchlingapi.utils import un_underscore_keys
 
 __all__ = [
     "DNASequence",
@@ -75,6 +91,27 @@ class DNASequence(InventoryEntityMixin, ModelBase):
     """A model representing Benchling's DNASequence."""
 
     ENTITY_TYPE = "dna_sequence"
+    HEAVY_FIELDS = ("bases", "annotations", "translations", "primers")
+    SUMMARY_FIELDS = (
+        "id",
+        "name",
+        "aliases",
+        "apiURL",
+        "archiveRecord",
+        "createdAt",
+        "creator",
+        "customFields",
+        "entityRegistryId",
+        "fields",
+        "folderId",
+        "isCircular",
+        "length",
+        "modifiedAt",
+        "registrationOrigin",
+        "registryId",
+        "schema",
+        "webURL",
+    )
 
     CREATE_SCHEMA = dict(
         only=(
@@ -291,6 +328,8 @@ class Task(GetMixin, ModelBase):
          :class:`TaskSchema <benchlingapi.schema.TaskSchema>`.
     """
 
+    IDENTITY_MAP = False
+
     def __init__(self, expected_class: Type[ModelBase] = None, **kwargs):
         self.expected_class = expected_class
         self.response_class = None
@@ -321,26 +360,133 @@ class Task(GetMixin, ModelBase):
     def __str__(self):
         return self.__repr__()
 
-    def wait(self, every_seconds: int = 3, timeout: int = 30):
+    def wait(
+        self, every_seconds: float = None, timeout: float = 30, **kwargs
+    ) -> "Task":
         """Wait for the Task to finish.
 
         .. versionadded:: 2.1.2
             Added Task and TaskSchema models and the `wait()` method.
 
-        :param every_seconds: time interval to check server
+        .. versionchanged:: 2.2.0
+            Polls adaptively by default (see
+            :func:`poll_delays <benchlingapi.concurrency.poll_delays>`), and
+            returns as soon as the task has finished.
+
+        :param every_seconds: fixed time interval to check server (default:
+            start fast and back off)
         :param timeout: maximum timeout in seconds
+        :param kwargs: arguments for
+            :func:`poll_delays <benchlingapi.concurrency.poll_delays>`
         :return: self
         """
+        return self.wait_all([self], every_seconds, timeout, **kwargs)[0]
+
+    @classmethod
+    def wait_all(
+        cls,
+        tasks: List["Task"],
+        every_seconds: float = None,
+        timeout: float = 30,
+        callback: Callable[["Task"], Any] = None,
+        max_workers: int = 4,
+        **kwargs
+    ) -> List["Task"]:
+        """Wait for many Tasks to finish, checking the running tasks together.
+
+        To wait in the background instead, submit the tasks to a
+        :class:`TaskPool <benchlingapi.concurrency.TaskPool>`.
+
+        .. versionadded:: 2.2.0
+
+        :param tasks: the tasks
+        :param every_seconds: fixed time interval to check server (default:
+            start fast and back off)
+        :param timeout: maximum timeout in seconds
+        :param callback: optional function called with each task as it
+            finishes
+        :param max_workers: maximum number of concurrent reloads
+        :param kwargs: arguments for
+            :func:`poll_delays <benchlingapi.concurrency.poll_delays>`
+        :return: the tasks
+        """
         t1 = time.time()
-        while self.status == "RUNNING":
-            t2 = time.time()
-            if t2 - t1 > timeout:
-                raise TimeoutError(
-                    "Task {} took too long ({}s)".format(self.id, timeout)
-                )
-            self.reload()
-            time.sleep(every_seconds)
-        return self
+        delays = poll_delays(every_seconds, **kwargs)
+        running = []
+        for task in tasks:
+            if task.status == "RUNNING":
+                running.append(task)
+            elif callback is not None:
+                callback(task)
+        while running:
+            elapsed = time.time() - t1
+            if elapsed > timeout:
+                if len(running) == 1:
+                    msg = "Task {} took too long ({}s)".format(running[0].id, timeout)
+                else:
+                    msg = "{} tasks took too long ({}s)".format(len(running), timeout)
+                raise TimeoutError(msg)
+            time.sleep(max(0, min(next(delays), timeout - elapsed)))
+            run_concurrently(lambda t: t.reload(), running, max_workers=max_workers)
+            still_running = []
+            for task in running:
+                if task.status == "RUNNING":
+                    still_running.append(task)
+                elif callback is not None:
+                    callback(task)
+            running = still_running
+        return tasks
+
+
+class AlignmentJob:
+    """One entry of a :meth:`DNAAlignment.submit_alignments` manifest.
+
+    .. versionadded:: 2.2.0
+
+    :ivar index: position of the entry in the manifest
+    :ivar template: the template (a :class:`DNASequence` or its id) as given
+        in the manifest
+    :ivar template_name: the template name to look up, if given instead
+    :ivar template_id: the resolved template sequence id
+    :ivar traces: filepaths of the traces to align
+    :ivar sequences: sequences (or their ids) to align
+    :ivar name: name of the alignment
+    :ivar task: the alignment task, once submitted
+    :ivar alignment: the finished :class:`DNAAlignment`
+    :ivar error: the error, if the entry failed
+    """
+
+    def __init__(
+        self,
+        index,
+        template,
+        traces=None,
+        name=None,
+        sequences=None,
+        template_name=None,
+    ):
+        self.index = index
+        self.template = template
+        self.template_name = template_name
+        self.template_id = None
+        self.traces = list(traces or [])
+        self.sequences = list(sequences or [])
+        self.name = name
+        self.task = None
+        self.alignment = None
+        self.error = None
+
+    @property
+    def ok(self) -> bool:
+        return self.alignment is not None
+
+    def __repr__(self):
+        return "<{} index={} template={!r} ok={}>".format(
+            self.__class__.__name__,
+            self.index,
+            self.template_name or self.template,
+            self.ok,
+        )
 
 
 class DNAAlignment(GetMixin, DeleteMixin, ModelBase):
@@ -364,7 +510,7 @@ class DNAAlignment(GetMixin, DeleteMixin, ModelBase):
             return seq.id
 
     @classmethod
-    def _resolve_files(cls, sequences, filepaths, rawfiles):
+    def _resolve_files(cls, sequences, filepaths, rawfiles, stream=False):
         files_list = []
         if sequences:
             for seq in sequences:
@@ -373,6 +519,15 @@ class DNAAlignment(GetMixin, DeleteMixin, ModelBase):
 
         if filepaths:
             for filepath in filepaths:
+                if stream:
+                    # encoded while the request is sent
+                    files_list.append(
+                        {
+                            "name": os.path.basename(filepath),
+                            "data": Base64File(filepath),
+                        }
+                    )
+                    continue
                 with open(filepath, "rb") as f:
                     b64data = base64.b64encode(f.read()).decode("utf-8")
                     files_list.append(
@@ -393,6 +548,8 @@ class DNAAlignment(GetMixin, DeleteMixin, ModelBase):
         filepaths: List[str] = None,
         sequences: List[Union[str, DNASequence]] = None,
         rawfiles: List[str] = None,
+        stream: bool = False,
+        max_workers: int = 1,
     ) -> Task:
         """Submit an sequence alignment task.
 
@@ -438,6 +595,11 @@ class DNAAlignment(GetMixin, DeleteMixin, ModelBase):
         :param rawfiles: optional list of raw entries to send to align to the template.
             Use this if you have base64 bytes encoded data. Take a look at Benchling
             V2 API for more information.
+        :param stream: if True, files are read and base64 encoded while the
+            request is sent instead of being held in memory (see
+            :class:`JSONStream <benchlingapi.jsonstream.JSONStream>`)
+        :param max_workers: number of files to encode concurrently when
+            streaming
         :return: Task
         """
 
@@ -445,20 +607,207 @@ class DNAAlignment(GetMixin, DeleteMixin, ModelBase):
             "name": name,
             "algorithm": algorithm,
             "templateSequenceId": cls.model_to_id(template),
-            "files": cls._resolve_files(sequences, filepaths, rawfiles),
+            "files": cls._resolve_files(sequences, filepaths, rawfiles, stream),
         }
 
         if not post_data["files"]:
             raise BenchlingAPIException("No sequences or filepaths provided.")
 
-        result = cls.session.http.post(
-            "dna-alignments", action="create-template-alignment", json=post_data
+        result = cls._post_alignment(
+            "create-template-alignment", post_data, stream, max_workers
         )
 
         inst = cls.session.Task.find(result["taskId"])
         inst.expected_class = cls
         return inst
 
+    @classmethod
+    def submit_alignments(
+        cls,
+        manifest: Iterable[Union[tuple, dict]],
+        algorithm: str = MAFFT,
+        max_workers: int = 4,
+        stream: bool = True,
+        timeout: float = 600,
+        **kwargs
+    ) -> Iterator[AlignmentJob]:
+        """Submit many template alignments and yield them as they finish.
+
+        Templates are resolved up front with one bulk lookup. Alignments are
+        then submitted `max_workers` at a time, with their trace files
+        streamed from disk (see `stream` in :meth:`submit_alignment`), and
+        all tasks are polled together by a
+        :class:`TaskPool <benchlingapi.concurrency.TaskPool>`.
+
+        .. code-block:: python
+
+            manifest = [
+                ("seq_yi2kdf2", ["A01_fwd.ab1", "A01_rev.ab1"]),
+                {"template_name": "pClone2", "traces": ["A02_fwd.ab1"]},
+            ]
+            for job in session.DNAAlignment.submit_alignments(manifest):
+                if job.ok:
+                    print(job.name, job.alignment.id)
+                else:
+                    print(job.name, job.error)
+
+        .. versionadded:: 2.2.0
+
+        :param manifest: `(template, traces)` or `(template, traces, name)`
+            tuples, or dicts with the keys `template` (or `template_name`),
+            `traces` and optionally `name` and `sequences`. Templates are
+            :class:`DNASequence` instances or sequence ids; use
+            `template_name` to look a template up by its name.
+        :param algorithm: either 'mafft' or 'clustalo'
+        :param max_workers: maximum number of concurrent submissions
+        :param stream: if True (default), stream trace files from disk
+        :param timeout: maximum time in seconds to wait for each task
+        :param kwargs: arguments for
+            :func:`poll_delays <benchlingapi.concurrency.poll_delays>`
+        :return: iterator of :class:`AlignmentJob` in the order they finish
+        """
+        jobs = [cls._alignment_job(i, entry) for i, entry in enumerate(manifest)]
+        cls._resolve_templates(jobs, max_workers)
+
+        finished = queue.Queue()
+        pool = TaskPool(timeout=timeout, max_workers=max_workers, **kwargs)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        def submit(job):
+            return cls.submit_alignment(
+                algorithm,
+                job.name,
+                job.template_id,
+                filepaths=job.traces,
+                sequences=job.sequences,
+                stream=stream,
+            )
+
+        # errors raised in future callbacks are swallowed by the executor,
+        # so every path must put the job on the queue
+        def on_finished(job, future):
+            try:
+                job.task = future.result()
+                if job.task.status == "SUCCEEDED":
+                    job.alignment = job.task.response_class or cls.load(
+                        job.task.response
+                    )
+                else:
+                    job.error = BenchlingAPIException(
+                        "Alignment {} {}: {}".format(
+                            job.name, job.task.status, job.task.message
+                        )
+                    )
+            except BaseException as e:
+                job.error = e
+            finally:
+                finished.put(job)
+
+        def on_submitted(job, future):
+            try:
+                job.task = future.result()
+                polled = pool.submit(job.task)
+            except BaseException as e:
+                job.error = e
+                finished.put(job)
+            else:
+                polled.add_done_callback(partial(on_finished, job))
+
+        submissions = []
+        try:
+            for job in jobs:
+                if job.error is not None:
+                    finished.put(job)
+                    continue
+                future = executor.submit(submit, job)
+                future.add_done_callback(partial(on_submitted, job))
+                submissions.append(future)
+            for _ in jobs:
+                yield finished.get()
+        finally:
+            # stop early if the caller does not consume all results
+            for future in submissions:
+                future.cancel()
+            executor.shutdown(wait=True)
+            pool.close()
+
+    @classmethod
+    def _alignment_job(cls, index: int, entry: Union[tuple, dict]) -> AlignmentJob:
+        if isinstance(entry, dict):
+            if ("template" in entry) == ("template_name" in entry):
+                raise BenchlingAPIException(
+                    "Manifest entry {} must have either a 'template' or a "
+                    "'template_name'.".format(index)
+                )
+            job = AlignmentJob(
+                index,
+                entry.get("template"),
+                entry.get("traces"),
+                entry.get("name"),
+                entry.get("sequences"),
+                entry.get("template_name"),
+            )
+        else:
+            job = AlignmentJob(index, *entry)
+        if job.name is None:
+            template = job.template_name or job.template
+            if not isinstance(template, str):
+                template = getattr(template, "name", None) or template.id
+            job.name = "{} alignment".format(template)
+        return job
+
+    @classmethod
+    def _resolve_templates(cls, jobs: List[AlignmentJob], max_workers: int):
+        """Set the `template_id` of the jobs, checking all template ids with
+        one bulk get and looking up all template names with one batched
+        list."""
+        dna = cls.session.DNASequence
+        ids = []
+        names = []
+        for job in jobs:
+            if job.template_name is not None:
+                names.append(job.template_name)
+            elif isinstance(job.template, str):
+                ids.append(job.template)
+            else:
+                job.template_id = job.template.id
+        missing = set(dna.get_many(ids, max_workers=max_workers).missing)
+        found = dna._merge_lookup(("name",), [(n,) for n in names], max_workers)
+        for job in jobs:
+            if job.template_id is not None:
+                continue
+            if job.template_name is None:
+                if job.template in missing:
+                    job.error = BenchlingAPIException(
+                        "Template {} not found.".format(job.template)
+                    )
+                else:
+                    job.template_id = job.template
+                continue
+            matches = found.get((job.template_name,), [])
+            if len(matches) == 1:
+                job.template_id = matches[0]
+            else:
+                job.error = BenchlingAPIException(
+                    "Found {} templates named {}.".format(
+                        len(matches), job.template_name
+                    )
+                )
+
+    @classmethod
+    def _post_alignment(cls, action: str, post_data: dict, stream, max_workers):
+        if not stream:
+            return cls.session.http.post(
+                "dna-alignments", action=action, json=post_data
+            )
+        body = JSONStream(un_underscore_keys(post_data), max_workers=max_workers)
+        return cls.session.http.post(
+            "dna-alignments",
+            action=action,
+            data=body,
+            headers={"Content-Type": "application/json"},
+        )
+
     @classmethod
     def create_consensus(
         cls,
@@ -469,6 +818,8 @@ class DNAAlignment(GetMixin, DeleteMixin, ModelBase):
         filepaths: List[str] = None,
         sequences: List[Union[str, DNASequence]] = None,
         rawfiles: List[str] = None,
+        stream: bool = False,
+        max_workers: int = 1,
     ):
         """Create a consensus sequence and save the sequence to the Benchling
         Server.
@@ -515,6 +866,11 @@ class DNAAlignment(GetMixin, DeleteMixin, ModelBase):
         :param rawfiles: optional list of raw entries to send to align to the template.
             Use this if you have base64 bytes encoded data. Take a look at Benchling
             V2 API for more information.
+        :param stream: if True, files are read and base64 encoded while the
+            request is sent instead of being held in memory (see
+            :class:`JSONStream <benchlingapi.jsonstream.JSONStream>`)
+        :param max_workers: number of files to encode concurrently when
+            streaming
         :return: Task
         """
 
@@ -522,7 +878,7 @@ class DNAAlignment(GetMixin, DeleteMixin, ModelBase):
             "name": name,
             "algorithm": algorithm,
             "templateSequenceId": cls.model_to_id(template),
-            "files": cls._resolve_files(sequences, filepaths, rawfiles),
+            "files": cls._resolve_files(sequences, filepaths, rawfiles, stream),
         }
 
         if isinstance(consensus_sequence, str):
@@ -533,8 +889,8 @@ class DNAAlignment(GetMixin, DeleteMixin, ModelBase):
         if not post_data["files"]:
             raise BenchlingAPIException("No sequences or filepaths provided.")
 
-        result = cls.session.http.post(
-            "dna-alignments", action="create-consensus-alignment", json=post_data
+        result = cls._post_alignment(
+            "create-consensus-alignment", post_data, stream, max_workers
         )
 
         inst = cls.session.Task.find(result["taskId"])
@@ -546,6 +902,26 @@ class AASequence(ModelBase, InventoryEntityMixin):
 
     ENTITY_TYPE = "aa_sequence"
     alias = "Protein"
+    HEAVY_FIELDS = ("amino_acids", "annotations")
+    SUMMARY_FIELDS = (
+        "id",
+        "name",
+        "aliases",
+        "apiURL",
+        "archiveRecord",
+        "createdAt",
+        "creator",
+        "customFields",
+        "entityRegistryId",
+        "fields",
+        "folderId",
+        "length",
+        "modifiedAt",
+        "registrationOrigin",
+        "registryId",
+        "schema",
+        "webURL",
+    )
 
     CREATE_SCHEMA = dict(
         only=(
@@ -677,6 +1053,7 @@ class Translation(ModelBase):
 class Oligo(GetMixin, CreateMixin, InventoryMixin, RegistryMixin, ModelBase):
     """A model representing an Oligo."""
 
+    BULK_GET = True
     CREATE_SCHEMA = dict(
         only=(
             "aliases",
@@ -715,15 +1092,42 @@ class Oligo(GetMixin, CreateMixin, InventoryMixin, RegistryMixin, ModelBase):
 class Folder(GetMixin, ListMixin, ArchiveMixin, ModelBase):
     """A model representing a Benchling Folder."""
 
-    def all_entities(self):
-        """Generator that retrieves all entities in the folder."""
+    LIST_FILTERS = ("name", "ids")
+
+    def all_entities(
+        self, concurrent: bool = False, ordered: bool = True, buffer_size: int = 2
+    ):
+        """Generator that retrieves all entities in the folder.
+
+        .. versionchanged:: 2.2.0
+            Added the `concurrent`, `ordered` and `buffer_size` arguments.
+
+        :param concurrent: if True, list all entity types at the same time,
+            each in its own thread.
+        :param ordered: only used if `concurrent`. If True (default), return
+            entities grouped by type, in the same order as the serial scan.
+            If False, return pages of entities as they arrive.
+        :param buffer_size: only used if `concurrent`. The number of pages to
+            buffer ahead (per entity type, if `ordered`).
+        :return: generator of entities
+        """
         entity_models = ModelRegistry.filter_models_by_base_classes(
             InventoryEntityMixin
         )
-        for model in entity_models:
-
-            interface = self.session.interface(model.__name__)
-            for m in interface.all(folder_id=self.id):
+        interfaces = [self.session.interface(model.__name__) for model in entity_models]
+        if not concurrent:
+            for interface in interfaces:
+                for m in interface.all(folder_id=self.id):
+                    yield m
+            return
+
+        pages = merge(
+            [interface.list_pages(folder_id=self.id) for interface in interfaces],
+            ordered=ordered,
+            depth=buffer_size,
+        )
+        for page in pages:
+            for m in page:
                 yield m
 
 
@@ -738,12 +1142,29 @@ class EntitySchema(ModelBase):
 
 
 class Registry(ListMixin, ModelBase):
-    """A model representing a Benchling Registry."""
+    """A model representing a Benchling Registry.
+
+    .. versionchanged:: 2.2.0
+        Registries and their entity schemas are cached on the session for
+        `Session.metadata_ttl` seconds. Use `session.invalidate_metadata()`
+        to refresh them.
+    """
+
+    LIST_FILTERS = ("name",)
+    REGISTER_SIZE = 2500  #: maximum number of entities per (un)register request
+
+    @classmethod
+    def registries(cls) -> List["Registry"]:
+        """Return all registries, using the session metadata cache.
+
+        .. versionadded:: 2.2.0
+        """
+        return list(cls.session.metadata_cache.get_or_set("registries", cls.list))
 
     @classmethod
     def get(cls, id):
         """Get registry by id."""
-        for r in cls.list():
+        for r in cls.registries():
             if r.id == id:
                 return r
 
@@ -757,17 +1178,25 @@ class Registry(ListMixin, ModelBase):
         if id:
             return cls.get(id)
         elif name:
-            return cls.find_by_name(name)
+            for r in cls.registries():
+                if r.name == name:
+                    return r
         else:
-            registries = cls.list()
+            registries = cls.registries()
             if len(registries) == 1:
                 return registries[0]
 
     @property
     def entity_schemas(self):
         """List schemas."""
-        data = self._get([self.id, "entity-schemas"])["entitySchemas"]
-        return EntitySchema.load_many(data)
+
+        def fetch():
+            data = self._get([self.id, "entity-schemas"])["entitySchemas"]
+            return EntitySchema.load_many(data)
+
+        return list(
+            self.session.metadata_cache.get_or_set(("entity_schemas", self.id), fetch)
+        )
 
     def get_schema(self, name: str = None, id: str = None):
         """Get the schema of the registry.
@@ -787,7 +1216,7 @@ class Registry(ListMixin, ModelBase):
     @classmethod
     def find_from_schema_id(cls, schema_id):
         """Find registry from a schema id."""
-        for r in cls.list():
+        for r in cls.registries():
             for schema in r.entity_schemas:
                 if schema["id"] == schema_id:
                     return r
@@ -808,6 +1237,90 @@ class Registry(ListMixin, ModelBase):
         data = {"entity_ids": entity_ids, "folder_id": folder_id}
         return cls._post(data, path_params=[registry_id], action="unregister-entities")
 
+    @classmethod
+    def register_many(
+        cls,
+        registry_id: str,
+        entity_ids: List[str],
+        naming_strategy: str = RegistryMixin.NAMING_STRATEGY.DEFAULT,
+        chunk_size: int = None,
+        max_workers: int = 4,
+        every_seconds: float = None,
+        timeout: float = 600,
+    ) -> BulkResult:
+        """Register many entities by their ids.
+
+        Ids are split into chunks of `chunk_size` that are submitted
+        concurrently, and any resulting tasks are polled together.
+
+        .. versionadded:: 2.2.0
+
+        :param registry_id: the registry id
+        :param entity_ids: the entity ids
+        :param naming_strategy: naming strategy for the registry
+        :param chunk_size: number of entities per request (default
+            :attr:`REGISTER_SIZE`)
+        :param max_workers: maximum number of concurrent requests
+        :param every_seconds: fixed time interval to check the tasks (default:
+            start fast and back off)
+        :param timeout: maximum time in seconds to wait for the tasks
+        :return: list of the entity ids, with None for entities that failed.
+            Errors are listed by index in `result.errors`.
+        """
+
+        def submit(start, stop):
+            return cls.register(
+                registry_id, entity_ids[start:stop], naming_strategy=naming_strategy
+            )
+
+        return cls._submit_entity_ids(
+            submit, entity_ids, chunk_size, max_workers, every_seconds, timeout
+        )
+
+    @classmethod
+    def unregister_many(
+        cls,
+        registry_id: str,
+        entity_ids: List[str],
+        folder_id: str,
+        chunk_size: int = None,
+        max_workers: int = 4,
+        every_seconds: float = None,
+        timeout: float = 600,
+    ) -> BulkResult:
+        """Unregister many entities by their ids and move them to a folder.
+
+        See :meth:`register_many`.
+
+        .. versionadded:: 2.2.0
+        """
+
+        def submit(start, stop):
+            return cls.unregister(registry_id, entity_ids[start:stop], folder_id)
+
+        return cls._submit_entity_ids(
+            submit, entity_ids, chunk_size, max_workers, every_seconds, timeout
+        )
+
+    @classmethod
+    def _submit_entity_ids(
+        cls, submit, entity_ids, chunk_size, max_workers, every_seconds, timeout
+    ) -> BulkResult:
+        entity_ids = list(entity_ids)
+        _, errors = submit_chunks(
+            cls.session,
+            submit,
+            len(entity_ids),
+            chunk_size or cls.REGISTER_SIZE,
+            max_workers=max_workers,
+            every_seconds=every_seconds,
+            timeout=timeout,
+        )
+        return BulkResult(
+            [None if i in errors else id for i, id in enumerate(entity_ids)],
+            errors=errors,
+        )
+
     def register_entities(self, entity_ids: List[str], naming_strategy: str = None):
         """Register entities by their ids."""
         return self.register(self.id, entity_ids, naming_strategy=naming_strategy)
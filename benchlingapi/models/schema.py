@@ -37,7 +37,10 @@ class ModelSchemaMixin:
         if "session" not in self.context:
             raise Exception("Schema does not have a Session instance attached!")
         session = self.context["session"]
-        return session.interface(self.get_model_name())(**data)
+        interface = session.interface(self.get_model_name())
+        if self.context.get("compact"):
+            return interface._compact_record_class().from_dict(data)
+        return interface(**data)
 
 
 class EntitySchema(Schema):
@@ -0,0 +1,202 @@
+r"""
+Rate limiting (:mod:`benchlingapi.ratelimit`)
+=============================================
+
+.. currentmodule:: benchlingapi.ratelimit
+
+Client-side token bucket rate limiters. A rate limiter smooths requests
+to a requests-per-second budget before they reach the Benchling server.
+
+.. code-block:: python
+
+    from benchlingapi import Session
+    from benchlingapi.ratelimit import TokenBucket
+
+    session = Session(api_key, rate_limiter=TokenBucket(rate=10))
+
+To share one budget between processes on the same host, use a
+:class:`FileTokenBucket` with the same path in every process, or create a
+:class:`SharedMemoryTokenBucket` before starting worker processes.
+
+.. versionadded:: 2.2.0
+    Added :class:`TokenBucket`, :class:`FileTokenBucket` and
+    :class:`SharedMemoryTokenBucket`
+"""
+import multiprocessing
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+
+from benchlingapi.exceptions import BenchlingAPIException
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover (windows)
+    fcntl = None
+
+
+class TokenBucket:
+    """A thread-safe token bucket.
+
+    Tokens refill at `rate` tokens per second up to `burst` tokens. Each
+    request takes one token. When the bucket is empty, callers are queued
+    and wait for their turn, so requests are spread evenly over time.
+
+    :param rate: requests per second
+    :param burst: maximum number of requests that may be sent at once
+        (defaults to `rate`)
+    """
+
+    def __init__(self, rate: float, burst: float = None):
+        if rate <= 0:
+            raise BenchlingAPIException("Rate must be greater than zero.")
+        if burst is None:
+            burst = max(1.0, rate)
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._lock = threading.Lock()
+        self._state = None
+        self._store(self.burst, self._now())
+        self.waits = 0  #: number of requests that had to wait
+        self.waited = 0.0  #: total seconds spent waiting
+
+    @staticmethod
+    def _now() -> float:
+        return time.monotonic()
+
+    @contextmanager
+    def _locked(self):
+        with self._lock:
+            yield
+
+    def _load(self):
+        return self._state
+
+    def _store(self, tokens: float, timestamp: float):
+        self._state = (tokens, timestamp)
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens from the bucket and return the number of seconds to wait
+        before using them."""
+        with self._locked():
+            available, last = self._load()
+            now = self._now()
+            available = min(self.burst, available + max(0.0, now - last) * self.rate)
+            available -= tokens
+            self._store(available, now)
+            if available >= 0:
+                return 0.0
+            delay = -available / self.rate
+            self.waits += 1
+            self.waited += delay
+        return delay
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Block until `tokens` are available. Returns the seconds waited."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def __repr__(self):
+        return "<{} rate={} burst={}>".format(
+            self.__class__.__name__, self.rate, self.burst
+        )
+
+
+class FileTokenBucket(TokenBucket):
+    """A token bucket shared by all processes that use the same file.
+
+    The bucket state is kept in a small file that is locked with `flock`
+    on every request. Only available on POSIX systems.
+
+    :param path: path to the state file (created if it does not exist)
+    :param rate: requests per second
+    :param burst: maximum number of requests that may be sent at once
+    """
+
+    _FORMAT = "dd"
+
+    def __init__(self, path: str, rate: float, burst: float = None):
+        if fcntl is None:
+            raise BenchlingAPIException(
+                "{} requires file locking (fcntl), which is not available on this "
+                "platform.".format(self.__class__.__name__)
+            )
+        self.path = path
+        self._fd = None
+        super().__init__(rate, burst=burst)
+
+    @staticmethod
+    def _now() -> float:
+        # monotonic clocks are not comparable between processes
+        return time.time()
+
+    @contextmanager
+    def _locked(self):
+        with self._lock:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                self._fd = fd
+                yield
+            finally:
+                self._fd = None
+                os.close(fd)
+
+    def _load(self):
+        data = os.pread(self._fd, struct.calcsize(self._FORMAT), 0)
+        if len(data) != struct.calcsize(self._FORMAT):
+            return self.burst, self._now()
+        return struct.unpack(self._FORMAT, data)
+
+    def _store(self, tokens: float, timestamp: float):
+        if self._fd is None:
+            # initial state; the file is left untouched until first use
+            return
+        os.pwrite(self._fd, struct.pack(self._FORMAT, tokens, timestamp), 0)
+
+
+class SharedMemoryTokenBucket(TokenBucket):
+    """A token bucket kept in shared memory.
+
+    Create the bucket in the parent process and pass it to (or inherit it in)
+    worker processes started with :mod:`multiprocessing`.
+
+    :param rate: requests per second
+    :param burst: maximum number of requests that may be sent at once
+    :param ctx: optional multiprocessing context
+    """
+
+    def __init__(self, rate: float, burst: float = None, ctx=None):
+        if ctx is None:
+            ctx = multiprocessing
+        self._shared = ctx.Array("d", 2)
+        super().__init__(rate, burst=burst)
+
+    @staticmethod
+    def _now() -> float:
+        return time.time()
+
+    @contextmanager
+    def _locked(self):
+        with self._shared.get_lock():
+            yield
+
+    def _load(self):
+        return self._shared[0], self._shared[1]
+
+    def _store(self, tokens: float, timestamp: float):
+        self._shared[0] = tokens
+        self._shared[1] = timestamp
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
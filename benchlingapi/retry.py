@@ -0,0 +1,174 @@
+r"""
+Retry (:mod:`benchlingapi.retry`)
+=================================
+
+.. currentmodule:: benchlingapi.retry
+
+Retry policies for throttled or temporarily unavailable requests.
+
+.. versionadded:: 2.2.0
+    Added :class:`RetryPolicy` and :class:`RetryStats`
+"""
+import random
+import threading
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable
+
+
+class RetryStats:
+    """Thread-safe counter of retried requests."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.gave_up = 0
+        self.by_status = {}
+
+    def record_retry(self, status_code: int):
+        with self._lock:
+            self.retries += 1
+            self.by_status[status_code] = self.by_status.get(status_code, 0) + 1
+
+    def record_give_up(self):
+        with self._lock:
+            self.gave_up += 1
+
+    def reset(self):
+        """Reset the counters to zero."""
+        with self._lock:
+            self.retries = 0
+            self.gave_up = 0
+            self.by_status = {}
+
+    def as_dict(self) -> dict:
+        return {
+            "retries": self.retries,
+            "gave_up": self.gave_up,
+            "by_status": dict(self.by_status),
+        }
+
+    def __repr__(self):
+        return "<{} retries={} gave_up={}>".format(
+            self.__class__.__name__, self.retries, self.gave_up
+        )
+
+
+class RetryPolicy:
+    """Decides whether and when to retry a failed request.
+
+    Retries use exponential backoff with full jitter, i.e. the n-th retry
+    waits a random time between 0 and
+    `min(max_backoff, backoff_factor * 2 ** n)` seconds. If the server sends a
+    `Retry-After` header, that delay (capped at `max_backoff`) is used instead.
+
+    .. code-block:: python
+
+        from benchlingapi import Session
+        from benchlingapi.retry import RetryPolicy
+
+        session = Session(api_key, retry_policy=RetryPolicy(max_retries=10))
+        for dna in session.DNASequence.all():
+            pass
+        print(session.retry_policy.stats)
+
+    :param max_retries: maximum number of retries per request. Use 0 to disable
+        retries.
+    :param backoff_factor: base delay in seconds
+    :param max_backoff: maximum delay in seconds between two attempts
+    :param jitter: if True (default), randomize the delays
+    :param status_codes: response status codes to retry
+    :param methods: HTTP methods to retry. Defaults to idempotent methods only.
+    :param respect_retry_after: if True (default), wait as long as the
+        `Retry-After` response header requests, up to `max_backoff` seconds.
+    """
+
+    RETRY_STATUS_CODES = frozenset([429, 503, 504])  #: status codes retried by default
+    IDEMPOTENT_METHODS = frozenset(
+        ["GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"]
+    )  #: HTTP methods retried by default
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        jitter: bool = True,
+        status_codes: Iterable[int] = None,
+        methods: Iterable[str] = None,
+        respect_retry_after: bool = True,
+    ):
+        if status_codes is None:
+            status_codes = self.RETRY_STATUS_CODES
+        if methods is None:
+            methods = self.IDEMPOTENT_METHODS
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.respect_retry_after = respect_retry_after
+        self.stats = RetryStats()
+
+    def is_retryable(self, method: str, status_code: int) -> bool:
+        """Return whether a response with this method and status may be
+        retried."""
+        return method.upper() in self.methods and status_code in self.status_codes
+
+    def should_retry(self, response, attempt: int) -> bool:
+        """Return whether to retry the response after `attempt` retries."""
+        if not self.is_retryable(response.request.method, response.status_code):
+            return False
+        if attempt >= self.max_retries:
+            self.stats.record_give_up()
+            return False
+        return True
+
+    @staticmethod
+    def parse_retry_after(value: str) -> float:
+        """Parse a `Retry-After` header (either seconds or an HTTP date)."""
+        if value is None:
+            return None
+        value = value.strip()
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if date.tzinfo is None:
+            # dates with a "-0000" offset are parsed as naive UTC datetimes
+            date = date.replace(tzinfo=timezone.utc)
+        return max(0.0, date.timestamp() - time.time())
+
+    def get_backoff(self, attempt: int) -> float:
+        """Return the backoff delay in seconds for the n-th retry."""
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def get_delay(self, response, attempt: int) -> float:
+        """Return how long to wait before retrying the response."""
+        if self.respect_retry_after:
+            retry_after = self.parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(self.max_backoff, retry_after)
+        return self.get_backoff(attempt)
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+    def wait(self, response, attempt: int):
+        """Record the retry and sleep until the next attempt."""
+        self.stats.record_retry(response.status_code)
+        self.sleep(self.get_delay(response, attempt))
+
+    def __repr__(self):
+        return "<{} max_retries={} backoff_factor={}>".format(
+            self.__class__.__name__, self.max_retries, self.backoff_factor
+        )
@@ -35,65 +35,107 @@ You may also specify the homespace directly:
     home = "https://myorganization.benchling.com/api/v2"
     session = Session(api_key, home=home)
 
+When sharing a session between many threads, size the connection pool
+so that every thread can re-use an open connection:
+
+.. code-block:: python
+
+    session = Session(api_key, pool_maxsize=32, pool_block=True)
+
+    # ... after running requests
+    print(session.pool_stats)
+
 For more information on the models and their methods, see the
 :ref:`API model docs <api_models>`
 """
 from functools import partial
 from functools import wraps
 from typing import Any
+from typing import Dict
 from typing import Generator
+from typing import Iterator
 from typing import List
 from typing import Type
 
 import requests
 
+from benchlingapi.adapters import PooledHTTPAdapter
+from benchlingapi.adapters import PoolStats
+from benchlingapi.cache import TTLCache
+from benchlingapi.concurrency import Prefetcher
 from benchlingapi.exceptions import BenchlingAPIException
 from benchlingapi.exceptions import exception_dispatch
 from benchlingapi.exceptions import ModelNotFoundError
+from benchlingapi.httpcache import CachedResponse
+from benchlingapi.httpcache import ResponseCache
+from benchlingapi.mirror import LocalMirror
 from benchlingapi.models.base import ModelBase
 from benchlingapi.models.base import ModelRegistry
 from benchlingapi.models.models import __all__ as allmodels
+from benchlingapi.ratelimit import TokenBucket
+from benchlingapi.retry import RetryPolicy
 from benchlingapi.utils import un_underscore_keys
 from benchlingapi.utils import url_build
 
 
 class RequestDecorator:
-    """Wraps a function to raise error with unexpected request status codes."""
+    """Wraps a function to raise error with unexpected request status codes.
 
-    def __init__(self, status_codes):
+    .. versionchanged:: 2.2.0
+        Added the `retry_policy` argument. Retryable responses (e.g. 429) are
+        retried according to the policy before raising.
+    """
+
+    def __init__(self, status_codes, retry_policy: RetryPolicy = None):
         if not isinstance(status_codes, list):
             status_codes = [status_codes]
         self.code = status_codes
+        self.retry_policy = retry_policy
 
     def __call__(self, f):
         @wraps(f)
         def wrapped_f(*args, **kwargs):
             r = f(*args, **kwargs)
+            attempt = 0
+            while (
+                r.status_code not in self.code
+                and self.retry_policy is not None
+                and self.retry_policy.should_retry(r, attempt)
+            ):
+                self.retry_policy.wait(r, attempt)
+                attempt += 1
+                r = f(*args, **kwargs)
             if r.status_code not in self.code:
-                http_codes = {
-                    400: "BAD REQUEST",
-                    403: "FORBIDDEN",
-                    404: "NOT FOUND",
-                    500: "INTERNAL SERVER ERROR",
-                    503: "SERVICE UNAVAILABLE",
-                    504: "SERVER TIMEOUT",
-                }
-                msg = ""
-                if r.status_code in http_codes:
-                    msg = http_codes[r.status_code]
-                    msg += "\nrequest: {}".format(r.request)
-                    msg += "\nurl: {}".format(r.request.path_url)
-                    msg += "\nresponse: {}".format(r.text)
-
-                e = BenchlingAPIException(
-                    "HTTP Response Failed {} {}".format(r.status_code, msg)
-                )
-                e.response = r
-                exception_dispatch(e)
+                self.raise_for_response(r)
             return r.json()
 
         return wrapped_f
 
+    @staticmethod
+    def raise_for_response(r):
+        """Raise the exception for an unexpected response."""
+        http_codes = {
+            400: "BAD REQUEST",
+            403: "FORBIDDEN",
+            404: "NOT FOUND",
+            429: "TOO MANY REQUESTS",
+            500: "INTERNAL SERVER ERROR",
+            503: "SERVICE UNAVAILABLE",
+            504: "SERVER TIMEOUT",
+        }
+        msg = ""
+        if r.status_code in http_codes:
+            msg = http_codes[r.status_code]
+            msg += "\nrequest: {}".format(r.request)
+            msg += "\nurl: {}".format(r.request.path_url)
+            msg += "\nresponse: {}".format(r.text)
+
+        e = BenchlingAPIException(
+            "HTTP Response Failed {} {}".format(r.status_code, msg)
+        )
+        e.response = r
+        exception_dispatch(e)
+
 
 class Http:
     """Creates and responds to the Benchling server."""
@@ -103,25 +145,93 @@ class Http:
         "https://benchling.com/api/v2"
     )  #: default home url to use if not provided.
     NEXT = "nextToken"  #: nextToken key for pagination
-
-    def __init__(self, api_key, home=None):
+    POOL_CONNECTIONS = 10  #: default number of per-host connection pools to keep
+    POOL_MAXSIZE = 32  #: default number of connections to keep open per host
+    PREFETCH = 0  #: default number of pages to fetch ahead in `get_pages`
+
+    def __init__(
+        self,
+        api_key,
+        home=None,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy = None,
+        rate_limiter: TokenBucket = None,
+        response_cache: ResponseCache = None,
+    ):
         """
 
         .. versionchanged:: 2.1.12
-            Ad
-        :param api_key:
-        :param home:
+            Added the `home` argument.
+
+        .. versionchanged:: 2.2.0
+            Added connection pool and keep-alive settings and the
+            `retry_policy`, `rate_limiter` and `response_cache` arguments.
+
+        :param api_key: Benchling provided api_key
+        :param home: home url
+        :param pool_connections: number of per-host connection pools to keep
+        :param pool_maxsize: maximum number of connections kept open per host.
+            Set this to at least the number of threads sharing the session.
+        :param pool_block: if True, limit the number of connections per host
+            to `pool_maxsize`; extra requests wait for a free connection.
+        :param keep_alive: if True (default) re-use connections and enable TCP
+            keep-alive. If False, every request opens a new connection.
+        :param retry_policy: policy for retrying throttled and unavailable
+            requests. If not provided, a default :class:`RetryPolicy
+            <benchlingapi.retry.RetryPolicy>` is used.
+        :param rate_limiter: optional :class:`TokenBucket
+            <benchlingapi.ratelimit.TokenBucket>` that every request must
+            acquire a token from before it is sent.
+        :param response_cache: optional :class:`ResponseCache
+            <benchlingapi.httpcache.ResponseCache>` used to revalidate GET
+            requests with conditional headers
         """
         if home is None:
             home = self.DEFAULT_HOME
+        if pool_connections is None:
+            pool_connections = self.POOL_CONNECTIONS
+        if pool_maxsize is None:
+            pool_maxsize = self.POOL_MAXSIZE
         session = requests.Session()
         session.auth = (api_key, "")
+        adapter = PooledHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
         self._home = home
+        self._adapter = adapter
         self.__session = session
-        self.post = RequestDecorator([200, 201, 202])(partial(self.request, "post"))
-        self.get = RequestDecorator(200)(partial(self.request, "get"))
-        self.delete = RequestDecorator(200)(partial(self.request, "delete"))
-        self.patch = RequestDecorator([200, 201])(partial(self.request, "patch"))
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        if retry_policy is None:
+            retry_policy = RetryPolicy()
+        self.retry_policy = retry_policy
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Return the retry policy used for requests."""
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, policy: RetryPolicy):
+        self._retry_policy = policy
+        self.post = RequestDecorator([200, 201, 202], policy)(
+            partial(self.request, "post")
+        )
+        self.get = RequestDecorator(200, policy)(partial(self.request, "get"))
+        self.delete = RequestDecorator(200, policy)(partial(self.request, "delete"))
+        self.patch = RequestDecorator([200, 201], policy)(
+            partial(self.request, "patch")
+        )
 
     def request(
         self, method: str, path: str, timeout: int = None, action: str = None, **kwargs
@@ -136,14 +246,84 @@ class Http:
             timeout = self.TIMEOUT
         if action is not None:
             path += ":" + action
-        return self.__session.request(
-            method, url_build(self._home, path), timeout=timeout, **kwargs
-        )
+        url = url_build(self._home, path)
+        if self.response_cache is not None:
+            return self._cached_request(method, url, timeout=timeout, **kwargs)
+        return self._send(method, url, timeout=timeout, **kwargs)
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return self.__session.request(method, url, **kwargs)
+
+    def _cached_request(self, method: str, url: str, **kwargs) -> requests.Response:
+        cache = self.response_cache
+        key = cache.key("get", url, kwargs.get("params"))
+        if method.lower() != "get":
+            # writes make the cached GET of the same resource stale
+            cache.delete(key)
+            return self._send(method, url, **kwargs)
+        entry = cache.get(key)
+        if entry is not None:
+            headers = dict(kwargs.pop("headers", None) or {})
+            headers.update(entry.validators())
+            kwargs["headers"] = headers
+        r = self._send(method, url, **kwargs)
+        if r.status_code == 304 and entry is not None:
+            cache.record_hit()
+            return entry.to_response(r)
+        if r.status_code == 200:
+            if entry is not None:
+                cache.record_miss()
+            new_entry = CachedResponse.from_response(r)
+            if new_entry.is_revalidatable():
+                cache.set(key, new_entry)
+                cache.record_store()
+        return r
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """Return the connection pool hit and miss counter."""
+        return self._adapter.pool_stats
+
+    def mount(self, prefix: str, adapter: requests.adapters.BaseAdapter):
+        """Mount a custom transport adapter for urls starting with `prefix`."""
+        self.__session.mount(prefix, adapter)
 
     def get_pages(
+        self,
+        path: str,
+        timeout: int = None,
+        action: str = None,
+        prefetch: int = None,
+        **kwargs
+    ) -> Iterator[Any]:
+        """Return an iterator over all pages of a list endpoint.
+
+        .. versionchanged:: 2.2.0
+            Added the `prefetch` argument.
+
+        :param path: the url path
+        :param timeout: request timeout
+        :param action: optional path action
+        :param prefetch: number of pages to fetch ahead in a background thread
+            while the current page is being processed. Defaults to
+            :attr:`PREFETCH` (no prefetching).
+        :param kwargs: additional request arguments (e.g. `params`)
+        :return: iterator of page responses
+        """
+        if prefetch is None:
+            prefetch = self.PREFETCH
+        pages = self._get_pages(path, timeout=timeout, action=action, **kwargs)
+        if prefetch:
+            return Prefetcher(pages, depth=prefetch)
+        return pages
+
+    def _get_pages(
         self, path: str, timeout: int = None, action: str = None, **kwargs
     ) -> Generator[Any, None, None]:
         get_response = partial(self.get, path, timeout=timeout, action=action)
+        kwargs["params"] = dict(kwargs.get("params", None) or {})
 
         response = get_response(**kwargs)
 
@@ -152,7 +332,7 @@ class Http:
 
             # update params with nextToken
             next = response.get(self.NEXT, None)
-            kwargs.get("params", {}).update({self.NEXT: next})
+            kwargs["params"].update({self.NEXT: next})
 
             if next:
                 response = get_response(**kwargs)
@@ -166,7 +346,23 @@ class Session:
     This serves as the main interface for using the BenchlingAPI.
     """
 
-    def __init__(self, api_key: str, org: str = None, home: str = None):
+    def __init__(
+        self,
+        api_key: str,
+        org: str = None,
+        home: str = None,
+        pool_connections: int = None,
+        pool_maxsize: int = None,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        retry_policy: RetryPolicy = None,
+        rate_limiter: TokenBucket = None,
+        fast_load: bool = False,
+        metadata_ttl: float = 300,
+        identity_map: TTLCache = None,
+        response_cache: ResponseCache = None,
+        mirror: LocalMirror = None,
+    ):
         """
         Initialize a new Benchling API Session.
 
@@ -174,15 +370,65 @@ class Session:
             Added the `org` and `home` arguments to give users more control
             over homespace.
 
+        .. versionchanged:: 2.2.0
+            Added the `pool_connections`, `pool_maxsize`, `pool_block`,
+            `keep_alive`, `retry_policy`, `rate_limiter`, `fast_load`,
+            `metadata_ttl`, `identity_map`, `response_cache` and `mirror`
+            arguments.
+
         :param api_key: Benchling provided api_key
         :param org: optional org name. If provided, sets home URL
             to `https://{home}.benchling.com/api/v2`
         :param home: optional home name. If not provided, sets home
             to `https://benchling.com/api/v2`. See `org` argument.
+        :param pool_connections: number of per-host connection pools to keep
+        :param pool_maxsize: maximum number of connections kept open per host.
+            When sharing a session across threads, set this to at least the
+            number of threads.
+        :param pool_block: if True, limit the number of connections per host
+            to `pool_maxsize`
+        :param keep_alive: if True (default) re-use open connections between
+            requests
+        :param retry_policy: policy for retrying throttled (429) and unavailable
+            (503, 504) requests. By default, idempotent requests are retried up
+            to 5 times with exponential backoff.
+        :param rate_limiter: optional client-side rate limiter, e.g.
+            `TokenBucket(rate=10)` for at most 10 requests per second. See
+            :mod:`benchlingapi.ratelimit` for limiters shared between
+            processes.
+        :param fast_load: if True, load models with precompiled loaders
+            instead of marshmallow. See :mod:`benchlingapi.models.fastload`.
+        :param metadata_ttl: seconds to cache registries and entity schemas
+            (default 5 minutes). None caches forever, 0 disables caching. See
+            :meth:`invalidate_metadata`.
+        :param identity_map: optional cache of loaded models by id, e.g.
+            `TTLCache(ttl=60, maxsize=10000)`. Models returned by `list`, `get`,
+            `create` and `update` are stored in it, and `get`/`find` return the
+            cached instance instead of re-fetching it. `reload` always fetches.
+        :param response_cache: optional HTTP response cache. Cached GET
+            responses are revalidated with the server, so unchanged entities
+            cost a round-trip but no body transfer. See
+            :mod:`benchlingapi.httpcache`.
+        :param mirror: optional local mirror of entities. See :meth:`sync` and
+            :mod:`benchlingapi.mirror`.
         """
         if org:
             home = "https://{org}.benchling.com/api/v2".format(org=org)
-        self.__http = Http(api_key, home=home)
+        self.__http = Http(
+            api_key,
+            home=home,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            response_cache=response_cache,
+        )
+        self.fast_load = fast_load
+        self.metadata_cache = TTLCache(ttl=metadata_ttl)
+        self.identity_map = identity_map
+        self.mirror = mirror
         self.__interfaces = {}
         for model_name in allmodels:
             model_cls = ModelRegistry.get_model(model_name)
@@ -201,6 +447,38 @@ class Session:
         """Return home benchling url."""
         return self.__http._home
 
+    @property
+    def pool_stats(self) -> PoolStats:
+        """Return the connection pool hit and miss counter."""
+        return self.__http.pool_stats
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        """Return the retry policy. See `retry_policy.stats` for retry counts."""
+        return self.__http.retry_policy
+
+    def sync(self, models: List[str] = None) -> Dict[str, int]:
+        """Bring the local mirror up to date with the server.
+
+        .. versionadded:: 2.2.0
+
+        :param models: names of models to sync (default: all mirrored models)
+        :return: number of records written per model
+        """
+        if self.mirror is None:
+            raise BenchlingAPIException(
+                "Session has no mirror. Create the session with "
+                "`Session(api_key, mirror=LocalMirror(path))`."
+            )
+        return self.mirror.sync(self, models)
+
+    def invalidate_metadata(self):
+        """Clear cached registries and entity schemas.
+
+        .. versionadded:: 2.2.0
+        """
+        self.metadata_cache.invalidate()
+
     def help(self):
         """Print api documentation url."""
         help_url = "https://docs.benchling.com/reference"
@@ -5,44 +5,152 @@ Utilities (:mod:`benchlingapi.utils`)
 .. currentmodule:: benchlingapi.utils
 
 """
+from functools import lru_cache
+from itertools import islice
+
 import inflection
 
+#: maximum number of converted keys to remember (per direction)
+KEY_CACHE_SIZE = 4096
+
 
 def url_build(*parts):
     """Join parts of a url into a string."""
     return "/".join(p.strip("/") for p in parts)
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def underscore(k):
-    """Transform keys like 'benchlingKey' to 'benchling_key'."""
+    """Transform keys like 'benchlingKey' to 'benchling_key'.
+
+    .. versionchanged:: 2.2.0
+        Results are cached. See :func:`key_cache_info`.
+    """
     return inflection.underscore(k)
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def un_underscore(k):
-    """Transform keys like 'benchling_key' to 'benchlingKey'."""
+    """Transform keys like 'benchling_key' to 'benchlingKey'.
+
+    .. versionchanged:: 2.2.0
+        Results are cached. See :func:`key_cache_info`.
+    """
     s = inflection.camelize(k)
     s = s[0].lower() + s[1:]
     return s
 
 
-def _recursive_apply_to_keys(data, func, self_func):
-    new_data = {}
-    if data is not None:
-        for k, v in data.items():
-            if isinstance(v, dict):
-                new_data[func(k)] = self_func(v)
-            else:
-                new_data[func(k)] = v
-        return new_data
-    return data
+def key_cache_info() -> dict:
+    """Return hit and miss counts of the key conversion caches.
+
+    .. versionadded:: 2.2.0
+    """
+    return {
+        "underscore": underscore.cache_info(),
+        "un_underscore": un_underscore.cache_info(),
+    }
+
+
+def key_cache_clear():
+    """Clear the key conversion caches.
+
+    .. versionadded:: 2.2.0
+    """
+    underscore.cache_clear()
+    un_underscore.cache_clear()
+
+
+#: keys whose values are passed through untransformed by
+#: :func:`transform_keys` (their keys are user-defined field names)
+OPAQUE_KEYS = frozenset(["fields", "custom_fields", "customFields"])
+
+
+def transform_keys(data, func, opaque=OPAQUE_KEYS):
+    """Transform the keys of all dicts in `data`, including dicts nested in
+    lists.
+
+    The transformation is iterative, so deeply nested data does not hit the
+    recursion limit. Containers whose keys (and contents) are unchanged are
+    returned as-is rather than copied, so the result may share structure
+    with `data`.
+
+    .. versionadded:: 2.2.0
+
+    :param data: a dict, list or other value
+    :param func: function applied to each key
+    :param opaque: keys whose values are returned untransformed
+    :return: the transformed data
+    """
+    if not isinstance(data, (dict, list)):
+        return data
+    # frame: [source, item iterator, output (None until a change), position,
+    #         key of the child being transformed]
+    stack = [[data, _iter_items(data), None, 0, None]]
+    result = data
+    while stack:
+        frame = stack[-1]
+        src, items = frame[0], frame[1]
+        for key, value in items:
+            new_key = key if key is None else func(key)
+            if isinstance(value, (dict, list)) and key not in opaque:
+                frame[4] = (key, new_key, value)
+                stack.append([value, _iter_items(value), None, 0, None])
+                break
+            _set_item(frame, key, new_key, value, value)
+        else:
+            stack.pop()
+            result = src if frame[2] is None else frame[2]
+            if stack:
+                parent = stack[-1]
+                key, new_key, value = parent[4]
+                _set_item(parent, key, new_key, value, result)
+    return result
+
+
+def _iter_items(data):
+    if isinstance(data, dict):
+        return iter(data.items())
+    return ((None, v) for v in data)
+
+
+def _set_item(frame, key, new_key, value, new_value):
+    out = frame[2]
+    if out is None and (new_key != key or new_value is not value):
+        src, pos = frame[0], frame[3]
+        if isinstance(src, dict):
+            out = dict(islice(src.items(), pos))
+        else:
+            out = src[:pos]
+        frame[2] = out
+    if out is not None:
+        if key is None:
+            out.append(new_value)
+        else:
+            out[new_key] = new_value
+    frame[3] += 1
 
 
 def underscore_keys(data):
-    """Recursively transform keys to underscore format."""
-    return _recursive_apply_to_keys(data, underscore, underscore_keys)
+    """Recursively transform keys to underscore format.
+
+    .. versionchanged:: 2.2.0
+        Also transforms dicts nested in lists, and leaves the keys of
+        :data:`OPAQUE_KEYS` values (user-defined field names) untouched.
+    """
+    if data is None:
+        return data
+    return transform_keys(data, underscore)
 
 
 def un_underscore_keys(data):
     """Recursively un-transfrom keys from underscore format to benchling
-    format."""
-    return _recursive_apply_to_keys(data, un_underscore, underscore_keys)
+    format.
+
+    .. versionchanged:: 2.2.0
+        Nested keys are now transformed to benchling format as well (they
+        were previously transformed to underscore format).
+    """
+    if data is None:
+        return data
+    return transform_keys(data, un_underscore)
@@ -0,0 +1,55 @@
+"""Compare the memory used by models and compact records for a registry
+snapshot.
+
+Usage::
+
+    python profiling/bench_compact.py [n_records]
+"""
+import gc
+import sys
+import tracemalloc
+
+from bench_fastload import dna_record
+
+from benchlingapi import Session
+
+
+def measure(load):
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main(n=10000):
+    session = Session("fake_key", fast_load=True)
+    pages = [[dna_record(i) for i in range(j, j + 100)] for j in range(0, n, 100)]
+    for label, kwargs in (
+        ("models (raw kept)", {}),
+        ("models (no raw)", {"keep_raw": False}),
+        ("compact records", {"compact": True}),
+    ):
+
+        def load():
+            # pages are discarded after loading, as in `ListMixin.all`
+            return [
+                m
+                for page in pages
+                for m in session.DNASequence.load_many(
+                    [dict(d) for d in page], **kwargs
+                )
+            ]
+
+        records, size = measure(load)
+        print(
+            "{:20} {:8.1f} MB  {:6.0f} bytes/record".format(
+                label, size / 1e6, size / len(records)
+            )
+        )
+        del records
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,67 @@
+"""Compare marshmallow and precompiled loading of a page of DNA
+sequences.
+
+Usage::
+
+    python profiling/bench_fastload.py [n_records]
+"""
+import sys
+import timeit
+
+from benchlingapi import Session
+
+
+def dna_record(i):
+    return {
+        "id": "seq_{}".format(i),
+        "name": "seq{}".format(i),
+        "bases": "AGTC" * 250,
+        "isCircular": False,
+        "folderId": "lib_1234",
+        "length": 1000,
+        "customFields": {"Note": {"value": "hello"}},
+        "fields": {"Marker": {"value": "KanR", "type": "text"}},
+        "aliases": [],
+        "annotations": [
+            {
+                "start": j * 10,
+                "end": j * 10 + 9,
+                "name": "feature{}".format(j),
+                "strand": 1,
+                "type": "misc_feature",
+                "color": "#FFFFFF",
+            }
+            for j in range(10)
+        ],
+        "translations": [],
+        "primers": [],
+        "archiveRecord": None,
+        "entityRegistryId": None,
+        "registryId": None,
+        "schema": None,
+        "creator": {"handle": "user", "id": "ent_1234", "name": "User"},
+        "createdAt": "2019-01-01T00:00:00.000000+00:00",
+        "modifiedAt": "2019-01-01T00:00:00.000000+00:00",
+        "webURL": "https://benchling.com/",
+    }
+
+
+def main(n=1000, repeat=5):
+    data = [dna_record(i) for i in range(n)]
+    for fast_load in (False, True):
+        session = Session("fake_key", fast_load=fast_load)
+        session.DNASequence.load_many(data[:1])  # compile
+        best = min(
+            timeit.repeat(
+                lambda: session.DNASequence.load_many(data), number=1, repeat=repeat
+            )
+        )
+        print(
+            "fast_load={!s:5}  {:8.1f} ms  {:8.0f} records/s".format(
+                fast_load, best * 1000, n / best
+            )
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
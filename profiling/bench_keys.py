@@ -0,0 +1,38 @@
+"""Time key-case conversion of a page of DNA sequences with and without
+the key conversion cache.
+
+Usage::
+
+    python profiling/bench_keys.py [n_records]
+"""
+import sys
+import timeit
+
+from bench_fastload import dna_record
+
+from benchlingapi import utils
+
+
+def main(n=100, repeat=5):
+    data = [dna_record(i) for i in range(n)]
+
+    def convert():
+        for d in data:
+            utils.un_underscore_keys(utils.underscore_keys(d))
+
+    cached = (utils.underscore, utils.un_underscore)
+    uncached = (utils.underscore.__wrapped__, utils.un_underscore.__wrapped__)
+    for label, (underscore, un_underscore) in (
+        ("uncached", uncached),
+        ("cached", cached),
+    ):
+        utils.underscore, utils.un_underscore = underscore, un_underscore
+        convert()  # warm up
+        best = min(timeit.repeat(convert, number=1, repeat=repeat))
+        print("{:9} {:8.2f} ms per {} records".format(label, best * 1000, n))
+    utils.underscore, utils.un_underscore = cached
+    print(utils.key_cache_info())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
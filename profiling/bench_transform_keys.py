@@ -0,0 +1,44 @@
+"""Time deep key transformation of large annotated plasmids.
+
+Usage::
+
+    python profiling/bench_transform_keys.py [n_annotations]
+"""
+import sys
+import timeit
+
+from benchlingapi import utils
+
+
+def plasmid(n_annotations):
+    return {
+        "id": "seq_1",
+        "name": "pLarge",
+        "bases": "AGTC" * 2500,
+        "isCircular": True,
+        "fields": {"Plasmid Marker": {"value": "KanR", "isMulti": False}},
+        "annotations": [
+            {"start": i, "end": i + 10, "name": "f{}".format(i), "type": "misc"}
+            for i in range(n_annotations)
+        ],
+        "translations": [
+            {"start": i, "end": i + 3, "aminoAcids": "M", "regions": [{"start": i}]}
+            for i in range(n_annotations // 10)
+        ],
+    }
+
+
+def main(n=2000, repeat=5):
+    data = plasmid(n)
+    loaded = utils.underscore_keys(data)
+    for label, func, arg in (
+        ("underscore_keys (camelCase input)", utils.underscore_keys, data),
+        ("underscore_keys (already underscored)", utils.underscore_keys, loaded),
+        ("un_underscore_keys", utils.un_underscore_keys, loaded),
+    ):
+        best = min(timeit.repeat(lambda: func(arg), number=1, repeat=repeat))
+        print("{:40} {:8.2f} ms".format(label, best * 1000))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
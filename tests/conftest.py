@@ -2,6 +2,7 @@ import json
 import os
 
 import pytest
+import requests
 import vcr
 
 from benchlingapi.models import mixins
@@ -48,6 +49,44 @@ def pytest_pyfunc_call(pyfuncitem):
         outcome = yield
 
 
+class FakeServer(requests.adapters.BaseAdapter):
+    """Transport adapter that answers requests offline.
+
+    `handler(request)` returns a `(status_code, json_body, headers)` tuple.
+    """
+
+    def __init__(self, handler):
+        super().__init__()
+        self.handler = handler
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        status_code, body, headers = self.handler(request)
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = json.dumps(body).encode("utf-8")
+        response.headers.update(headers or {})
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(scope="function")
+def fake_server():
+    """Returns a function that mounts a :class:`FakeServer` on a session."""
+
+    def mount(session, handler):
+        server = FakeServer(handler)
+        session.http.mount("https://", server)
+        return server
+
+    return mount
+
+
 def config():
     test_dir = os.path.dirname(os.path.abspath(__file__))
     config_location = os.path.join(test_dir, "secrets/config.json")
@@ -0,0 +1,235 @@
+import asyncio
+import json
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from benchlingapi.aio import AsyncResponse
+from benchlingapi.aio import AsyncRequestInfo
+from benchlingapi.aio import AsyncSession
+from benchlingapi.exceptions import BenchlingAPIException
+from benchlingapi.retry import RetryPolicy
+
+
+def dna(i):
+    return {
+        "id": "seq_{}".format(i),
+        "name": "dna{}".format(i),
+        "bases": "AGTC",
+        "isCircular": False,
+        "folderId": "lib_1",
+        "annotations": [],
+        "translations": [],
+    }
+
+
+class FakeAsyncServer:
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+
+    async def __call__(self, method, url, timeout, **kwargs):
+        self.requests.append((method, url, kwargs))
+        status, body, headers = self.handler(method, url, kwargs)
+        return AsyncResponse(
+            status,
+            json.dumps(body).encode("utf-8"),
+            headers or {},
+            AsyncRequestInfo(method, url, url),
+        )
+
+
+def run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def paginated(method, url, kwargs):
+    params = dict(kwargs.get("params", []))
+    if url.endswith("dna-sequences/seq_1"):
+        return 200, dna(1), None
+    if "nextToken" not in params:
+        return 200, {"dnaSequences": [dna(1), dna(2)], "nextToken": "abc"}, None
+    return 200, {"dnaSequences": [dna(3)], "nextToken": ""}, None
+
+
+def test_async_interfaces():
+    session = AsyncSession("alsdfja;lsdfj")
+    assert asyncio.iscoroutinefunction(session.DNASequence.find)
+    assert asyncio.iscoroutinefunction(session.DNASequence.update)
+    assert not hasattr(session.Annotation, "find")
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda s: s.DNASequence.get_many(["seq_1"]),
+        lambda s: s.DNASequence.export("out.jsonl"),
+        lambda s: s.DNASequence.merge_many([]),
+        lambda s: s.DNASequence.bulk_update([]),
+        lambda s: s.DNASequence.register_many([], "reg_1"),
+        lambda s: s.Registry.registries(),
+        lambda s: s.Registry.load({"id": "src_1", "name": "reg"}).entity_schemas,
+        lambda s: s.Folder.all_entities(),
+    ],
+    ids=[
+        "get_many",
+        "export",
+        "merge_many",
+        "bulk_update",
+        "register_many",
+        "registries",
+        "entity_schemas",
+        "all_entities",
+    ],
+)
+def test_sync_only_methods_raise(call):
+    session = AsyncSession("alsdfja;lsdfj")
+    with pytest.raises(BenchlingAPIException, match="not available on an AsyncSession"):
+        call(session)
+
+
+def test_async_find_and_all(monkeypatch):
+    session = AsyncSession("alsdfja;lsdfj")
+    server = FakeAsyncServer(paginated)
+    monkeypatch.setattr(session.http, "_send", server)
+
+    async def main():
+        found = await session.DNASequence.find("seq_1")
+        models = [m async for m in session.DNASequence.all()]
+        return found, models
+
+    found, models = run(main())
+    assert isinstance(found, session.DNASequence)
+    assert found.name == "dna1"
+    assert [m.id for m in models] == ["seq_1", "seq_2", "seq_3"]
+    assert all(isinstance(m, session.DNASequence) for m in models)
+    assert dict(server.requests[-1][2]["params"]) == {"nextToken": "abc"}
+
+
+def test_async_retry(monkeypatch):
+    session = AsyncSession("alsdfja;lsdfj", retry_policy=RetryPolicy(backoff_factor=0))
+    calls = []
+
+    def handler(method, url, kwargs):
+        calls.append(url)
+        if len(calls) == 1:
+            return 429, {}, None
+        return 200, dna(1), None
+
+    monkeypatch.setattr(session.http, "_send", FakeAsyncServer(handler))
+    found = run(session.DNASequence.find("seq_1"))
+    assert found.id == "seq_1"
+    assert session.retry_policy.stats.retries == 1
+
+
+def test_async_summary(monkeypatch):
+    session = AsyncSession("alsdfja;lsdfj")
+    server = FakeAsyncServer(paginated)
+    monkeypatch.setattr(session.http, "_send", server)
+
+    async def main():
+        models = [m async for m in session.DNASequence.all(summary=True)]
+        listed = await session.DNASequence.list(summary=True)
+        return models, listed
+
+    models, listed = run(main())
+    for _, _, kwargs in server.requests:
+        params = dict(kwargs["params"])
+        assert "summary" not in params
+        assert "dnaSequences.bases" not in params["returning"].split(",")
+    assert [m.id for m in models] == ["seq_1", "seq_2", "seq_3"]
+    assert "bases" not in vars(listed[0])
+    with pytest.raises(BenchlingAPIException, match="summary mode"):
+        listed[0].bases
+    run(listed[0].reload())
+    assert listed[0].bases == "AGTC"
+
+
+def test_async_bulk_create_waits_for_tasks(monkeypatch):
+    session = AsyncSession("alsdfja;lsdfj")
+    tasks = {}
+    polled = []
+
+    def handler(method, url, kwargs):
+        if url.endswith("dna-sequences:bulk-create"):
+            chunk = kwargs["json"]["dnaSequences"]
+            task_id = "task_{}".format(len(tasks))
+            tasks[task_id] = chunk
+            return 202, {"taskId": task_id}, None
+        task_id = url.split("/")[-1]
+        chunk = tasks[task_id]
+        if task_id not in polled:
+            polled.append(task_id)
+            return 200, {"status": "RUNNING"}, None
+        if chunk[0]["name"] == "dna2":
+            task = {
+                "status": "FAILED",
+                "message": "invalid",
+                "errors": [{"index": 1, "message": "bad bases"}],
+            }
+            return 200, task, None
+        created = [dict(dna(int(d["name"][3:])), **d) for d in chunk]
+        task = {"status": "SUCCEEDED", "response": {"dnaSequences": created}}
+        return 200, task, None
+
+    monkeypatch.setattr(session.http, "_send", FakeAsyncServer(handler))
+    data = [
+        {"name": "dna{}".format(i), "bases": "AGTC", "isCircular": False}
+        for i in range(4)
+    ]
+    result = run(
+        session.DNASequence.bulk_create(data, chunk_size=2, every_seconds=0)
+    )
+    assert [m.id if m else None for m in result] == ["seq_0", "seq_1", None, None]
+    assert result.errors == {2: "invalid", 3: "bad bases"}
+
+
+def projects(method, url, kwargs):
+    """600 projects in pages of 100; the endpoint has no name or ids filter."""
+    params = dict(kwargs.get("params", []))
+    page = int(params.get("nextToken") or 0)
+    records = [
+        {"id": "src_{}".format(i), "name": "project{}".format(i)}
+        for i in range(page * 100, page * 100 + 100)
+    ]
+    next_token = str(page + 1) if page < 5 else ""
+    return 200, {"projects": records, "nextToken": next_token}, None
+
+
+def test_async_find_by_name_index(monkeypatch):
+    session = AsyncSession("alsdfja;lsdfj")
+    server = FakeAsyncServer(projects)
+    monkeypatch.setattr(session.http, "_send", server)
+
+    # beyond the 5 pages the client-side scan looks at
+    found = run(session.Project.find_by_name("project599"))
+    assert found.id == "src_599"
+    requests = len(server.requests)
+    assert run(session.Project.find_by_name("missing")) is None
+    assert len(server.requests) == requests
+    assert run(session.Project.find_by_name("project590")).id == "src_590"
+    assert len(server.requests) == requests + 1
+    assert dict(server.requests[-1][2]["params"])["nextToken"] == "5"
+
+
+def test_async_get_scans_all_pages(monkeypatch):
+    session = AsyncSession("alsdfja;lsdfj")
+    server = FakeAsyncServer(projects)
+    monkeypatch.setattr(session.http, "_send", server)
+    assert run(session.Project.get("src_550")).name == "project550"
+    assert len(server.requests) == 6
+
+
+def test_async_find_by_name_pushdown(monkeypatch):
+    session = AsyncSession("alsdfja;lsdfj")
+
+    def handler(method, url, kwargs):
+        params = dict(kwargs.get("params", []))
+        folder = {"id": "lib_999", "name": params["name"], "projectId": "p"}
+        return 200, {"folders": [folder], "nextToken": ""}, None
+
+    server = FakeAsyncServer(handler)
+    monkeypatch.setattr(session.http, "_send", server)
+    assert run(session.Folder.find_by_name("folder999")).id == "lib_999"
+    assert dict(server.requests[0][2]["params"])["name"] == "folder999"
@@ -0,0 +1,127 @@
+import threading
+import time
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.cache import TTLCache
+
+
+def test_ttl_cache_expires(monkeypatch):
+    now = [0.0]
+    cache = TTLCache(ttl=10)
+    monkeypatch.setattr(cache, "_now", lambda: now[0])
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    now[0] = 11
+    assert cache.get("a") is None
+    assert "a" not in cache
+
+
+def test_ttl_cache_lru():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_ttl_cache_disabled():
+    cache = TTLCache(ttl=0)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_get_or_set_single_flight():
+    cache = TTLCache()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    threads = [
+        threading.Thread(target=cache.get_or_set, args=("key", factory))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert cache.get("key") == "value"
+
+
+def test_ttl_cache_invalidate():
+    cache = TTLCache()
+    cache.set(("schemas", "a"), 1)
+    cache.set(("schemas", "b"), 2)
+    cache.set("registries", 3)
+    cache.invalidate_where(lambda k: k[0] == "schemas")
+    assert len(cache) == 1
+    cache.invalidate("registries")
+    assert len(cache) == 0
+
+
+def registry_server(request):
+    path = request.path_url.split("?")[0]
+    if path == "/api/v2/registries":
+        return (
+            200,
+            {
+                "registries": [
+                    {"id": "src_1", "name": "Registry 1"},
+                    {"id": "src_2", "name": "Registry 2"},
+                ]
+            },
+            None,
+        )
+    registry_id = path.split("/")[-2]
+    schemas = [
+        {
+            "id": "ts_" + registry_id,
+            "name": "Plasmid " + registry_id,
+            "type": "dna_sequence",
+            "registryId": registry_id,
+        }
+    ]
+    return 200, {"entitySchemas": schemas}, None
+
+
+@pytest.fixture
+def registry_session(fake_server):
+    session = Session("fake_key")
+    server = fake_server(session, registry_server)
+    return session, server
+
+
+def test_registry_metadata_cached(registry_session):
+    session, server = registry_session
+    for _ in range(10):
+        assert session.Registry.get("src_2").name == "Registry 2"
+        assert session.Registry.find_registry(name="Registry 1").id == "src_1"
+        assert session.Registry.find_from_schema_id("ts_src_2").id == "src_2"
+        assert len(session.DNASequence.valid_schemas()) == 2
+    # one registry listing and one schema listing per registry
+    assert len(server.requests) == 3
+
+
+def test_registry_metadata_invalidate(registry_session):
+    session, server = registry_session
+    session.DNASequence.valid_schemas()
+    session.invalidate_metadata()
+    session.DNASequence.valid_schemas()
+    assert len(server.requests) == 6
+
+
+def test_set_schema_missing(registry_session):
+    session, server = registry_session
+    dna = session.DNASequence(name="seq", bases="", is_circular=False)
+    with pytest.raises(Exception) as exc:
+        dna.set_schema("Not a schema")
+    assert "Plasmid src_1" in str(exc.value)
+    assert len(server.requests) == 3
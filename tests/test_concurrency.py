@@ -0,0 +1,205 @@
+import threading
+import time
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.concurrency import chunks
+from benchlingapi.concurrency import merge
+from benchlingapi.concurrency import poll_delays
+from benchlingapi.concurrency import Prefetcher
+from benchlingapi.concurrency import run_concurrently
+from benchlingapi.concurrency import TaskPool
+
+
+def test_prefetcher_order():
+    assert list(Prefetcher(iter(range(20)), depth=3)) == list(range(20))
+
+
+def test_prefetcher_bounded():
+    produced = []
+
+    def gen():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    pages = Prefetcher(gen(), depth=2)
+    assert next(pages) == 0
+    time.sleep(0.1)
+    # one item consumed, two buffered and one waiting to be buffered
+    assert len(produced) <= 4
+    pages.close()
+
+
+def test_prefetcher_raises():
+    def gen():
+        yield 1
+        raise ValueError("page failed")
+
+    pages = Prefetcher(gen(), depth=2)
+    assert next(pages) == 1
+    with pytest.raises(ValueError):
+        next(pages)
+    with pytest.raises(StopIteration):
+        next(pages)
+
+
+def test_prefetcher_close_releases_thread():
+    pages = Prefetcher(iter(range(100)), depth=1)
+    next(pages)
+    pages.close()
+    pages._threads[0].join(1)
+    assert not pages._threads[0].is_alive()
+
+
+def dna_page(request):
+    token = "nextToken=" in request.url and request.url.split("nextToken=")[1]
+    n = int(token) if token else 0
+    data = {
+        "dnaSequences": [
+            {
+                "id": "seq_{}".format(n),
+                "name": "dna",
+                "bases": "",
+                "isCircular": False,
+                "folderId": "lib_1",
+            }
+        ],
+        "nextToken": str(n + 1) if n < 4 else "",
+    }
+    return 200, data, None
+
+
+@pytest.mark.parametrize("prefetch", [None, 1, 3])
+def test_all_with_prefetch(fake_server, prefetch):
+    session = Session("alsdfja;lsdfj")
+    server = fake_server(session, dna_page)
+    models = list(session.DNASequence.all(prefetch=prefetch))
+    assert [m.id for m in models] == ["seq_{}".format(i) for i in range(5)]
+    assert len(server.requests) == 5
+
+
+def test_list_pages_page_limit(fake_server):
+    session = Session("alsdfja;lsdfj")
+    server = fake_server(session, dna_page)
+    pages = list(session.DNASequence.list_pages(page_limit=2))
+    assert len(pages) == 2
+    assert len(server.requests) == 2
+
+
+def test_merge_ordered():
+    merged = list(merge([iter(range(3)), iter(range(3, 6)), iter([])], depth=2))
+    assert merged == list(range(6))
+
+
+def test_merge_unordered():
+    merged = list(merge([iter(range(3)), iter(range(3, 6))], ordered=False))
+    assert sorted(merged) == list(range(6))
+
+
+def folder_entities(request):
+    path = request.path_url.split("?")[0]
+    key = {
+        "/api/v2/dna-sequences": "dnaSequences",
+        "/api/v2/aa-sequences": "aaSequences",
+        "/api/v2/custom-entities": "customEntities",
+    }[path]
+    data = {"id": key, "name": key, "folderId": "lib_1"}
+    if key == "dnaSequences":
+        data.update({"bases": "", "isCircular": False})
+    if key == "aaSequences":
+        data.update({"aminoAcids": ""})
+    return 200, {key: [data], "nextToken": ""}, None
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_folder_all_entities_concurrent(fake_server, ordered):
+    session = Session("alsdfja;lsdfj")
+    fake_server(session, folder_entities)
+    folder = session.Folder.load({"id": "lib_1", "name": "folder", "projectId": "p"})
+    serial = [m.id for m in folder.all_entities()]
+    concurrent = [m.id for m in folder.all_entities(concurrent=True, ordered=ordered)]
+    if ordered:
+        assert concurrent == serial
+    else:
+        assert sorted(concurrent) == sorted(serial)
+    assert len(serial) == 3
+
+
+def test_chunks():
+    assert chunks(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+    assert chunks([], 2) == []
+
+
+def test_run_concurrently():
+    def work(x):
+        if x == 3:
+            raise ValueError(x)
+        time.sleep(0.01 * (5 - x))
+        return x * 2
+
+    results = run_concurrently(work, range(5), max_workers=5, return_exceptions=True)
+    assert results[:3] == [0, 2, 4]
+    assert isinstance(results[3], ValueError)
+    with pytest.raises(ValueError):
+        run_concurrently(work, range(5), max_workers=2)
+
+
+def test_poll_delays():
+    delays = poll_delays(min_seconds=1, max_seconds=4, factor=2)
+    assert [next(delays) for _ in range(5)] == [1, 2, 4, 4, 4]
+    fixed = poll_delays(every_seconds=3)
+    assert [next(fixed) for _ in range(3)] == [3, 3, 3]
+
+
+class FakeTask:
+    """Finishes after `polls` reloads."""
+
+    def __init__(self, id, polls, status="SUCCEEDED"):
+        self.id = id
+        self.polls = polls
+        self.final_status = status
+        self.reloads = 0
+        self.status = "RUNNING" if polls else status
+
+    def reload(self):
+        self.reloads += 1
+        if self.reloads >= self.polls:
+            self.status = self.final_status
+        return self
+
+
+def test_task_pool():
+    tasks = [FakeTask(i, polls=i) for i in range(5)]
+    finished = []
+    with TaskPool(min_seconds=0.001, max_seconds=0.01) as pool:
+        futures = [pool.submit(t, callback=finished.append) for t in tasks]
+    assert [f.result() for f in futures] == tasks
+    assert [t.reloads for t in tasks] == [0, 1, 2, 3, 4]
+    assert sorted(t.id for t in finished) == [0, 1, 2, 3, 4]
+
+
+def test_task_pool_timeout():
+    pool = TaskPool(timeout=0.05, every_seconds=0.01)
+    future = pool.submit(FakeTask("slow", polls=1000))
+    with pytest.raises(TimeoutError):
+        future.result(timeout=5)
+    pool.close()
+
+
+def test_task_wait_all():
+    session = Session("fake_key")
+    tasks = [FakeTask(i, polls=i, status="FAILED") for i in range(4)]
+    finished = []
+    start = time.time()
+    session.Task.wait_all(
+        tasks, callback=finished.append, min_seconds=0.001, max_seconds=0.01
+    )
+    assert time.time() - start < 1
+    assert [t.reloads for t in tasks] == [0, 1, 2, 3]
+    assert [t.id for t in finished] == [0, 1, 2, 3]
+    with pytest.raises(TimeoutError):
+        session.Task.wait_all(
+            [FakeTask(0, polls=1000)], every_seconds=0.01, timeout=0.05
+        )
@@ -0,0 +1,143 @@
+import threading
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.httpcache import MemoryResponseCache
+from benchlingapi.httpcache import ResponseCache
+from benchlingapi.httpcache import SQLiteResponseCache
+
+
+class Server:
+    """Serves one DNA sequence, answering conditional requests with 304.
+
+    :param validator: "ETag", "Last-Modified" or None (send no validator)
+    """
+
+    def __init__(self, validator="ETag"):
+        self.validator = validator
+        self.version = 0
+        self.conditional = []
+
+    @property
+    def modified_at(self):
+        return "2019-06-03T17:22:45.{:06d}+00:00".format(self.version)
+
+    @property
+    def headers(self):
+        if self.validator == "ETag":
+            return {"ETag": "v" + str(self.version)}
+        if self.validator == "Last-Modified":
+            date = "Mon, 03 Jun 2019 17:22:4{} GMT".format(self.version)
+            return {"Last-Modified": date}
+        return {}
+
+    def __call__(self, request):
+        conditional = {
+            k: request.headers[k]
+            for k in ("If-None-Match", "If-Modified-Since")
+            if k in request.headers
+        }
+        self.conditional.append(conditional)
+        if request.method == "PATCH":
+            self.version += 1
+        elif conditional and set(conditional.values()) <= set(self.headers.values()):
+            return 304, {}, None
+        body = {
+            "id": "seq_1",
+            "name": "seq",
+            "bases": "AGTC" * 100,
+            "isCircular": False,
+            "folderId": "lib_1",
+            "modifiedAt": self.modified_at,
+        }
+        return 200, body, self.headers
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def response_cache(request, tmpdir):
+    if request.param == "memory":
+        return MemoryResponseCache()
+    return SQLiteResponseCache(str(tmpdir.join("cache.db")))
+
+
+@pytest.mark.parametrize("validator", ["ETag", "Last-Modified"])
+def test_revalidation(fake_server, response_cache, validator):
+    session = Session("fake_key", response_cache=response_cache)
+    server = Server(validator)
+    fake_server(session, server)
+
+    first = session.DNASequence.get("seq_1")
+    second = session.DNASequence.get("seq_1")
+    assert second.bases == first.bases
+    assert server.conditional[0] == {}
+    assert server.conditional[1]
+    assert response_cache.hits == 1
+
+    server.version += 1
+    third = session.DNASequence.get("seq_1")
+    assert third.modified_at == server.modified_at
+    assert response_cache.misses == 1
+
+
+def test_responses_without_validators_are_not_cached(fake_server):
+    cache = MemoryResponseCache()
+    session = Session("fake_key", response_cache=cache)
+    server = Server(validator=None)
+    fake_server(session, server)
+    session.DNASequence.get("seq_1")
+    # an edit within the same second as the first response
+    server.version += 1
+    second = session.DNASequence.get("seq_1")
+    assert second.modified_at == server.modified_at
+    assert server.conditional == [{}, {}]
+    assert cache.as_dict() == {"hits": 0, "misses": 0, "stores": 0}
+
+
+def test_write_invalidates(fake_server):
+    cache = MemoryResponseCache()
+    session = Session("fake_key", response_cache=cache)
+    server = Server()
+    fake_server(session, server)
+    session.DNASequence.get("seq_1")
+    session.http.patch("dna-sequences/seq_1", json={"name": "new"})
+    session.DNASequence.get("seq_1")
+    assert server.conditional[-1] == {}
+
+
+def test_sqlite_cache_persists(tmpdir, fake_server):
+    path = str(tmpdir.join("cache.db"))
+    for _ in range(2):
+        cache = SQLiteResponseCache(path)
+        session = Session("fake_key", response_cache=cache)
+        server = Server()
+        fake_server(session, server)
+        session.DNASequence.get("seq_1")
+        cache.close()
+    assert cache.hits == 1
+    assert server.conditional[-1] == {"If-None-Match": "v0"}
+
+
+def test_incomplete_cache_cannot_be_instantiated():
+    class GetOnlyCache(ResponseCache):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnlyCache()
+
+
+def test_counters_are_thread_safe():
+    cache = MemoryResponseCache()
+
+    def record():
+        for _ in range(1000):
+            cache.record_hit()
+            cache.record_store()
+
+    threads = [threading.Thread(target=record) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert cache.as_dict() == {"hits": 8000, "misses": 0, "stores": 8000}
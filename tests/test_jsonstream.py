@@ -0,0 +1,80 @@
+import base64
+import json
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.jsonstream import Base64File
+from benchlingapi.jsonstream import JSONStream
+
+
+@pytest.fixture
+def traces(tmp_path):
+    paths = []
+    for i, size in enumerate([0, 1, 2, 3, 1000, 200001]):
+        path = tmp_path / "trace{}.ab1".format(i)
+        path.write_bytes(bytes(range(256)) * (size // 256) + bytes(size % 256))
+        paths.append(str(path))
+    return paths
+
+
+def expected(paths):
+    files = []
+    for path in paths:
+        with open(path, "rb") as f:
+            files.append({"name": path, "data": base64.b64encode(f.read()).decode()})
+    return {"name": "x", "n": 1, "ok": None, "files": files}
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_json_stream(traces, max_workers):
+    data = {
+        "name": "x",
+        "n": 1,
+        "ok": None,
+        "files": [{"name": p, "data": Base64File(p)} for p in traces],
+    }
+    stream = JSONStream(data, max_workers=max_workers)
+    body = b"".join(stream)
+    assert json.loads(body) == expected(traces)
+    assert len(stream) == len(body)
+    # can be sent again, e.g. on retry
+    assert b"".join(stream) == body
+
+
+def test_base64_file_chunks(traces):
+    f = Base64File(traces[-1])
+    chunks = list(f.iter_encoded(chunk_size=3 * 1000))
+    assert len(chunks) == 67
+    assert b"".join(chunks) == f.encode()
+    with pytest.raises(ValueError):
+        list(f.iter_encoded(chunk_size=1000))
+
+
+def test_submit_alignment_streams_files(fake_server, traces):
+    session = Session("fake_key")
+    bodies = []
+
+    def handler(request):
+        if request.method == "POST":
+            assert isinstance(request.body, JSONStream)
+            body = b"".join(request.body)
+            assert request.headers["Content-Length"] == str(len(body))
+            bodies.append(json.loads(body))
+            return 202, {"taskId": "task_1"}, None
+        return 200, {"id": "task_1", "status": "RUNNING"}, None
+
+    fake_server(session, handler)
+    task = session.DNAAlignment.submit_alignment(
+        algorithm="mafft",
+        name="my_alignment",
+        template="seq_1",
+        filepaths=traces[:3],
+        sequences=["seq_2"],
+        stream=True,
+    )
+    assert task.id == "task_1"
+    files = bodies[0]["files"]
+    assert files[0] == {"sequenceId": "seq_2"}
+    assert [f["name"] for f in files[1:]] == ["trace0.ab1", "trace1.ab1", "trace2.ab1"]
+    assert bodies[0]["templateSequenceId"] == "seq_1"
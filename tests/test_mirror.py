@@ -0,0 +1,175 @@
+import json
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.exceptions import BenchlingAPIException
+from benchlingapi.mirror import LocalMirror
+
+
+class Server:
+    """Serves DNA sequences, honoring the sort and modifiedAt filter."""
+
+    def __init__(self):
+        self.records = {}
+        self.queries = []
+
+    def add(self, id, name, modified_at, **kwargs):
+        record = {
+            "id": id,
+            "name": name,
+            "bases": "AGTC",
+            "isCircular": False,
+            "folderId": "lib_1",
+            "modifiedAt": modified_at,
+        }
+        record.update(kwargs)
+        self.records[id] = record
+
+    def __call__(self, request):
+        url = urlparse(request.url)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        path = url.path.split("/dna-sequences", 1)[-1]
+        if request.method == "POST" and path == "":
+            record = json.loads(request.body)
+            self.add("seq_new", modified_at="2019-02-01T00:00:00+00:00", **record)
+            return 201, self.records["seq_new"], None
+        if request.method == "POST" and path == ":archive":
+            for id in json.loads(request.body)["dnaSequenceIds"]:
+                self.records[id]["archiveRecord"] = {"reason": "Other"}
+            return 200, {}, None
+        if request.method == "PATCH":
+            record = self.records[path.strip("/")]
+            record.update(json.loads(request.body))
+            record["modifiedAt"] = "2019-02-02T00:00:00+00:00"
+            return 200, record, None
+        if path.strip("/") in self.records:
+            return 200, self.records[path.strip("/")], None
+        if path == "":
+            self.queries.append(query)
+            records = sorted(self.records.values(), key=lambda r: r["modifiedAt"])
+            if "modifiedAt" in query:
+                since = query["modifiedAt"].split(" ", 1)[1]
+                records = [r for r in records if r["modifiedAt"] >= since]
+            if "name" in query:
+                records = [r for r in records if r["name"] == query["name"]]
+            if "archiveReason" not in query:
+                records = [r for r in records if not r.get("archiveRecord")]
+            return 200, {"dnaSequences": records, "nextToken": ""}, None
+        return 404, {}, None
+
+
+@pytest.fixture
+def mirrored(fake_server):
+    server = Server()
+    server.add("seq_1", "pUC19", "2019-01-01T00:00:00+00:00")
+    server.add(
+        "seq_2",
+        "pBR322",
+        "2019-01-02T00:00:00+00:00",
+        registryId="src_1",
+        entityRegistryId="BLG001",
+    )
+    session = Session("fake_key", mirror=LocalMirror(":memory:", ["DNASequence"]))
+    transport = fake_server(session, server)
+    return session, server, transport
+
+
+def test_sync_incremental(mirrored):
+    session, server, _ = mirrored
+    assert session.sync() == {"DNASequence": 2}
+    assert server.queries[0]["sort"] == "modifiedAt:asc"
+    assert server.queries[0]["archiveReason"] == "Any"
+    assert "modifiedAt" not in server.queries[0]
+
+    server.add("seq_3", "pET28", "2019-01-03T00:00:00+00:00")
+    server.add("seq_1", "pUC19-v2", "2019-01-04T00:00:00+00:00")
+    assert session.sync() == {"DNASequence": 3}
+    assert server.queries[1]["modifiedAt"] == ">= 2019-01-02T00:00:00+00:00"
+    assert session.mirror.high_water("DNASequence") == "2019-01-04T00:00:00+00:00"
+    assert session.mirror.query("SELECT count(*) FROM entities") == [(3,)]
+
+
+def test_mirror_read_path(mirrored):
+    session, server, transport = mirrored
+    session.sync()
+    sent = len(transport.requests)
+    assert session.DNASequence.find("seq_1", local=True).name == "pUC19"
+    assert session.DNASequence.find_by_name("pBR322", local=True).id == "seq_2"
+    registered = session.DNASequence.registry_dict(registry_id="src_1", local=True)
+    assert list(registered) == ["BLG001"]
+    assert len(transport.requests) == sent
+
+
+def test_mirror_excludes_archived(mirrored):
+    session, server, _ = mirrored
+    server.add(
+        "seq_1",
+        "pUC19",
+        "2019-01-05T00:00:00+00:00",
+        archiveRecord={"reason": "Other"},
+    )
+    session.sync()
+    assert session.DNASequence.find_by_name("pUC19", local=True) is None
+    assert session.DNASequence.find("seq_1", local=True).is_archived
+
+
+def test_writes_go_through_to_mirror(mirrored):
+    session, server, _ = mirrored
+    session.sync()
+
+    dna = session.DNASequence(
+        name="pGEM", bases="AGTC", is_circular=False, folder_id="lib_1"
+    )
+    dna.save()
+    assert session.DNASequence.find_by_name("pGEM", local=True).id == "seq_new"
+    assert session.mirror.query(
+        "SELECT name FROM entities WHERE id = 'seq_new'"
+    ) == [("pGEM",)]
+
+    seq = session.DNASequence.find("seq_1", local=True)
+    seq.name = "pUC19-renamed"
+    seq.update()
+    assert session.DNASequence.find("seq_1", local=True).name == "pUC19-renamed"
+    assert session.DNASequence.find_by_name("pUC19-renamed", local=True).id == "seq_1"
+
+    session.DNASequence.archive_many(["seq_2"])
+    assert session.DNASequence.find("seq_2", local=True).is_archived
+    assert session.DNASequence.find_by_name("pBR322", local=True) is None
+
+
+def test_find_by_name_falls_back_to_server(mirrored):
+    session, server, transport = mirrored
+    session.sync()
+    server.add("seq_3", "pET28", "2019-01-03T00:00:00+00:00")
+    assert session.DNASequence.find_by_name("pET28", local=True).id == "seq_3"
+
+
+def test_reload_bypasses_mirror(mirrored):
+    session, server, _ = mirrored
+    session.sync()
+    server.records["seq_1"]["name"] = "changed elsewhere"
+    seq = session.DNASequence.find("seq_1", local=True)
+    assert seq.name == "pUC19"
+    assert seq.reload().name == "changed elsewhere"
+    assert session.DNASequence.find("seq_1", local=True).name == "changed elsewhere"
+
+
+def test_mirror_reads_are_opt_in(mirrored):
+    session, server, transport = mirrored
+    session.sync()
+    server.records["seq_1"]["name"] = "changed elsewhere"
+    sent = len(transport.requests)
+    # the mirror is out of date until the next sync
+    assert session.DNASequence.find("seq_1", local=True).name == "pUC19"
+    assert len(transport.requests) == sent
+    assert session.DNASequence.find("seq_1").name == "changed elsewhere"
+    assert session.DNASequence.find_by_name("pUC19") is None
+    assert len(transport.requests) == sent + 2
+
+
+def test_sync_requires_mirror():
+    with pytest.raises(BenchlingAPIException):
+        Session("fake_key").sync()
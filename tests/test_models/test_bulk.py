@@ -0,0 +1,366 @@
+import json
+import threading
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.exceptions import BenchlingAPIException
+
+from .test_fastload import dna_record
+
+
+class BulkServer:
+    """Serves `dna-sequences:bulk-get`, rejecting requests with unknown ids."""
+
+    def __init__(self, n):
+        self.records = {r["id"]: r for r in (dna_record(i) for i in range(n))}
+        self.requested = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        url = urlparse(request.url)
+        assert url.path.endswith("/dna-sequences:bulk-get")
+        ids = parse_qs(url.query)["dnaSequenceIds"][0].split(",")
+        with self.lock:
+            self.requested.append(ids)
+        invalid = [id for id in ids if id not in self.records]
+        if invalid:
+            error = {"userMessage": "not found", "invalidIds": invalid}
+            return 404, {"error": error}, None
+        return 200, {"dnaSequences": [self.records[id] for id in ids]}, None
+
+
+@pytest.fixture
+def bulk_session(fake_server):
+    session = Session("fake_key")
+    server = BulkServer(250)
+    fake_server(session, server)
+    return session, server
+
+
+def test_get_many_chunks_in_order(bulk_session):
+    session, server = bulk_session
+    ids = ["seq_{}".format(i) for i in reversed(range(250))]
+    models = session.DNASequence.get_many(ids, max_workers=3)
+    assert [m.id for m in models] == ids
+    assert models.missing == []
+    assert sorted(len(chunk) for chunk in server.requested) == [50, 100, 100]
+
+
+def test_get_many_missing_and_duplicates(bulk_session):
+    session, server = bulk_session
+    ids = ["seq_1", "nope_1", "seq_2", "seq_1", "nope_2"]
+    models = session.DNASequence.get_many(ids, chunk_size=10)
+    assert [m and m.id for m in models] == ["seq_1", None, "seq_2", "seq_1", None]
+    assert models.missing == ["nope_1", "nope_2"]
+    assert server.requested == [
+        ["seq_1", "nope_1", "seq_2", "nope_2"],
+        ["seq_1", "seq_2"],
+    ]
+
+
+def test_get_many_raises_on_unexplained_404(fake_server):
+    session = Session("fake_key")
+    fake_server(session, lambda request: (404, {"error": {"message": "?"}}, None))
+    with pytest.raises(BenchlingAPIException):
+        session.DNASequence.get_many(["seq_1", "seq_2"])
+
+
+def test_get_many_without_bulk_get(fake_server):
+    session = Session("fake_key")
+
+    def handler(request):
+        path = urlparse(request.url).path
+        assert ":bulk-get" not in path
+        id = path.split("/")[-1]
+        if id == "nope":
+            return 404, {"error": {"message": "not found"}}, None
+        return 200, {"id": id, "name": id, "projectId": "src_1"}, None
+
+    server = fake_server(session, handler)
+    folders = session.Folder.get_many(["lib_1", "nope", "lib_2"])
+    assert [f and f.id for f in folders] == ["lib_1", None, "lib_2"]
+    assert folders.missing == ["nope"]
+    assert len(server.requests) == 3
+
+
+class BulkWriteServer:
+    """Serves `dna-sequences:bulk-create` and `:bulk-update` with tasks that
+    finish on the second poll. Names starting with "bad" fail their task."""
+
+    def __init__(self):
+        self.tasks = {}
+        self.polls = {}
+        self.submitted = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        url = urlparse(request.url)
+        if "/tasks/" in url.path:
+            task_id = url.path.rsplit("/", 1)[-1]
+            with self.lock:
+                self.polls[task_id] = self.polls.get(task_id, 0) + 1
+                if self.polls[task_id] < 2:
+                    return 200, {"id": task_id, "status": "RUNNING"}, None
+            return 200, self.tasks[task_id], None
+        assert url.path.endswith(
+            ("dna-sequences:bulk-create", "dna-sequences:bulk-update")
+        )
+        items = json.loads(request.body)["dnaSequences"]
+        with self.lock:
+            task_id = "task_{}".format(len(self.tasks))
+            self.submitted.append(items)
+            bad = [i for i, item in enumerate(items) if item["name"].startswith("bad")]
+            if bad:
+                task = {
+                    "id": task_id,
+                    "status": "FAILED",
+                    "message": "Invalid entities",
+                    "errors": [{"index": i, "message": "bad name"} for i in bad],
+                }
+            else:
+                records = []
+                for item in items:
+                    record = dna_record(0)
+                    record["id"] = "seq_" + item["name"]
+                    record.update(item)
+                    records.append(record)
+                task = {
+                    "id": task_id,
+                    "status": "SUCCEEDED",
+                    "response": {"dnaSequences": records},
+                }
+            self.tasks[task_id] = task
+        return 202, {"taskId": task_id}, None
+
+
+@pytest.fixture
+def write_session(fake_server):
+    session = Session("fake_key")
+    server = BulkWriteServer()
+    fake_server(session, server)
+    return session, server
+
+
+def test_bulk_create_chunks_and_waits_for_tasks(write_session):
+    session, server = write_session
+    data = [{"name": "oligo{}".format(i), "bases": "AGTC"} for i in range(25)]
+    models = session.DNASequence.bulk_create(data, chunk_size=10, every_seconds=0)
+    assert [m.name for m in models] == [d["name"] for d in data]
+    assert models.errors == {}
+    assert sorted(len(items) for items in server.submitted) == [5, 10, 10]
+    assert set(server.polls.values()) == {2}
+
+
+def test_bulk_create_reports_per_item_errors(write_session):
+    session, server = write_session
+    names = ["a", "b", "bad", "c", "d", "e"]
+    data = [{"name": name, "bases": "AGTC"} for name in names]
+    models = session.DNASequence.bulk_create(data, chunk_size=3, every_seconds=0)
+    assert [m and m.name for m in models] == [None, None, None, "c", "d", "e"]
+    assert models.errors == {
+        0: "Invalid entities",
+        1: "Invalid entities",
+        2: "bad name",
+    }
+
+
+def test_bulk_create_updates_instances(write_session):
+    session, server = write_session
+    seqs = [session.DNASequence(name="x", bases="AGTC", is_circular=False)]
+    models = session.DNASequence.bulk_create(seqs, every_seconds=0)
+    assert models[0] is seqs[0]
+    assert seqs[0].id == "seq_x"
+
+
+def test_bulk_update(write_session):
+    session, server = write_session
+    data = [{"id": "seq_{}".format(i), "name": "new{}".format(i)} for i in range(4)]
+    models = session.DNASequence.bulk_update(data, chunk_size=2, every_seconds=0)
+    assert [(m.id, m.name) for m in models] == [(d["id"], d["name"]) for d in data]
+
+
+class MergeServer(BulkWriteServer):
+    """Also lists dna-sequences filtered by `names.anyOf`."""
+
+    def __init__(self, existing):
+        super().__init__()
+        self.existing = existing
+        self.lookups = []
+
+    def __call__(self, request):
+        url = urlparse(request.url)
+        if url.path.endswith("/dna-sequences"):
+            query = parse_qs(url.query)
+            if "name" in query:
+                names = query["name"]
+            elif "names.anyOf" in query:
+                names = query["names.anyOf"][0].split(",")
+            else:
+                names = [name for _, name in self.existing]
+            with self.lock:
+                self.lookups.append(names)
+            records = []
+            for id, name in self.existing:
+                if name in names:
+                    record = dna_record(0)
+                    record.update({"id": id, "name": name})
+                    records.append(record)
+            return 200, {"dnaSequences": records}, None
+        return super().__call__(request)
+
+
+def test_merge_many(fake_server):
+    session = Session("fake_key")
+    server = MergeServer([("seq_a", "a"), ("seq_c1", "c"), ("seq_c2", "c")])
+    fake_server(session, server)
+    names = ["a", "b", "c", "b", "bad"]
+    seqs = [session.DNASequence(name=n, bases="AGTC", is_circular=False) for n in names]
+    result = session.DNASequence.merge_many(
+        seqs, on=["name"], chunk_size=1, every_seconds=0
+    )
+    assert server.lookups == [["a", "b", "c", "bad"]]
+    assert result.counts() == {
+        "created": 1,
+        "updated": 1,
+        "conflicts": 2,
+        "failed": 1,
+    }
+    assert result.created == [1]
+    assert result.updated == [0]
+    assert sorted(result.conflicts) == [2, 3]
+    assert result[0] is seqs[0] and seqs[0].id == "seq_a"
+    assert result[1] is seqs[1] and seqs[1].id == "seq_b"
+    assert result[4] is None and 4 in result.errors
+    submitted = sorted(item["name"] for items in server.submitted for item in items)
+    assert submitted == ["a", "b", "bad"]
+
+
+def test_merge_many_looks_up_other_values_one_at_a_time(fake_server):
+    session = Session("fake_key")
+    server = MergeServer([("seq_a", "a"), ("seq_c", "c,d")])
+    fake_server(session, server)
+    seqs = [
+        session.DNASequence(name=n, bases="AGTC", is_circular=False)
+        for n in ["a", "c,d", 42]
+    ]
+    result = session.DNASequence.merge_many(seqs, on=["name"], every_seconds=0)
+    assert sorted(server.lookups) == [["42"], ["a"], ["c,d"]]
+    assert result.updated == [0, 1]
+    assert result.created == [2]
+
+
+def test_merge_many_requires_scan_without_filter(fake_server):
+    session = Session("fake_key")
+    server = MergeServer([("seq_a", "a")])
+    fake_server(session, server)
+    seqs = [session.DNASequence(name="a", bases="AGTC" * 10, is_circular=False)]
+    with pytest.raises(BenchlingAPIException, match="scan=True"):
+        session.DNASequence.merge_many(seqs, on=["bases"])
+    assert server.lookups == []
+    result = session.DNASequence.merge_many(
+        seqs, on=["bases"], every_seconds=0, scan=True
+    )
+    assert result.updated == [0]
+    assert server.lookups == [["a"]]
+
+
+class RegisterServer:
+    """Serves `registries/<id>:register-entities` (as a task), task polls and
+    `dna-sequences:bulk-get`."""
+
+    def __init__(self):
+        self.registered = []
+        self.bulk_gets = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        url = urlparse(request.url)
+        if url.path.endswith(":register-entities"):
+            ids = json.loads(request.body)["entityIds"]
+            with self.lock:
+                self.registered.append(ids)
+            return 202, {"taskId": "task_" + ",".join(ids)}, None
+        if "/tasks/" in url.path:
+            task_id = url.path.rsplit("/", 1)[-1]
+            if "seq_bad" in task_id:
+                return 200, {"id": task_id, "status": "FAILED", "message": "no"}, None
+            return 200, {"id": task_id, "status": "SUCCEEDED", "response": {}}, None
+        assert url.path.endswith("dna-sequences:bulk-get")
+        ids = parse_qs(url.query)["dnaSequenceIds"][0].split(",")
+        self.bulk_gets.append(ids)
+        records = []
+        for id in ids:
+            record = dna_record(0)
+            record.update({"id": id, "registryId": "reg_1", "entityRegistryId": id})
+            records.append(record)
+        return 200, {"dnaSequences": records}, None
+
+
+def test_register_many(fake_server):
+    session = Session("fake_key")
+    server = RegisterServer()
+    fake_server(session, server)
+    ids = ["seq_1", "seq_2", "seq_bad", "seq_3"]
+    seqs = [session.DNASequence(id=id, name=id) for id in ids]
+    for seq in seqs:
+        seq.new_registry_id = "reg_1"
+    result = session.DNASequence.register_many(seqs, chunk_size=2, every_seconds=0)
+    assert sorted(server.registered) == [["seq_1", "seq_2"], ["seq_bad", "seq_3"]]
+    assert server.bulk_gets == [["seq_1", "seq_2"]]
+    assert result.errors == {2: "no", 3: "no"}
+    assert result[:2] == seqs[:2] and result[2:] == [None, None]
+    assert [s.entity_registry_id for s in seqs[:2]] == ["seq_1", "seq_2"]
+    assert seqs[0].is_registered
+
+
+def test_archive_models_applies_archive_record_locally(fake_server):
+    session = Session("fake_key")
+    posted = []
+
+    def handler(request):
+        assert urlparse(request.url).path.endswith("dna-sequences:archive")
+        body = json.loads(request.body)
+        posted.append(body)
+        return 200, {"dnaSequenceIds": body["dnaSequenceIds"]}, None
+
+    server = fake_server(session, handler)
+    seqs = [session.DNASequence(id="seq_{}".format(i), name="x") for i in range(5)]
+    session.DNASequence.ARCHIVE_SIZE = 2
+    try:
+        result = session.DNASequence.archive_models(seqs, reason="Retired")
+    finally:
+        del session.DNASequence.ARCHIVE_SIZE
+    assert len(server.requests) == 3
+    assert sorted(id for body in posted for id in body["dnaSequenceIds"]) == [
+        s.id for s in seqs
+    ]
+    assert all(body["reason"] == "Retired" for body in posted)
+    assert list(result) == seqs and result.errors == {}
+    assert all(s.is_archived and s.archive_reason == "Retired" for s in seqs)
+
+
+def test_archive_many_reports_partial_progress(fake_server):
+    session = Session("fake_key")
+
+    def handler(request):
+        ids = json.loads(request.body)["dnaSequenceIds"]
+        if "seq_2" in ids:
+            return 400, {"error": {"message": "bad id"}}, None
+        return 200, {"dnaSequenceIds": ids}, None
+
+    fake_server(session, handler)
+    ids = ["seq_{}".format(i) for i in range(5)]
+    session.DNASequence.ARCHIVE_SIZE = 2
+    try:
+        with pytest.raises(BenchlingAPIException) as exc:
+            session.DNASequence.archive_many(ids, max_workers=1)
+        assert session.DNASequence.archive_many(ids[:2]) == {
+            "dnaSequenceIds": ids[:2]
+        }
+    finally:
+        del session.DNASequence.ARCHIVE_SIZE
+    assert list(exc.value.result) == ["seq_0", "seq_1", "seq_4"]
+    assert sorted(exc.value.result.errors) == [2, 3]
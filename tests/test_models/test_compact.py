@@ -0,0 +1,58 @@
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.models.base import CompactRecord
+from .test_fastload import as_tree
+from .test_fastload import dna_record
+
+
+@pytest.fixture(params=[False, True], ids=["marshmallow", "fast_load"])
+def offline_session(request):
+    return Session("fake_key", fast_load=request.param)
+
+
+def test_compact_records(offline_session):
+    data = [dna_record(i) for i in range(3)]
+    records = offline_session.DNASequence.load_many(data, compact=True)
+    record = records[0]
+    assert isinstance(record, CompactRecord)
+    assert not hasattr(record, "__dict__")
+    assert record.name == "seq0"
+    assert record.is_circular is False
+    assert record.registry_id is None
+    assert record.raw is None
+    assert isinstance(record.annotations[0], CompactRecord)
+    assert record.annotations[0].extra == 3
+    with pytest.raises(AttributeError):
+        record.name = "other"
+    with pytest.raises(AttributeError):
+        record.not_a_field
+
+
+def test_compact_keep_raw(offline_session):
+    data = [dna_record(0)]
+    record = offline_session.DNASequence.load_many(data, compact=True, keep_raw=True)
+    assert record[0].raw is data[0]
+    model = offline_session.DNASequence.load_many(data, keep_raw=False)[0]
+    assert not hasattr(model, "raw")
+
+
+def test_compact_to_model(offline_session):
+    data = [dna_record(0)]
+    record = offline_session.DNASequence.load_many(data, compact=True)[0]
+    model = record.to_model()
+    assert isinstance(model, offline_session.DNASequence)
+    assert isinstance(model.annotations[0], offline_session.Annotation)
+    expected = offline_session.DNASequence.load_many(data, keep_raw=False)[0]
+    assert as_tree(model) == as_tree(expected)
+
+
+def test_list_compact(fake_server):
+    session = Session("fake_key")
+    server = fake_server(
+        session, lambda request: (200, {"dnaSequences": [dna_record(0)]}, {})
+    )
+    records = session.DNASequence.list(compact=True)
+    assert records[0].id == "seq_0"
+    assert isinstance(records[0], CompactRecord)
+    assert "compact" not in server.requests[-1].url
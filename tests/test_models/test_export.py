@@ -0,0 +1,110 @@
+import gzip
+import json
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.exceptions import BenchlingAPIException
+from .test_fastload import dna_record
+
+
+class PagedServer:
+    """Serves `dna-sequences` in pages of 10, optionally failing at a page."""
+
+    def __init__(self, n, fail_at=None):
+        self.records = [dna_record(i) for i in range(n)]
+        self.fail_at = fail_at
+        self.tokens = []
+
+    def __call__(self, request):
+        query = parse_qs(urlparse(request.url).query)
+        assert query["pageSize"] == ["100"]
+        token = query.get("nextToken", [None])[0]
+        self.tokens.append(token)
+        start = int(token) if token else 0
+        if start == self.fail_at:
+            return 400, {"error": {"userMessage": "failed"}}, None
+        page = {"dnaSequences": self.records[start : start + 10]}
+        if start + 10 < len(self.records):
+            page["nextToken"] = str(start + 10)
+        return 200, page, None
+
+
+def read_lines(path):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.parametrize("filename", ["seqs.jsonl", "seqs.jsonl.gz"])
+def test_export(fake_server, tmp_path, filename):
+    session = Session("fake_key")
+    server = PagedServer(35)
+    fake_server(session, server)
+    path = str(tmp_path / filename)
+    assert session.DNASequence.export(path) == 35
+    assert read_lines(path) == server.records
+    assert not (tmp_path / (filename + ".state")).exists()
+
+
+@pytest.mark.parametrize("filename", ["seqs.jsonl", "seqs.jsonl.gz"])
+def test_export_resume(fake_server, tmp_path, filename):
+    session = Session("fake_key")
+    server = PagedServer(35, fail_at=20)
+    fake_server(session, server)
+    path = str(tmp_path / filename)
+    with pytest.raises(BenchlingAPIException):
+        session.DNASequence.export(path, prefetch=0)
+    assert read_lines(path) == server.records[:20]
+    state = json.loads((tmp_path / (filename + ".state")).read_text())
+    assert state["nextToken"] == "20" and state["count"] == 20
+
+    server.fail_at = None
+    server.tokens = []
+    assert session.DNASequence.export(path, resume=True) == 35
+    assert server.tokens == ["20", "30"]
+    assert read_lines(path) == server.records
+
+
+def test_export_resume_checks_params(fake_server, tmp_path):
+    session = Session("fake_key")
+    fake_server(session, PagedServer(35, fail_at=10))
+    path = str(tmp_path / "seqs.jsonl")
+    with pytest.raises(BenchlingAPIException):
+        session.DNASequence.export(path, prefetch=0, folderId="lib_1")
+    with pytest.raises(BenchlingAPIException, match="parameters changed"):
+        session.DNASequence.export(path, resume=True)
+
+
+def test_export_resume_with_tuple_params(fake_server, tmp_path):
+    session = Session("fake_key")
+    server = PagedServer(35, fail_at=20)
+    fake_server(session, server)
+    path = str(tmp_path / "seqs.jsonl")
+    with pytest.raises(BenchlingAPIException):
+        session.DNASequence.export(path, prefetch=0, folderId=("lib_1", "lib_2"))
+
+    server.fail_at = None
+    server.tokens = []
+    assert session.DNASequence.export(path, resume=True, folderId=("lib_1", "lib_2"))
+    assert server.tokens == ["20", "30"]
+    assert read_lines(path) == server.records
+
+
+def test_export_resume_without_output_starts_over(fake_server, tmp_path):
+    session = Session("fake_key")
+    server = PagedServer(35, fail_at=20)
+    fake_server(session, server)
+    path = tmp_path / "seqs.jsonl"
+    with pytest.raises(BenchlingAPIException):
+        session.DNASequence.export(str(path), prefetch=0)
+    path.unlink()
+
+    server.fail_at = None
+    server.tokens = []
+    assert session.DNASequence.export(str(path), resume=True) == 35
+    assert server.tokens == [None, "10", "20", "30"]
+    assert read_lines(str(path)) == server.records
+    assert not (tmp_path / "seqs.jsonl.state").exists()
@@ -0,0 +1,140 @@
+import gc
+import weakref
+
+import pytest
+from marshmallow import ValidationError
+
+from benchlingapi import Session
+from benchlingapi.models import fastload
+from benchlingapi.models.schema import DNASequenceSchema
+from benchlingapi.utils import underscore_keys
+
+
+def dna_record(i):
+    return {
+        "id": "seq_{}".format(i),
+        "name": "seq{}".format(i),
+        "bases": "AGTC" * 10,
+        "isCircular": False,
+        "folderId": "lib_1234",
+        "length": 40,
+        "customFields": {"Note": {"value": "hello"}},
+        "fields": {"Marker": {"value": "KanR"}},
+        "annotations": [
+            {
+                "start": 1,
+                "end": 5,
+                "name": "promoter",
+                "strand": 1,
+                "type": "misc",
+                "color": "#FFFFFF",
+                "extra": 3,
+            }
+        ],
+        "translations": [
+            {
+                "start": 1,
+                "end": 3,
+                "strand": -1,
+                "aminoAcids": "M",
+                "regions": [{"start": 1, "end": 3}],
+            }
+        ],
+        "archiveRecord": None,
+        "entityRegistryId": None,
+        "registryId": None,
+        "createdAt": "2019-01-01T00:00:00.000000+00:00",
+        "modifiedAt": "2019-01-01T00:00:00.000000+00:00",
+    }
+
+
+def as_tree(x):
+    if hasattr(x, "__dict__"):
+        return type(x).__name__, {k: as_tree(v) for k, v in vars(x).items()}
+    if isinstance(x, list):
+        return [as_tree(v) for v in x]
+    if isinstance(x, dict):
+        return {k: as_tree(v) for k, v in x.items()}
+    return x
+
+
+@pytest.fixture(scope="module")
+def sessions():
+    return Session("fake_key"), Session("fake_key", fast_load=True)
+
+
+def test_load_many_matches_marshmallow(sessions):
+    slow, fast = sessions
+    data = [dna_record(i) for i in range(5)]
+    expected = slow.DNASequence.load_many(data)
+    loaded = fast.DNASequence.load_many(data)
+    assert as_tree(loaded) == as_tree(expected)
+    assert isinstance(loaded[0], fast.DNASequence)
+    assert isinstance(loaded[0].annotations[0], fast.Annotation)
+    assert loaded[0].raw is data[0]
+
+
+def test_load_matches_marshmallow(sessions):
+    slow, fast = sessions
+    data = dna_record(0)
+    assert as_tree(fast.DNASequence.load(data)) == as_tree(
+        slow.DNASequence.load(data)
+    )
+
+
+def test_falls_back_on_coercion(sessions):
+    slow, fast = sessions
+    data = [dna_record(0), dna_record(1)]
+    data[1]["length"] = "40"
+    data[1]["isCircular"] = "true"
+    loaded = fast.DNASequence.load_many(data)
+    assert loaded[1].length == 40
+    assert loaded[1].is_circular is True
+    assert as_tree(loaded) == as_tree(slow.DNASequence.load_many(data))
+
+
+@pytest.mark.parametrize(
+    "key,value", [("bases", None), ("name", 5)], ids=["null", "wrong_type"]
+)
+def test_invalid_records_raise_like_marshmallow(sessions, key, value):
+    _, fast = sessions
+    data = dna_record(0)
+    data[key] = value
+    with pytest.raises(ValidationError):
+        fast.DNASequence.load_many([data])
+
+
+def test_missing_required_raises(sessions):
+    _, fast = sessions
+    data = dna_record(0)
+    del data["bases"]
+    with pytest.raises(ValidationError):
+        fast.DNASequence.load(data)
+
+
+def test_invalid_nested_value_raises(sessions):
+    _, fast = sessions
+    data = dna_record(0)
+    data["annotations"][0]["strand"] = 2
+    with pytest.raises(ValidationError):
+        fast.DNASequence.load(data)
+
+
+def test_dna_sequence_schema_compiles(sessions):
+    slow, fast = sessions
+    loader = fastload.get_loader(DNASequenceSchema, fast)
+    assert loader is not None
+    data = underscore_keys(dna_record(0))
+    schema = DNASequenceSchema()
+    schema.context["session"] = fast
+    assert as_tree(loader(data)) == as_tree(schema.load(data))
+
+
+def test_loaders_do_not_keep_sessions_alive():
+    session = Session("fake_key", fast_load=True)
+    session.DNASequence.load_many([dna_record(0)])
+    assert fastload.get_loader(DNASequenceSchema, session) is not None
+    ref = weakref.ref(session)
+    del session
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.cache import TTLCache
+
+from .test_fastload import dna_record
+
+
+def dna_server(request):
+    path = request.path_url.split("?")[0]
+    if request.method == "GET" and path == "/api/v2/dna-sequences":
+        return 200, {"dnaSequences": [dna_record(0), dna_record(1)]}, None
+    if request.method == "GET":
+        return 200, dna_record(int(path.split("_")[-1])), None
+    if request.method == "PATCH":
+        data = dna_record(int(path.split("_")[-1]))
+        data.update(json.loads(request.body))
+        return 200, data, None
+    return 200, {}, None
+
+
+@pytest.fixture
+def cached_session(fake_server):
+    session = Session("fake_key", identity_map=TTLCache(ttl=60, maxsize=100))
+    server = fake_server(session, dna_server)
+    return session, server
+
+
+def test_get_returns_cached_instance(cached_session):
+    session, server = cached_session
+    dna = session.DNASequence.get("seq_0")
+    assert session.DNASequence.find("seq_0") is dna
+    assert len(server.requests) == 1
+
+
+def test_list_fills_identity_map(cached_session):
+    session, server = cached_session
+    models = session.DNASequence.list()
+    assert session.DNASequence.get("seq_1") is models[1]
+    assert len(server.requests) == 1
+
+
+def test_reload_bypasses_identity_map(cached_session):
+    session, server = cached_session
+    dna = session.DNASequence.get("seq_0")
+    assert dna.reload() is dna
+    assert len(server.requests) == 2
+    assert session.DNASequence.get("seq_0") is dna
+
+
+def test_update_keeps_identity_map_consistent(cached_session):
+    session, server = cached_session
+    dna = session.DNASequence.get("seq_0")
+    dna.name = "renamed"
+    dna.update()
+    assert session.DNASequence.get("seq_0") is dna
+    assert dna.name == "renamed"
+
+
+def test_archive_many_invalidates(cached_session):
+    session, server = cached_session
+    dna = session.DNASequence.get("seq_0")
+    session.DNASequence.archive_many(["seq_0"])
+    assert session.DNASequence.get("seq_0") is not dna
+
+
+def test_no_identity_map_by_default(fake_server):
+    session = Session("fake_key")
+    server = fake_server(session, dna_server)
+    session.DNASequence.get("seq_0")
+    session.DNASequence.get("seq_0")
+    assert len(server.requests) == 2
+
+
+def test_tasks_are_not_cached(fake_server):
+    session = Session("fake_key", identity_map=TTLCache(ttl=60, maxsize=100))
+    statuses = ["RUNNING", "SUCCEEDED"]
+    server = fake_server(
+        session, lambda request: (200, {"status": statuses.pop(0)}, None)
+    )
+    assert session.Task.find("task_1").status == "RUNNING"
+    assert session.Task.find("task_1").status == "SUCCEEDED"
+    assert len(server.requests) == 2
@@ -0,0 +1,103 @@
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+from benchlingapi import Session
+
+
+def query(request):
+    return {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+
+
+def folder_server(request):
+    q = query(request)
+    folders = [
+        {"id": "lib_{}".format(i), "name": "folder{}".format(i), "projectId": "p"}
+        for i in range(1000)
+    ]
+    if "name" in q:
+        folders = [f for f in folders if f["name"] == q["name"]]
+    if "ids" in q:
+        folders = [f for f in folders if f["id"] in q["ids"].split(",")]
+    return 200, {"folders": folders[:100], "nextToken": ""}, None
+
+
+class ProjectServer:
+    """600 projects in pages of 100; the endpoint has no name filter."""
+
+    def __init__(self):
+        self.names = ["project{}".format(i) for i in range(600)]
+
+    def __call__(self, request):
+        page = int(query(request).get("nextToken") or 0)
+        projects = [
+            {"id": "src_{}".format(i), "name": self.names[i]}
+            for i in range(page * 100, page * 100 + 100)
+        ]
+        next_token = str(page + 1) if page < 5 else ""
+        return 200, {"projects": projects, "nextToken": next_token}, None
+
+
+def test_find_by_name_pushdown(fake_server):
+    session = Session("fake_key")
+    server = fake_server(session, folder_server)
+    assert session.Folder.find_by_name("folder999").id == "lib_999"
+    assert query(server.requests[-1])["name"] == "folder999"
+    assert session.Folder.find_by_name("missing") is None
+
+
+def test_find_by_name_index(fake_server):
+    session = Session("fake_key")
+    server = fake_server(session, ProjectServer())
+    # beyond the 5 pages the client-side scan used to look at
+    assert session.Project.find_by_name("project599").id == "src_599"
+    requests = len(server.requests)
+    assert session.Project.find_by_name("missing") is None
+    assert len(server.requests) == requests
+    # hits fetch only the page the model is on
+    assert session.Project.find_by_name("project42").name == "project42"
+    assert len(server.requests) == requests + 1
+    assert session.Project.find_by_name("project590").name == "project590"
+    assert len(server.requests) == requests + 2
+    assert query(server.requests[-1])["nextToken"] == "5"
+    index = session.metadata_cache.get(("names", "Project"))
+    assert index["project42"] == ("src_42", None)
+    assert index["project590"] == ("src_590", "5")
+
+    session.invalidate_metadata()
+    session.Project.find_by_name("project1")
+    assert len(server.requests) == requests + 2 + 6 + 1
+
+
+def test_find_by_name_index_renamed(fake_server):
+    session = Session("fake_key")
+    projects = ProjectServer()
+    fake_server(session, projects)
+    assert session.Project.find_by_name("project3").id == "src_3"
+    projects.names[3] = "renamed"
+    assert session.Project.find_by_name("project3") is None
+    assert session.Project.find_by_name("renamed").id == "src_3"
+
+
+def test_find_by_name_without_index(fake_server):
+    session = Session("fake_key", metadata_ttl=0)
+    server = fake_server(session, ProjectServer())
+    assert session.Project.find_by_name("project599") is None
+    assert len(server.requests) == 5
+    assert session.Project.find_by_name("project0", page_limit=1).id == "src_0"
+    assert session.Project.find_by_name("project150", page_limit=1) is None
+    assert len(server.requests) == 7
+
+
+def test_get_scans_until_found(fake_server):
+    session = Session("fake_key")
+    server = fake_server(session, ProjectServer())
+    assert session.Project.get("src_250").name == "project250"
+    assert len(server.requests) == 3
+
+
+def test_writes_invalidate_name_index(fake_server):
+    session = Session("fake_key")
+    fake_server(session, lambda request: (200, {}, None))
+    session.metadata_cache.set(("names", "Folder"), {"folder1": "lib_1"})
+    session.Folder.archive_many(["lib_1"])
+    assert ("names", "Folder") not in session.metadata_cache
@@ -0,0 +1,156 @@
+import json
+import os
+import threading
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.concurrency import TaskPool
+from benchlingapi.exceptions import BenchlingAPIException
+
+TRACE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "424889-14889.ab1")
+
+
+def template(id, name):
+    return {
+        "id": id,
+        "name": name,
+        "bases": "AGTC",
+        "isCircular": False,
+        "folderId": "lib_1",
+    }
+
+
+class AlignmentServer:
+    """Serves template lookups, alignment submissions and their tasks. Each
+    task finishes on its second poll; templates named "bad" fail."""
+
+    def __init__(self):
+        self.templates = {
+            "seq_1": "pA",
+            "seq_2": "pB",
+            "seq_3": "dup",
+            "seq_4": "dup",
+            "seq_5": "seq_named",
+        }
+        self.lookups = []
+        self.submitted = {}
+        self.polls = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        url = urlparse(request.url)
+        query = parse_qs(url.query)
+        if url.path.endswith("dna-sequences:bulk-get"):
+            ids = query["dnaSequenceIds"][0].split(",")
+            self.lookups.append(ids)
+            invalid = [id for id in ids if id not in self.templates]
+            if invalid:
+                error = {"userMessage": "not found", "invalidIds": invalid}
+                return 404, {"error": error}, None
+            seqs = [template(id, self.templates[id]) for id in ids]
+            return 200, {"dnaSequences": seqs}, None
+        if url.path.endswith("/dna-sequences"):
+            names = query["names.anyOf"][0].split(",")
+            self.lookups.append(names)
+            seqs = [
+                template(id, name)
+                for id, name in self.templates.items()
+                if name in names
+            ]
+            return 200, {"dnaSequences": seqs}, None
+        if url.path.endswith("dna-alignments:create-template-alignment"):
+            body = json.loads(b"".join(request.body))
+            with self.lock:
+                task_id = "task_{}".format(len(self.submitted))
+                self.submitted[task_id] = body
+            return 202, {"taskId": task_id}, None
+        task_id = url.path.rsplit("/", 1)[-1]
+        with self.lock:
+            self.polls[task_id] = self.polls.get(task_id, 0) + 1
+            body = self.submitted[task_id]
+            if self.polls[task_id] < 2:
+                return 200, {"id": task_id, "status": "RUNNING"}, None
+        alignment = {"id": "seqanl_" + task_id, "name": body["name"]}
+        return (
+            200,
+            {"id": task_id, "status": "SUCCEEDED", "response": alignment},
+            None,
+        )
+
+
+def test_submit_alignments(fake_server):
+    session = Session("fake_key")
+    server = AlignmentServer()
+    fake_server(session, server)
+    manifest = [
+        ("seq_1", [TRACE], "A01"),
+        {"template_name": "pB", "traces": [TRACE, TRACE], "name": "A02"},
+        ("seq_9", [TRACE]),
+        {"template_name": "dup", "traces": [TRACE]},
+        (session.DNASequence(id="seq_2", name="pB"), [TRACE]),
+        {"template_name": "seq_named", "traces": [TRACE], "name": "A06"},
+    ]
+    jobs = list(
+        session.DNAAlignment.submit_alignments(
+            manifest, max_workers=3, min_seconds=0.001, max_seconds=0.01
+        )
+    )
+    assert sorted(job.index for job in jobs) == [0, 1, 2, 3, 4, 5]
+    jobs = sorted(jobs, key=lambda job: job.index)
+    assert [job.ok for job in jobs] == [True, True, False, False, True, True]
+    assert [job.template_id for job in jobs] == [
+        "seq_1",
+        "seq_2",
+        None,
+        None,
+        "seq_2",
+        "seq_5",
+    ]
+    assert "not found" in str(jobs[2].error)
+    assert "Found 2 templates" in str(jobs[3].error)
+    assert jobs[4].name == "pB alignment"
+    assert jobs[0].alignment.name == "A01"
+    assert jobs[0].alignment.id.startswith("seqanl_task_")
+    bodies = sorted(server.submitted.values(), key=lambda body: body["name"])
+    assert [(b["name"], len(b["files"])) for b in bodies] == [
+        ("A01", 1),
+        ("A02", 2),
+        ("A06", 1),
+        ("pB alignment", 1),
+    ]
+    # one bulk get (repeated without the missing id) and one batched name lookup
+    assert server.lookups == [
+        ["seq_1", "seq_9"],
+        ["seq_1"],
+        ["pB", "dup", "seq_named"],
+    ]
+
+
+def test_submit_alignments_requires_one_template_key(fake_server):
+    session = Session("fake_key")
+    fake_server(session, AlignmentServer())
+    with pytest.raises(BenchlingAPIException):
+        list(session.DNAAlignment.submit_alignments([{"traces": [TRACE]}]))
+
+
+def test_submit_alignments_reports_polling_errors(fake_server, monkeypatch):
+    session = Session("fake_key")
+    fake_server(session, AlignmentServer())
+
+    def fail(self, task, callback=None):
+        raise RuntimeError("pool is closed")
+
+    monkeypatch.setattr(TaskPool, "submit", fail)
+    jobs = []
+
+    def consume():
+        jobs.extend(session.DNAAlignment.submit_alignments([("seq_1", [TRACE])]))
+
+    thread = threading.Thread(target=consume, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    assert not thread.is_alive()
+    assert [str(job.error) for job in jobs] == ["pool is closed"]
@@ -0,0 +1,83 @@
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import pytest
+
+from benchlingapi import Session
+from .test_fastload import dna_record
+
+
+@pytest.fixture(params=[False, True], ids=["marshmallow", "fast_load"])
+def summary_session(request, fake_server):
+    session = Session("fake_key", fast_load=request.param)
+    requests = []
+
+    def handler(request):
+        url = urlparse(request.url)
+        query = parse_qs(url.query)
+        requests.append((url.path, query))
+        if url.path.endswith("dna-sequences:bulk-get"):
+            ids = query["dnaSequenceIds"][0].split(",")
+            records = [dna_record(int(id.split("_")[1])) for id in ids]
+            return 200, {"dnaSequences": records}, None
+        # like the server, send only the fields asked for in `returning`
+        returning = [f.split(".")[-1] for f in query["returning"][0].split(",")]
+        records = []
+        for i in range(3):
+            record = dna_record(i)
+            record["webURL"] = "https://benchling.com/s/seq_{}".format(i)
+            if i == 2:
+                record["archiveRecord"] = {"reason": "Retired"}
+            records.append({k: v for k, v in record.items() if k in returning})
+        return 200, {"dnaSequences": records}, None
+
+    fake_server(session, handler)
+    return session, requests
+
+
+def test_summary_list_requests_minimal_fields(summary_session):
+    session, requests = summary_session
+    seqs = session.DNASequence.list(summary=True)
+    returning = requests[0][1]["returning"][0].split(",")
+    assert "dnaSequences.name" in returning
+    assert "dnaSequences.folderId" in returning
+    assert "dnaSequences.archiveRecord" in returning
+    assert "dnaSequences.webURL" in returning
+    assert "dnaSequences.bases" not in returning
+    assert "nextToken" in returning
+    assert [s.name for s in seqs] == ["seq0", "seq1", "seq2"]
+    assert "bases" not in vars(seqs[0])
+    assert len(requests) == 1
+
+
+def test_summary_keeps_archive_state_and_url(summary_session):
+    session, requests = summary_session
+    seqs = session.DNASequence.list(summary=True)
+    assert [s.is_archived for s in seqs] == [False, False, True]
+    assert seqs[2].archive_reason == "Retired"
+    assert seqs[0].web_url == "https://benchling.com/s/seq_0"
+    assert len(requests) == 1
+
+
+def test_summary_loads_heavy_fields_in_one_batch(summary_session):
+    session, requests = summary_session
+    seqs = session.DNASequence.list(summary=True)
+    assert seqs[1].bases == "AGTC" * 10
+    assert len(requests) == 2
+    assert requests[1][1]["dnaSequenceIds"] == ["seq_0,seq_1,seq_2"]
+    assert seqs[0].annotations[0].name == "promoter"
+    assert seqs[2].translations[0]["amino_acids"] == "M"
+    assert len(requests) == 2
+    with pytest.raises(AttributeError):
+        seqs[0].not_a_field
+
+
+def test_summary_drops_heavy_fields_on_load(summary_session):
+    session, requests = summary_session
+    seqs = session.DNASequence.load_many([dna_record(0)], summary=True)
+    assert "bases" not in vars(seqs[0])
+    records = session.DNASequence.load_many(
+        [dna_record(0)], summary=True, compact=True
+    )
+    assert records[0].bases is None
+    assert records[0].name == "seq0"
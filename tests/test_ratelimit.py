@@ -0,0 +1,54 @@
+import threading
+import time
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.ratelimit import FileTokenBucket
+from benchlingapi.ratelimit import SharedMemoryTokenBucket
+from benchlingapi.ratelimit import TokenBucket
+
+
+@pytest.mark.parametrize(
+    "make_bucket",
+    [
+        lambda tmpdir: TokenBucket(rate=100, burst=5),
+        lambda tmpdir: FileTokenBucket(str(tmpdir.join("bucket")), rate=100, burst=5),
+        lambda tmpdir: SharedMemoryTokenBucket(rate=100, burst=5),
+    ],
+    ids=["memory", "file", "shared_memory"],
+)
+def test_reserve(tmpdir, make_bucket):
+    bucket = make_bucket(tmpdir)
+    delays = [bucket.reserve() for _ in range(7)]
+    assert delays[:5] == [0, 0, 0, 0, 0]
+    assert 0 < delays[5] < delays[6] <= 0.03
+
+
+def test_file_buckets_share_budget(tmpdir):
+    path = str(tmpdir.join("bucket"))
+    bucket1 = FileTokenBucket(path, rate=1, burst=2)
+    bucket2 = FileTokenBucket(path, rate=1, burst=2)
+    assert bucket1.reserve() == 0
+    assert bucket2.reserve() == 0
+    assert bucket1.reserve() > 0
+
+
+def test_threaded_acquire():
+    bucket = TokenBucket(rate=200, burst=1)
+    t1 = time.time()
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert time.time() - t1 >= 19 / 200.0 * 0.9
+
+
+def test_session_rate_limiter(fake_server):
+    bucket = TokenBucket(rate=20, burst=1)
+    session = Session("alsdfja;lsdfj", rate_limiter=bucket)
+    fake_server(session, lambda r: (200, {}, None))
+    for _ in range(3):
+        session.http.get("dna-sequences")
+    assert bucket.waits == 2
@@ -0,0 +1,89 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from benchlingapi import Session
+from benchlingapi.exceptions import BenchlingAPIException
+from benchlingapi.retry import RetryPolicy
+
+
+class NoSleepRetryPolicy(RetryPolicy):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.delays = []
+
+    def sleep(self, seconds):
+        self.delays.append(seconds)
+
+
+def throttled(n, headers=None):
+    """Handler that throttles the first `n` requests."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) <= n:
+            return 429, {"error": {"userMessage": "rate limited"}}, headers
+        return 200, {"ok": True}, None
+
+    return handler
+
+
+def test_retry_get(fake_server):
+    policy = NoSleepRetryPolicy(max_retries=3)
+    session = Session("alsdfja;lsdfj", retry_policy=policy)
+    server = fake_server(session, throttled(2))
+    assert session.http.get("dna-sequences") == {"ok": True}
+    assert len(server.requests) == 3
+    assert policy.stats.retries == 2
+    assert policy.stats.by_status == {429: 2}
+
+
+def test_retry_gives_up(fake_server):
+    policy = NoSleepRetryPolicy(max_retries=2)
+    session = Session("alsdfja;lsdfj", retry_policy=policy)
+    server = fake_server(session, throttled(10))
+    with pytest.raises(BenchlingAPIException):
+        session.http.get("dna-sequences")
+    assert len(server.requests) == 3
+    assert policy.stats.gave_up == 1
+
+
+def test_no_retry_non_idempotent(fake_server):
+    policy = NoSleepRetryPolicy(max_retries=3)
+    session = Session("alsdfja;lsdfj", retry_policy=policy)
+    server = fake_server(session, throttled(1))
+    with pytest.raises(BenchlingAPIException):
+        session.http.post("dna-sequences", json={})
+    assert len(server.requests) == 1
+
+
+def test_retry_after(fake_server):
+    policy = NoSleepRetryPolicy(max_retries=3)
+    session = Session("alsdfja;lsdfj", retry_policy=policy)
+    fake_server(session, throttled(1, headers={"Retry-After": "7"}))
+    session.http.get("dna-sequences")
+    assert policy.delays == [7.0]
+
+
+def test_backoff():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=10, jitter=False)
+    assert [policy.get_backoff(n) for n in range(5)] == [1, 2, 4, 8, 10]
+    policy = RetryPolicy(backoff_factor=1, max_backoff=10)
+    assert all(0 <= policy.get_backoff(n) <= 10 for n in range(10))
+
+
+def test_retry_after_is_capped(fake_server):
+    policy = NoSleepRetryPolicy(max_retries=3, max_backoff=30)
+    session = Session("alsdfja;lsdfj", retry_policy=policy)
+    fake_server(session, throttled(1, headers={"Retry-After": "86400"}))
+    session.http.get("dna-sequences")
+    assert policy.delays == [30]
+
+
+def test_parse_retry_after_date():
+    date = formatdate(time.time() + 100, usegmt=False).rsplit(" ", 1)[0]
+    for suffix in ("+0000", "-0000", "GMT"):
+        delay = RetryPolicy.parse_retry_after("{} {}".format(date, suffix))
+        assert 90 < delay <= 100
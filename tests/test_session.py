@@ -13,4 +13,25 @@ def test_setting_org():
 def test_setting_home():
     home = 'https://myotherorganization.benchling.com/api/v2'
     session = Session('alsdfja;lsdfj', home=home)
-    assert session.url == home
\ No newline at end of file
+    assert session.url == home
+
+
+def test_pool_settings():
+    session = Session('alsdfja;lsdfj', pool_maxsize=50, pool_block=True)
+    adapter = session.http._adapter
+    assert adapter._pool_maxsize == 50
+    assert adapter._pool_block is True
+    assert session.pool_stats.total == 0
+
+
+def test_pool_stats():
+    from benchlingapi.adapters import PoolStats
+
+    stats = PoolStats()
+    stats.hit()
+    stats.hit()
+    stats.miss()
+    assert stats.as_dict() == {"hits": 2, "misses": 1, "total": 3}
+    assert stats.hit_rate == 2 / 3
+    stats.reset()
+    assert stats.total == 0
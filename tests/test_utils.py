@@ -0,0 +1,79 @@
+import inflection
+import pytest
+
+from benchlingapi import utils
+
+
+@pytest.mark.parametrize(
+    "key", ["isCircular", "entityRegistryId", "webURL", "id", "aminoAcids"]
+)
+def test_underscore_matches_inflection(key):
+    assert utils.underscore(key) == inflection.underscore(key)
+    assert utils.underscore(key) == utils.underscore(key)
+
+
+def test_un_underscore():
+    assert utils.un_underscore("entity_registry_id") == "entityRegistryId"
+    assert utils.un_underscore("id") == "id"
+
+
+def test_key_cache():
+    utils.key_cache_clear()
+    for _ in range(3):
+        utils.underscore_keys({"isCircular": True, "folderId": "lib_1"})
+    info = utils.key_cache_info()["underscore"]
+    assert info.misses == 2
+    assert info.hits == 4
+
+
+def test_underscore_keys_nested_lists():
+    data = {
+        "isCircular": False,
+        "annotations": [{"start": 1, "extraInfo": {"someKey": 1}}],
+        "translations": [[{"aminoAcids": "M"}]],
+    }
+    assert utils.underscore_keys(data) == {
+        "is_circular": False,
+        "annotations": [{"start": 1, "extra_info": {"some_key": 1}}],
+        "translations": [[{"amino_acids": "M"}]],
+    }
+
+
+def test_un_underscore_keys_nested():
+    data = {
+        "entity_id": "1",
+        "schema": {"schema_id": "2"},
+        "items": [{"is_multi": 1}],
+    }
+    assert utils.un_underscore_keys(data) == {
+        "entityId": "1",
+        "schema": {"schemaId": "2"},
+        "items": [{"isMulti": 1}],
+    }
+
+
+def test_opaque_keys_untouched():
+    data = {"customFields": {"Plasmid Marker": {"isMulti": False}}}
+    result = utils.underscore_keys(data)
+    assert result == {"custom_fields": {"Plasmid Marker": {"isMulti": False}}}
+    assert utils.un_underscore_keys(result) == data
+
+
+def test_transform_keys_does_not_copy_unchanged():
+    data = {"id": "1", "annotations": [{"start": 1}], "bases": {"end": 2}}
+    assert utils.underscore_keys(data) is data
+    data["isCircular"] = True
+    result = utils.underscore_keys(data)
+    assert result is not data
+    assert result["annotations"] is data["annotations"]
+    assert list(result) == ["id", "annotations", "bases", "is_circular"]
+
+
+def test_transform_keys_deep_nesting():
+    data = {}
+    for _ in range(5000):
+        data = {"nestedKey": [data]}
+    result = utils.underscore_keys(data)
+    for _ in range(5000):
+        result = result["nested_key"][0]
+    assert result == {}